@@ -0,0 +1,103 @@
+"""이벤트 루프 비교 벤치마크: 가짜 소스로 메시지 파이프라인을 돌려 처리량과 루프 지연을 잰다.
+
+AutoReadCog.on_message → (가짜) edge-tts 스트리밍 → AudioManager 큐 → (가짜) 재생 스레드
+경로를 asyncio 기본 루프와 uvloop(설치된 경우)에서 같은 부하로 실행한다.
+
+사용법: python -m benchmarks.bench_event_loop [--messages 2000] [--guilds 20] [--json out.json]
+"""
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.common import make_parser, report, summarize
+from benchmarks.fakes import (
+    FakeGuild, FakeTTSEngine, FakeVoiceClient,
+    make_bot, make_message, patched_ffmpeg, sample_loop_lag,
+)
+from cogs.auto_read_cog import AutoReadCog
+from services import event_loop
+
+
+async def _drive(messages: int, guilds: int, burst: int, seed: int) -> dict:
+    loop = asyncio.get_running_loop()
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        # 루프 오버헤드를 재는 벤치마크이므로 합성 동시 수는 제한하지 않는다
+        bot = make_bot(Path(tmp), FakeTTSEngine(), synth_concurrency=messages)
+        cog = AutoReadCog(bot)
+
+        voice_clients = []
+        guild_objs = []
+        for guild_id in range(1, guilds + 1):
+            voice_client = FakeVoiceClient(loop)
+            voice_clients.append(voice_client)
+            guild_objs.append(FakeGuild(id=guild_id, voice_client=voice_client))
+            bot.user_settings.add_auto_read_channel(guild_id, guild_id * 100)
+
+        lag: list[float] = []
+        lag_task = asyncio.create_task(sample_loop_lag(lag))
+
+        started = time.perf_counter()
+        handlers = []
+        for i in range(messages):
+            guild = rng.choice(guild_objs)
+            message = make_message(guild, guild.id * 100, rng.randint(1, 500), f"메시지 {i} 테스트 문장입니다")
+            # discord.py처럼 리스너마다 태스크를 만든다
+            handlers.append(asyncio.create_task(cog.on_message(message)))
+            if (i + 1) % burst == 0:
+                await asyncio.sleep(0)
+        await asyncio.gather(*handlers)
+        while sum(vc.played for vc in voice_clients) < messages:
+            await asyncio.sleep(0.005)
+        elapsed = time.perf_counter() - started
+
+        lag_task.cancel()
+        bot.user_settings.close()
+
+    return {
+        "elapsed": elapsed,
+        "lag": lag,
+        "bytes": sum(vc.bytes_read for vc in voice_clients),
+    }
+
+
+def main() -> None:
+    parser = make_parser(__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--guilds", type=int, default=20)
+    parser.add_argument("--burst", type=int, default=50, help="루프에 양보하기 전에 보내는 메시지 수")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    loops = ["asyncio"]
+    if event_loop.resolve_loop("uvloop") == "uvloop":
+        loops.append("uvloop")
+
+    results = {}
+    with patched_ffmpeg():
+        for name in loops:
+            throughput = []
+            lag: list[float] = []
+            for round_ in range(args.rounds):
+                run = event_loop.run(
+                    _drive(args.messages, args.guilds, args.burst, seed=round_), loop=name,
+                )
+                throughput.append(args.messages / run["elapsed"])
+                lag.extend(run["lag"])
+            results[f"{name}: throughput"] = {
+                "msgs_per_s_mean": round(sum(throughput) / len(throughput), 1),
+                "msgs_per_s_min": round(min(throughput), 1),
+            }
+            results[f"{name}: loop lag"] = summarize(lag)
+
+    report(
+        f"event loop comparison ({args.messages} messages, {args.guilds} guilds, {args.rounds} rounds)",
+        results,
+        args.json,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""메시지당 핫패스 마이크로벤치마크: AudioCache, 캐시 키, 정규화 단계별, 전처리, 사용자 설정.
+
+모든 수치는 연산 1회당 시간이며, --json으로 저장한 결과를 커밋 간에 비교한다.
+
+사용법: python -m benchmarks.bench_hotpaths [--rounds 50] [--sizes 100,1000,10000]
+        [--corpus 파일] [--json out.json]
+"""
+import random
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+from benchmarks.bench_preprocess import make_messages
+from benchmarks.common import CORPUS_FILE, load_corpus, make_parser, report, summarize, time_per_item
+from cogs.auto_read_cog import AutoReadCog
+from config import DEFAULT_PITCH, DEFAULT_RATE, DEFAULT_VOICE
+from services.tts_engine import AudioCache, TTSEngine
+from services.user_settings import UserSettings
+
+# 일반적인 edge-tts 클립 크기 (약 2초 분량)
+_CLIP = b"\xff" * 12_000
+
+
+def _cache_cases(size: int, texts: list[str], rounds: int) -> dict:
+    """size개로 가득 찬 캐시에서 hit / miss / put(축출 포함) / replace를 잰다."""
+    cache = AudioCache(max_size=size, max_bytes=size * len(_CLIP))
+    keys = [(f"{texts[i % len(texts)]} {i}", DEFAULT_VOICE, DEFAULT_RATE, DEFAULT_PITCH) for i in range(size)]
+    for key in keys:
+        cache.put(*key, _CLIP)
+
+    rng = random.Random(size)
+    hits = rng.sample(keys, min(len(keys), 1000))
+    misses = [(f"miss {i}", DEFAULT_VOICE, DEFAULT_RATE, DEFAULT_PITCH) for i in range(1000)]
+
+    fresh = iter(range(10**9))
+
+    def _put_new(_) -> None:
+        # 가득 찬 캐시에 새 항목을 넣으면 매번 가장 오래된 항목 1개가 축출된다
+        cache.put(f"new {next(fresh)}", DEFAULT_VOICE, DEFAULT_RATE, DEFAULT_PITCH, _CLIP)
+
+    results = {
+        f"AudioCache.get hit (size={size})": time_per_item(lambda k: cache.get(*k), hits, rounds),
+        f"AudioCache.get miss (size={size})": time_per_item(lambda k: cache.get(*k), misses, rounds),
+        f"AudioCache.put + evict (size={size})": time_per_item(_put_new, misses, rounds),
+    }
+    live = ("live", DEFAULT_VOICE, DEFAULT_RATE, DEFAULT_PITCH)
+    cache.put(*live, _CLIP)
+    results[f"AudioCache.replace (size={size})"] = time_per_item(
+        lambda _: cache.replace(*live, _CLIP), range(1000), rounds,
+    )
+
+    # 바이트 한도로 여러 항목을 한 번에 축출하는 경우 (큰 클립 1개 → 작은 클립 여러 개 축출)
+    small = AudioCache(max_size=size * 10, max_bytes=size * 1000)
+    big = b"\xff" * 10_000
+    counter = iter(range(10**9))
+
+    def _put_big(_) -> None:
+        for _ in range(10):
+            small.put(f"small {next(counter)}", DEFAULT_VOICE, DEFAULT_RATE, DEFAULT_PITCH, b"\xff" * 1000)
+        small.put(f"big {next(counter)}", DEFAULT_VOICE, DEFAULT_RATE, DEFAULT_PITCH, big)
+
+    results[f"AudioCache byte-limit evict, 10 small + 1 big (size={size})"] = time_per_item(
+        _put_big, range(100), rounds,
+    )
+    return results
+
+
+def main() -> None:
+    parser = make_parser(__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--sizes", default="100,1000,10000", help="AudioCache 항목 수 (쉼표로 구분)")
+    parser.add_argument("--corpus", type=Path, default=CORPUS_FILE, help="한 줄에 메시지 하나인 말뭉치")
+    args = parser.parse_args()
+
+    lines = load_corpus(args.corpus)
+    messages = make_messages(lines)
+    cog = AutoReadCog(SimpleNamespace())
+    engine = TTSEngine()
+    texts = [s.text for s in (cog._preprocess_message(m) for m in messages) if s]
+    rounds = args.rounds
+
+    samples: dict[str, list[float]] = {}
+
+    # 캐시 키 해시
+    samples["AudioCache.make_key"] = time_per_item(
+        lambda t: AudioCache.make_key(t, DEFAULT_VOICE, DEFAULT_RATE, DEFAULT_PITCH), texts, rounds,
+    )
+    for size in (int(s) for s in args.sizes.split(",")):
+        samples.update(_cache_cases(size, texts, rounds))
+
+    # 정규화 단계별 (각 단계 입력은 실제 파이프라인에서 그 단계에 도달하는 텍스트)
+    punct = [engine._convert_standalone_punctuation(t) for t in texts]
+    jamo = [engine._normalize_repeated_jamo(t) for t in punct]
+    abbr = [engine._apply_korean_abbreviations(t) for t in jamo]
+    samples["normalize: standalone punctuation"] = time_per_item(engine._convert_standalone_punctuation, texts, rounds)
+    samples["normalize: repeated jamo"] = time_per_item(engine._normalize_repeated_jamo, punct, rounds)
+    samples["normalize: abbreviations"] = time_per_item(engine._apply_korean_abbreviations, jamo, rounds)
+    samples["normalize: jamo sequences"] = time_per_item(engine._convert_jamo_sequences, abbr, rounds)
+    samples["TTSEngine.normalize_text (all stages)"] = time_per_item(engine.normalize_text, texts, rounds)
+
+    samples["AutoReadCog._preprocess_message"] = time_per_item(cog._preprocess_message, messages, rounds)
+
+    # 사용자 설정 조회/저장
+    with tempfile.TemporaryDirectory() as tmp:
+        settings = UserSettings(data_dir=Path(tmp))
+        user_ids = list(range(1, 10_001))
+        for user_id in user_ids[::2]:
+            settings.set_user_voice(user_id, rate="+10%")
+        for guild_id in range(1, 1001):
+            settings.add_auto_read_channel(guild_id, guild_id * 100)
+        sample_users = random.Random(0).sample(user_ids, 1000)
+        channels = [guild_id * 100 + (guild_id % 2) for guild_id in range(1, 1001)]
+
+        samples["UserSettings.get_user_profile"] = time_per_item(settings.get_user_profile, sample_users, rounds)
+        samples["UserSettings.get_user_settings"] = time_per_item(settings.get_user_settings, sample_users, rounds)
+        samples["UserSettings.get_channel_route"] = time_per_item(settings.get_channel_route, channels, rounds)
+        samples["UserSettings.set_user_voice (save)"] = time_per_item(
+            lambda u: settings.set_user_voice(u, pitch="+5Hz"), sample_users, rounds,
+        )
+        settings.close()
+
+    report(
+        f"per-message hot paths ({len(lines)} corpus lines, per op)",
+        {name: summarize(s, unit="us") for name, s in samples.items()},
+        args.json,
+    )
+
+
+if __name__ == "__main__":
+    main()
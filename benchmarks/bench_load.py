@@ -0,0 +1,226 @@
+"""오프라인 부하 테스트: 가짜 디스코드/edge-tts/gTTS/GPT-SoVITS로 전체 파이프라인 처리량을 잰다.
+
+N개 서버에 포아송 도착 과정으로 메시지를 보내 AutoReadCog.on_message부터
+실제 TTSEngine(캐시, 폴백 포함), AudioManager 큐, 실시간으로 소비하는 가짜 음성 클라이언트까지
+돌린다. 처리량, 큐 대기/종단 지연 백분위수, 메모리 사용량을 보고한다.
+
+--hot-share를 주면 그 비율의 메시지를 1번 서버 한 곳에 몰아, 도배 중인 서버와 나머지 서버의
+종단 지연을 따로 보고한다 (합성 스케줄러 공정성 확인용).
+
+사용법: python -m benchmarks.bench_load [--guilds 50] [--rate 15] [--duration 20]
+        [--hot-share 0.5] [--json out.json]
+"""
+import asyncio
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from unittest import mock
+
+from benchmarks.common import load_corpus, make_parser, report, summarize
+from benchmarks.fakes import (
+    EDGE_BYTES_PER_SECOND, FakeGuild, FakeUpstream, FakeVoiceClient, SoVITSStandIn,
+    make_bot, make_message, patched_engines, patched_ffmpeg, sample_loop_lag,
+)
+from cogs.auto_read_cog import AutoReadCog
+from services import event_loop
+from services.tts_engine import TTSEngine
+
+_SOVITS_CHARACTER = "bench"
+
+
+def _max_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+async def _run(args) -> dict:
+    loop = asyncio.get_running_loop()
+    rng = random.Random(args.seed)
+    corpus = load_corpus()
+
+    edge = FakeUpstream(args.edge_latency, args.failure_rate, seed=args.seed)
+    gtts = FakeUpstream(args.gtts_latency, args.failure_rate, seed=args.seed + 1)
+    sovits = SoVITSStandIn(FakeUpstream(args.sovits_latency, args.failure_rate, seed=args.seed + 2))
+    sovits_url = await sovits.start()
+
+    # 종료 시 캐시 스냅샷은 임시 디렉토리에 쓴다 (가짜 오디오가 실제 data/audio_cache를 덮어쓰지 않게)
+    with tempfile.TemporaryDirectory() as tmp, \
+            mock.patch("services.sovits_client.SOVITS_API_URL", sovits_url), \
+            mock.patch("services.tts_engine.AUDIO_CACHE_SNAPSHOT_DIR", Path(tmp) / "audio_cache"), \
+            patched_engines(edge, gtts):
+        engine = TTSEngine()
+        engine._postprocessor = None  # FFmpeg 후처리는 부하 테스트 대상이 아님
+        engine.sovits_client._characters = {
+            _SOVITS_CHARACTER: {"refer_wav_path": "ref.wav", "prompt_text": "테스트"},
+        }
+        bot = make_bot(Path(tmp), engine)
+        cog = AutoReadCog(bot)
+
+        # 사용자 음성 분포: 대부분 edge-tts, 일부 gTTS / GPT-SoVITS
+        users_per_guild = args.users
+        for user_id in range(1, args.guilds * users_per_guild + 1):
+            roll = rng.random()
+            if roll < args.gtts_users:
+                bot.user_settings.set_user_voice(user_id, voice="gtts:ko")
+            elif roll < args.gtts_users + args.sovits_users:
+                bot.user_settings.set_user_voice(user_id, voice=f"sovits:{_SOVITS_CHARACTER}")
+
+        dispatched_at: dict[int, float] = {}
+        queue_wait: list[float] = []
+        end_to_end: list[float] = []
+        end_to_end_hot: list[float] = []
+        voice_clients: list[FakeVoiceClient] = []
+        guilds: list[FakeGuild] = []
+
+        def _on_play(guild_id: int):
+            def _record() -> None:
+                item = bot.audio_manager.queues[guild_id].current
+                now = time.perf_counter()
+                queue_wait.append(now - item.enqueued_at)
+                started = dispatched_at.pop(item.message_id, None)
+                if started is not None:
+                    (end_to_end_hot if guild_id == 1 else end_to_end).append(now - started)
+            return _record
+
+        for guild_id in range(1, args.guilds + 1):
+            voice_client = FakeVoiceClient(
+                loop,
+                bytes_per_second=None if args.fast_playback else EDGE_BYTES_PER_SECOND,
+                on_play=_on_play(guild_id),
+            )
+            voice_clients.append(voice_client)
+            guilds.append(FakeGuild(id=guild_id, voice_client=voice_client))
+            bot.user_settings.add_auto_read_channel(guild_id, guild_id * 100)
+
+        if args.tracemalloc:
+            tracemalloc.start()
+        lag: list[float] = []
+        lag_task = asyncio.create_task(sample_loop_lag(lag))
+
+        handlers: set[asyncio.Task] = set()
+        sent = 0
+        started = time.perf_counter()
+        deadline = started + args.duration
+        while time.perf_counter() < deadline:
+            await asyncio.sleep(rng.expovariate(args.rate))
+            if args.hot_share > 0:
+                guild = guilds[0] if rng.random() < args.hot_share else rng.choice(guilds[1:])
+            else:
+                guild = rng.choice(guilds)
+            user_id = (guild.id - 1) * users_per_guild + rng.randint(1, users_per_guild)
+            message = make_message(guild, guild.id * 100, user_id, rng.choice(corpus))
+            dispatched_at[message.id] = time.perf_counter()
+            # discord.py처럼 리스너마다 태스크를 만든다
+            task = asyncio.create_task(cog.on_message(message))
+            handlers.add(task)
+            task.add_done_callback(handlers.discard)
+            sent += 1
+        send_elapsed = time.perf_counter() - started
+
+        # 남은 처리와 재생이 끝날 때까지 기다린다
+        await asyncio.gather(*handlers)
+        drain_deadline = time.perf_counter() + args.drain_timeout
+        while time.perf_counter() < drain_deadline and (
+            any(q.is_playing or len(q) for q in bot.audio_manager.queues.values())
+        ):
+            await asyncio.sleep(0.05)
+        total_elapsed = time.perf_counter() - started
+
+        lag_task.cancel()
+        traced_peak = tracemalloc.get_traced_memory()[1] if args.tracemalloc else None
+        if args.tracemalloc:
+            tracemalloc.stop()
+
+        played = sum(vc.played for vc in voice_clients)
+        stats = engine.stats
+        await engine.cleanup_all_async()
+        bot.user_settings.close()
+    await sovits.close()
+
+    if args.hot_share > 0:
+        end_to_end_rows = {
+            "end to end, other guilds": summarize(end_to_end),
+            "end to end, hot guild": summarize(end_to_end_hot),
+        }
+    else:
+        end_to_end_rows = {"end to end (message -> play)": summarize(end_to_end + end_to_end_hot)}
+
+    results = {
+        "throughput": {
+            "sent": sent,
+            "played": played,
+            "offered_msgs_per_s": round(sent / send_elapsed, 1),
+            "played_msgs_per_s": round(played / total_elapsed, 1),
+            "unplayed": len(dispatched_at),
+        },
+        "queue wait (enqueue -> play)": summarize(queue_wait),
+        **end_to_end_rows,
+        "event loop lag": summarize(lag),
+        "synthesis slots": {
+            f"{name}_{key}": value
+            for name, slots in bot.synthesis_scheduler.engines.items()
+            for key, value in (
+                ("granted", slots.granted),
+                ("mean_wait_ms", round(slots.wait_sum / max(slots.granted, 1) * 1000, 1)),
+            )
+        },
+        "upstream": {
+            "edge_requests": stats["edge"].requests,
+            "gtts_requests": stats["gtts"].requests,
+            "sovits_requests": stats["sovits"].requests,
+            "errors": sum(s.errors for s in stats.values()),
+            "cache_hits": engine._cache.hits,
+        },
+        "executors": {
+            f"{name}_{key}": value
+            for name, executor in engine.executors.items()
+            for key, value in (
+                ("completed", executor.completed),
+                ("rejected", executor.rejected),
+                ("mean_wait_ms", round(executor.queue_wait_sum / max(executor.completed, 1) * 1000, 1)),
+            )
+        },
+        "memory": {"max_rss_mb": round(_max_rss_mb(), 1)},
+    }
+    if traced_peak is not None:
+        results["memory"]["python_peak_mb"] = round(traced_peak / (1024 * 1024), 1)
+    return results
+
+
+def main() -> None:
+    parser = make_parser(__doc__.splitlines()[0])
+    parser.add_argument("--guilds", type=int, default=50)
+    parser.add_argument("--users", type=int, default=20, help="서버당 사용자 수")
+    parser.add_argument("--rate", type=float, default=15.0, help="전체 메시지 도착률 (msgs/s)")
+    parser.add_argument("--duration", type=float, default=20.0, help="메시지를 보내는 시간 (초)")
+    parser.add_argument("--drain-timeout", type=float, default=60.0, help="보낸 뒤 재생 완료를 기다리는 최대 시간 (초)")
+    parser.add_argument("--edge-latency", type=float, default=0.25, help="edge-tts 첫 청크까지 평균 지연 (초)")
+    parser.add_argument("--gtts-latency", type=float, default=0.6)
+    parser.add_argument("--sovits-latency", type=float, default=1.0)
+    parser.add_argument("--failure-rate", type=float, default=0.02, help="업스트림 요청 실패 확률")
+    parser.add_argument("--gtts-users", type=float, default=0.1, help="gTTS를 쓰는 사용자 비율")
+    parser.add_argument("--sovits-users", type=float, default=0.1, help="GPT-SoVITS를 쓰는 사용자 비율")
+    parser.add_argument("--hot-share", type=float, default=0.0, help="1번 서버 한 곳에 몰리는 메시지 비율")
+    parser.add_argument("--fast-playback", action="store_true", help="실시간 대신 최대한 빨리 재생 소비")
+    parser.add_argument("--tracemalloc", action="store_true", help="Python 할당 최대치도 측정 (처리량이 낮아짐)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--loop", default="asyncio", help="asyncio | uvloop")
+    args = parser.parse_args()
+
+    with patched_ffmpeg():
+        results = event_loop.run(_run(args), loop=args.loop)
+
+    report(
+        f"load test ({args.guilds} guilds, {args.rate} msgs/s for {args.duration}s, loop={args.loop})",
+        results,
+        args.json,
+    )
+
+
+if __name__ == "__main__":
+    main()
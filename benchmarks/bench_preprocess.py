@@ -0,0 +1,117 @@
+"""메시지 전처리 + TTS 정규화 벤치마크 (기존 다중 정규식 패스 vs 단일 패스 스캐너).
+
+단계별 수치와 함께, 실제 경로처럼 스캔 결과(자모 포함 여부)를 정규화에 넘기는
+전처리 → 정규화 전체 비용을 비교한다.
+
+사용법: python -m benchmarks.bench_preprocess [--rounds 200] [--json out.json]
+"""
+import re
+from types import SimpleNamespace
+
+from benchmarks.common import load_corpus, make_parser, report, summarize, time_per_item
+from cogs.auto_read_cog import AutoReadCog
+from services.tts_engine import TTSEngine
+
+# --- 기존 구현 (비교 기준) ---
+
+_USER_MENTION_RE = re.compile(r"<@!?(\d+)>")
+_CUSTOM_EMOJI_RE = re.compile(r"<a?:\w+:\d+>")
+_UNICODE_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"
+    "\U0001F300-\U0001F5FF"
+    "\U0001F680-\U0001F6FF"
+    "\U0001F1E0-\U0001F1FF"
+    "\U0001F900-\U0001F9FF"
+    "\U0001FA00-\U0001FAFF"
+    "\U00002600-\U000027BF"
+    "\U0000FE00-\U0000FE0F"
+    "\U0000200D"
+    "\U000020E3"
+    "]+",
+)
+
+
+def _legacy_preprocess(message) -> str | None:
+    text = message.content.strip()
+
+    def _replace_mention(m: re.Match) -> str:
+        member = message.guild.get_member(int(m.group(1)))
+        return member.display_name if member else "알 수 없는 사용자"
+
+    text = _USER_MENTION_RE.sub(_replace_mention, text)
+    had_emoji = bool(_CUSTOM_EMOJI_RE.search(text) or _UNICODE_EMOJI_RE.search(text))
+    text = _CUSTOM_EMOJI_RE.sub("", text)
+    text = _UNICODE_EMOJI_RE.sub("", text)
+    text = text.strip()
+    if not text:
+        return "이모지를 보냈어요" if had_emoji else None
+    if text.startswith("/"):
+        return None
+    return text
+
+
+def _legacy_pipeline(engine: TTSEngine, message) -> str | None:
+    text = _legacy_preprocess(message)
+    return _legacy_normalize(engine, text) if text else None
+
+
+def _legacy_normalize(engine: TTSEngine, text: str) -> str:
+    text = engine._convert_standalone_punctuation(text)
+    text = engine._normalize_repeated_jamo(text)
+    text = engine._apply_korean_abbreviations(text)
+    return engine._convert_jamo_sequences(text)
+
+
+def make_messages(lines: list[str]) -> list:
+    members = {
+        284242213351849985: SimpleNamespace(display_name="판구리장인"),
+        700274340503093321: SimpleNamespace(display_name="철수😀"),
+    }
+    guild = SimpleNamespace(get_member=members.get)
+    return [SimpleNamespace(content=line, guild=guild, attachments=[]) for line in lines]
+
+
+def main() -> None:
+    parser = make_parser(__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    messages = make_messages(load_corpus())
+    cog = AutoReadCog(SimpleNamespace())
+    engine = TTSEngine()
+
+    def _pipeline(message) -> str | None:
+        scanned = cog._preprocess_message(message)
+        return engine.normalize_text(scanned.text, scanned.has_jamo) if scanned else None
+
+    # 결과가 기존 구현과 같은지 먼저 확인한다
+    for m in messages:
+        legacy, scanned = _legacy_preprocess(m), cog._preprocess_message(m)
+        fused = scanned.text if scanned else None
+        assert legacy == fused, (m.content, legacy, fused)
+        if fused:
+            assert _legacy_normalize(engine, fused) == engine.normalize_text(fused), fused
+            assert _legacy_normalize(engine, fused) == engine.normalize_text(fused, scanned.has_jamo), fused
+
+    texts = [s.text for s in (cog._preprocess_message(m) for m in messages) if s]
+
+    def _per_line(fn, items) -> list[float]:
+        return time_per_item(fn, items, args.rounds)
+
+    report(
+        f"message preprocessing ({len(messages)} corpus lines, per line)",
+        {
+            "legacy _preprocess_message (5 passes)": summarize(_per_line(_legacy_preprocess, messages), unit="us"),
+            "fused scan_message": summarize(_per_line(cog._preprocess_message, messages), unit="us"),
+            "legacy engine normalization": summarize(_per_line(lambda t: _legacy_normalize(engine, t), texts), unit="us"),
+            "TTSEngine.normalize_text": summarize(_per_line(engine.normalize_text, texts), unit="us"),
+            "legacy preprocess -> normalize": summarize(_per_line(lambda m: _legacy_pipeline(engine, m), messages), unit="us"),
+            "scan_message -> normalize_text(has_jamo)": summarize(_per_line(_pipeline, messages), unit="us"),
+        },
+        args.json,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""on_message 거절 경로 마이크로벤치마크: 관련 없는 채널의 메시지를 버리는 비용.
+
+사용법: python -m benchmarks.bench_routing [--guilds 1000] [--json out.json]
+"""
+import random
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from benchmarks.common import make_parser, report, summarize
+from cogs.auto_read_cog import AutoReadCog
+from services.user_settings import UserSettings
+
+
+def _legacy_is_routed(auto_read: dict, designated: dict, guild_id: int, channel_id: int) -> bool:
+    """기존 구현: 서버 ID 문자열 변환 후 리스트 멤버십 검사를 두 번 수행."""
+    guild_key = str(guild_id)
+    is_auto_read = guild_key in auto_read and channel_id in auto_read[guild_key]
+    is_designated = guild_key in designated and channel_id in designated[guild_key]
+    return is_auto_read or is_designated
+
+
+def _run_listener(cog: AutoReadCog, message) -> None:
+    """거절 경로는 await 없이 끝나므로 코루틴을 한 번만 진행시킨다."""
+    coro = cog.on_message(message)
+    try:
+        coro.send(None)
+    except StopIteration:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError("거절 경로가 아닌 메시지입니다")
+
+
+def main() -> None:
+    parser = make_parser(__doc__.splitlines()[0])
+    parser.add_argument("--guilds", type=int, default=1000)
+    parser.add_argument("--messages", type=int, default=200_000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as tmp:
+        settings = UserSettings(data_dir=Path(tmp))
+        for guild_id in range(1, args.guilds + 1):
+            # 서버마다 자동읽기 채널 3개, 지정채널 1개
+            for i in range(3):
+                settings.add_auto_read_channel(guild_id, guild_id * 100 + i)
+            settings.add_designated_channel(guild_id, guild_id * 100 + 9)
+
+        cog = AutoReadCog(SimpleNamespace(user_settings=settings))
+        author = SimpleNamespace(bot=False, id=1)
+        messages = []
+        for _ in range(1000):
+            guild_id = rng.randint(1, args.guilds)
+            messages.append(SimpleNamespace(
+                author=author,
+                guild=SimpleNamespace(id=guild_id),
+                channel=SimpleNamespace(id=guild_id * 100 + 50),  # 관련 없는 채널
+            ))
+
+        auto_read = settings._auto_read_channels
+        designated = settings._designated_channels
+        batches = args.messages // len(messages)
+
+        def _batch_samples(fn) -> list[float]:
+            samples = []
+            for _ in range(batches):
+                start = time.perf_counter()
+                for m in messages:
+                    fn(m)
+                samples.append((time.perf_counter() - start) / len(messages))
+            return samples
+
+        legacy = _batch_samples(
+            lambda m: _legacy_is_routed(auto_read, designated, m.guild.id, m.channel.id)
+        )
+        indexed = _batch_samples(lambda m: settings.get_channel_route(m.channel.id))
+        listener = _batch_samples(lambda m: _run_listener(cog, m))
+        settings.close()
+
+    report(
+        f"on_message rejection path ({args.guilds} guilds, per message)",
+        {
+            "legacy str(guild)+list lookups": summarize(legacy, unit="us"),
+            "routing index lookup": summarize(indexed, unit="us"),
+            "AutoReadCog.on_message (reject)": summarize(listener, unit="us"),
+        },
+        args.json,
+    )
+
+
+if __name__ == "__main__":
+    main()
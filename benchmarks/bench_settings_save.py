@@ -0,0 +1,92 @@
+"""설정 저장 지연시간 비교: 전체 JSON 재작성 vs SQLite 행 단위 upsert vs write-behind.
+
+사용법: python -m benchmarks.bench_settings_save [--users 100000] [--json out.json]
+"""
+import json
+import random
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import make_parser, report, summarize, time_calls
+from services.settings_store import SettingsStore, WriteBehindWriter
+
+VOICES = ["ko-KR-SunHiNeural", "ko-KR-InJoonNeural", "ko-KR-HyunsuMultilingualNeural", "gtts:ko"]
+RATES = ["-25%", "+0%", "+25%", "+50%"]
+
+
+def _make_users(count: int) -> dict[str, dict]:
+    rng = random.Random(42)
+    return {
+        str(10**17 + i): {
+            "language": "ko",
+            "slow": False,
+            "voice": rng.choice(VOICES),
+            "rate": rng.choice(RATES),
+            "pitch": "+0Hz",
+            "effect": "none",
+        }
+        for i in range(count)
+    }
+
+
+def main() -> None:
+    parser = make_parser(__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100_000)
+    args = parser.parse_args()
+    users_count = args.users
+
+    users = _make_users(users_count)
+    user_ids = list(users)
+    rng = random.Random(7)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        json_file = tmp_dir / "user_settings.json"
+
+        def _json_save():
+            users[rng.choice(user_ids)]["rate"] = rng.choice(RATES)
+            with open(json_file, "w", encoding="utf-8") as f:
+                json.dump(users, f, ensure_ascii=False, indent=2)
+
+        json_samples = time_calls(_json_save, repeat=20)
+
+        store = SettingsStore(tmp_dir / "settings.db")
+        migrate_samples = time_calls(
+            lambda: store.migrate_from_json(json_file, tmp_dir / "none.json", tmp_dir / "none.json"),
+            repeat=1,
+        )
+
+        def _sqlite_save():
+            user_id = rng.choice(user_ids)
+            users[user_id]["rate"] = rng.choice(RATES)
+            store.upsert_user(user_id, users[user_id])
+
+        sqlite_samples = time_calls(_sqlite_save, repeat=2000)
+
+        # 이벤트 루프가 실제로 부담하는 비용: dirty 표시만 하고 기록은 워커 스레드가 한다
+        writer = WriteBehindWriter(store)
+
+        def _write_behind_save():
+            user_id = rng.choice(user_ids)
+            users[user_id]["rate"] = rng.choice(RATES)
+            writer.mark_user(user_id, users[user_id])
+
+        write_behind_samples = time_calls(_write_behind_save, repeat=2000)
+        flush_samples = time_calls(writer.close, repeat=1)
+        store.close()
+
+    report(
+        f"settings save latency ({users_count} users)",
+        {
+            "json full rewrite (old)": summarize(json_samples),
+            "sqlite row upsert": summarize(sqlite_samples),
+            "write-behind mark (event loop)": summarize(write_behind_samples),
+            "write-behind flush (worker, batch)": summarize(flush_samples),
+            "json -> sqlite migration": summarize(migrate_samples),
+        },
+        args.json,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""콜드 스타트 벤치마크: 모듈 import 시간과 (디스코드 연결 전) 준비 시간.
+
+매 회차마다 새 인터프리터를 띄워 측정한다. 실제 on_ready까지의 시간은
+봇 로그의 "준비 완료까지 N초" 항목으로 확인한다.
+봇은 회차마다 새 임시 DATA_DIR에서 실행하므로 실제 data/의 설정 DB와 캐시 스냅샷은 건드리지 않는다.
+
+사용법: python -m benchmarks.bench_startup [--runs 10] [--json out.json]
+"""
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.common import make_parser, report, summarize
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# import 시간을 따로 보고할 모듈
+_TRACKED_MODULES = ("discord", "aiohttp", "edge_tts", "gtts", "config", "services", "bot")
+
+_IMPORTTIME_RE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)")
+
+# 봇을 만들고 setup_hook(Cog 로드)까지 실행한 뒤 bot import 이후 걸린 시간을 출력한다
+_READY_SCRIPT = """
+import asyncio, time
+import bot
+
+async def _main():
+    b = bot.TTSBot()
+    await b.setup_hook()
+    print(f"READY {time.perf_counter() - bot._STARTED:.6f}")
+    b.user_settings.close()
+
+asyncio.run(_main())
+"""
+
+
+def _run(args: list[str], env: dict) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], cwd=ROOT, env=env,
+        capture_output=True, text=True, check=True,
+    )
+
+
+def _module_import_times(env: dict) -> dict[str, float]:
+    """-X importtime 출력에서 추적 대상 모듈의 누적 import 시간(초)을 읽는다."""
+    result = _run(["-X", "importtime", "-c", "import bot"], env)
+    times: dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        m = _IMPORTTIME_RE.match(line)
+        if m and m.group(3) in _TRACKED_MODULES:
+            # 같은 모듈이 여러 번 나오지 않으므로 처음 값이 곧 누적 시간
+            times.setdefault(m.group(3), int(m.group(1)) / 1e6)
+    return times
+
+
+def main() -> None:
+    parser = make_parser(__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    env = {**os.environ, "METRICS_ENABLED": "false", "PYTHONDONTWRITEBYTECODE": "1"}
+
+    interpreter: list[float] = []
+    import_bot: list[float] = []
+    ready: list[float] = []
+    modules: dict[str, list[float]] = {name: [] for name in _TRACKED_MODULES}
+
+    for _ in range(args.runs):
+        with tempfile.TemporaryDirectory(prefix="bench-startup-") as data_dir:
+            run_env = {
+                **env,
+                "DATA_DIR": data_dir,
+                "AUDIO_CACHE_SNAPSHOT_DIR": str(Path(data_dir) / "audio_cache"),
+            }
+
+            start = time.perf_counter()
+            _run(["-c", "pass"], run_env)
+            interpreter.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            _run(["-c", "import bot"], run_env)
+            import_bot.append(time.perf_counter() - start)
+
+            output = _run(["-c", _READY_SCRIPT], run_env).stdout
+            ready.append(float(output.split("READY ")[1].split()[0]))
+
+            for name, seconds in _module_import_times(run_env).items():
+                modules[name].append(seconds)
+
+    results = {
+        "interpreter startup (python -c pass)": summarize(interpreter),
+        "python -c 'import bot' (wall)": summarize(import_bot),
+        "bot imported -> setup_hook done": summarize(ready),
+    }
+    for name, samples in modules.items():
+        # 지연 로드되는 모듈은 import bot 시점에 나타나지 않는다
+        results[f"import {name} (cumulative)"] = (
+            summarize(samples) if samples else {"n": 0, "note": "not imported at startup"}
+        )
+
+    report(f"cold start ({args.runs} runs)", results, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+CORPUS_FILE = Path(__file__).parent / "corpus_ko.txt"
+
+
+def load_corpus(path: Path = CORPUS_FILE) -> list[str]:
+    """한국어 채팅 말뭉치(기본: benchmarks/corpus_ko.txt)를 줄 단위로 읽는다."""
+    return [line for line in path.read_text(encoding="utf-8").splitlines() if line]
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """정렬된 표본에서 최근접 순위 백분위수를 반환한다."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples: list[float], unit: str = "ms") -> dict:
+    """초 단위 표본을 밀리초(ms) 또는 마이크로초(us) 단위 요약으로 변환한다."""
+    scale = {"ms": 1e3, "us": 1e6}[unit]
+    return {
+        "n": len(samples),
+        f"mean_{unit}": round(statistics.fmean(samples) * scale, 4) if samples else 0.0,
+        f"p50_{unit}": round(percentile(samples, 50) * scale, 4),
+        f"p99_{unit}": round(percentile(samples, 99) * scale, 4),
+        f"max_{unit}": round(max(samples) * scale, 4) if samples else 0.0,
+    }
+
+
+def time_calls(fn: Callable[[], object], repeat: int) -> list[float]:
+    """fn을 repeat번 호출하며 호출별 소요 시간(초)을 측정한다."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def time_per_item(fn: Callable[[object], object], items: list, rounds: int) -> list[float]:
+    """items 전체에 fn을 적용하는 라운드를 반복하며 라운드별 항목당 평균 시간(초)을 측정한다."""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for item in items:
+            fn(item)
+        samples.append((time.perf_counter() - start) / len(items))
+    return samples
+
+
+def make_parser(description: str) -> argparse.ArgumentParser:
+    """공통 옵션(--json)이 포함된 인자 파서를 만든다."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--json", type=Path, help="결과를 JSON 파일로 저장")
+    return parser
+
+
+def report(name: str, results: dict, output: Path | None = None) -> None:
+    """결과를 표 형태로 출력하고, output이 주어지면 JSON으로 저장한다."""
+    print(f"== {name} ==")
+    for case, summary in results.items():
+        fields = "  ".join(f"{k}={v}" for k, v in summary.items())
+        print(f"{case:<40} {fields}")
+
+    if output:
+        payload = {
+            "benchmark": name,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "results": results,
+        }
+        output.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"결과 저장: {output}")
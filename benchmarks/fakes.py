@@ -0,0 +1,354 @@
+"""벤치마크용 가짜 디스코드 객체와 TTS 엔진.
+
+네트워크, 디스코드 게이트웨이, FFmpeg 없이 AutoReadCog → TTS → AudioManager → 재생
+파이프라인 전체를 이벤트 루프 위에서 돌리기 위한 최소 구현이다.
+"""
+import asyncio
+import itertools
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable
+from unittest import mock
+
+from config import SYNTH_CONCURRENCY
+from services.audio_manager import AudioManager
+from services.dedup import DuplicateSuppressor
+from services.rate_limiter import SynthesisRateLimiter
+from services.spool import SpoolingSource
+from services.synthesis_scheduler import SynthesisScheduler
+from services.tts_engine import SynthesisRequest
+from services.user_settings import UserSettings
+
+
+class FakeTTSEngine:
+    """edge-tts 스트리밍을 흉내 내는 엔진.
+
+    first_chunk_delay 뒤 첫 청크를 쓰고 소스를 반환하며, 나머지 청크는
+    chunk_interval 간격으로 백그라운드에서 스풀에 계속 쓴다.
+    """
+
+    def __init__(
+        self,
+        first_chunk_delay: float = 0.05,
+        chunks: int = 8,
+        chunk_size: int = 4096,
+        chunk_interval: float = 0.005,
+    ):
+        self.first_chunk_delay = first_chunk_delay
+        self.chunks = chunks
+        self.chunk_size = chunk_size
+        self.chunk_interval = chunk_interval
+        self.requests = 0
+        self._writers: set[asyncio.Task] = set()
+
+    async def _write_rest(self, spool: SpoolingSource) -> None:
+        chunk = b"\xff" * self.chunk_size
+        try:
+            for _ in range(self.chunks - 1):
+                await asyncio.sleep(self.chunk_interval)
+                spool.write(chunk)
+        finally:
+            spool.finish()
+
+    def prepare(self, text: str, lang="ko", slow=False, voice=None, rate=None, pitch=None, has_jamo=None):
+        # 항상 캐시 미스인 edge 요청
+        return SynthesisRequest(text, lang, slow, voice or "", rate or "", pitch or "", "edge", "", False)
+
+    async def synthesize(self, text: str, **kwargs) -> tuple[SpoolingSource, callable]:
+        return await self.synthesize_prepared(self.prepare(text, **kwargs))
+
+    async def synthesize_prepared(
+        self, request: SynthesisRequest, on_done: Callable[[], None] = lambda: None,
+    ) -> tuple[SpoolingSource, callable]:
+        self.requests += 1
+        try:
+            await asyncio.sleep(self.first_chunk_delay)
+        except asyncio.CancelledError:
+            on_done()
+            raise
+        spool = SpoolingSource()
+        spool.write(b"\xff" * self.chunk_size)
+        task = asyncio.create_task(self._write_rest(spool))
+        self._writers.add(task)
+        task.add_done_callback(self._writers.discard)
+        task.add_done_callback(lambda _: on_done())
+
+        def _cleanup() -> None:
+            task.cancel()
+            spool.close()
+
+        return spool, _cleanup
+
+
+class FakeVoiceClient:
+    """discord.VoiceClient 대역. 재생은 디스코드 AudioPlayer처럼 별도 스레드에서 소스를 끝까지 읽는다.
+
+    bytes_per_second를 주면 읽은 양만큼 실제 재생 시간을 기다린다 (None이면 최대한 빨리 읽음).
+    on_play는 재생 시작 직후 이벤트 루프 스레드에서 호출된다.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        channel=None,
+        bytes_per_second: float | None = None,
+        on_play: Callable[[], None] | None = None,
+    ):
+        self.loop = loop
+        self.channel = channel
+        self.bytes_per_second = bytes_per_second
+        self.on_play = on_play
+        self.played = 0
+        self.bytes_read = 0
+        self._playing = False
+        self._lock = threading.Lock()
+
+    def is_connected(self) -> bool:
+        return True
+
+    def is_playing(self) -> bool:
+        return self._playing
+
+    def play(self, source, after=None) -> None:
+        if self._playing:
+            raise RuntimeError("이미 재생 중")
+        self._playing = True
+        if self.on_play is not None:
+            self.on_play()
+
+        def _player() -> None:
+            total = 0
+            started = time.perf_counter()
+            while True:
+                data = source.read(8192)
+                if not data:
+                    break
+                total += len(data)
+                if self.bytes_per_second:
+                    # 실제 재생 속도에 맞춰 소비한다
+                    ahead = started + total / self.bytes_per_second - time.perf_counter()
+                    if ahead > 0:
+                        time.sleep(ahead)
+            with self._lock:
+                self.played += 1
+                self.bytes_read += total
+            self._playing = False
+            if after is not None:
+                after(None)
+
+        threading.Thread(target=_player, daemon=True).start()
+
+    def stop(self) -> None:
+        pass
+
+    async def disconnect(self, *, force: bool = False) -> None:
+        pass
+
+
+class _PassthroughAudio:
+    """FFmpegOpusAudio 대역: FFmpeg을 띄우지 않고 원본 소스를 그대로 넘긴다."""
+
+    def __new__(cls, source, *args, **kwargs):
+        return source
+
+
+@contextmanager
+def patched_ffmpeg():
+    """AudioManager가 FFmpeg 프로세스 대신 원본 소스를 가짜 음성 클라이언트에 넘기게 한다."""
+    with mock.patch("discord.FFmpegOpusAudio", _PassthroughAudio):
+        yield
+
+
+class FakeGuild(SimpleNamespace):
+    def get_member(self, user_id: int):
+        return None
+
+
+_message_ids = itertools.count(1)
+
+
+def make_message(guild: FakeGuild, channel_id: int, user_id: int, content: str) -> SimpleNamespace:
+    """AutoReadCog.on_message가 읽는 속성만 가진 메시지."""
+    return SimpleNamespace(
+        id=next(_message_ids),
+        author=SimpleNamespace(bot=False, id=user_id, roles=()),
+        guild=guild,
+        channel=SimpleNamespace(id=channel_id),
+        content=content,
+        attachments=(),
+    )
+
+
+def make_bot(data_dir: Path, tts_engine, synth_concurrency: int | None = None) -> SimpleNamespace:
+    """AutoReadCog가 사용하는 서비스만 가진 봇. 속도 제한과 중복 억제는 끄고, VoiceCog는 없다(퇴장 대기 없음).
+
+    synth_concurrency를 주면 합성 스케줄러의 엔진별 동시 합성 수를 모두 그 값으로 둔다.
+    """
+    limits = SYNTH_CONCURRENCY if synth_concurrency is None else dict.fromkeys(SYNTH_CONCURRENCY, synth_concurrency)
+    return SimpleNamespace(
+        user_settings=UserSettings(data_dir=data_dir),
+        tts_engine=tts_engine,
+        synthesis_scheduler=SynthesisScheduler(tts_engine, limits),
+        audio_manager=AudioManager(),
+        rate_limiter=SynthesisRateLimiter(user_rate=0, guild_rate=0),
+        dedup=DuplicateSuppressor(window=0),
+        get_cog=lambda name: None,
+    )
+
+
+async def sample_loop_lag(samples: list[float], interval: float = 0.01) -> None:
+    """취소될 때까지 interval마다 깨어나며 예정 시각 대비 지연(초)을 samples에 기록한다."""
+    while True:
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, time.perf_counter() - expected))
+
+
+# --- 가짜 업스트림 TTS 서비스 ---
+
+# edge-tts 기본 출력(48kbps MP3)의 초당 바이트 수
+EDGE_BYTES_PER_SECOND = 6000
+
+
+def _audio_bytes(text: str, bytes_per_second: int = EDGE_BYTES_PER_SECOND) -> int:
+    """한국어 낭독 속도(초당 약 7자)를 기준으로 오디오 크기를 정한다 (최소 0.5초)."""
+    return int(max(len(text) / 7, 0.5) * bytes_per_second)
+
+
+class FakeUpstream:
+    """업스트림 서비스의 지연시간(평균 ±50% 균등분포)과 실패율 설정."""
+
+    def __init__(self, latency: float, failure_rate: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.requests = 0
+        self.failures = 0
+        self._rng = random.Random(seed)
+
+    def next_latency(self) -> float:
+        return self.latency * self._rng.uniform(0.5, 1.5)
+
+    def should_fail(self) -> bool:
+        self.requests += 1
+        if self._rng.random() < self.failure_rate:
+            self.failures += 1
+            return True
+        return False
+
+
+def fake_edge_tts_module(upstream: FakeUpstream, chunk_size: int = 2048, chunk_interval: float = 0.01):
+    """edge_tts.Communicate(...).stream()을 흉내 내는 모듈.
+
+    첫 청크 전 upstream 지연이 있고, 이후 chunk_interval 간격으로 오디오 청크를 보낸다.
+    실패하면 오디오 없이 예외를 던진다.
+    """
+
+    class Communicate:
+        def __init__(self, text: str, voice: str, rate: str = "+0%", pitch: str = "+0Hz"):
+            self.text = text
+
+        async def stream(self):
+            await asyncio.sleep(upstream.next_latency())
+            if upstream.should_fail():
+                raise RuntimeError("fake edge-tts failure")
+            remaining = _audio_bytes(self.text)
+            while remaining > 0:
+                size = min(chunk_size, remaining)
+                remaining -= size
+                yield {"type": "audio", "data": b"\xff" * size}
+                await asyncio.sleep(chunk_interval)
+
+    return SimpleNamespace(Communicate=Communicate)
+
+
+def fake_gtts_module(upstream: FakeUpstream, part_length: int = 100):
+    """gtts.gTTS를 흉내 내는 모듈.
+
+    실제 gTTS처럼 텍스트를 part_length자 조각으로 나눠 조각마다 upstream 지연 후
+    오디오를 내놓는다 (executor 스레드에서 블로킹). 첫 조각 전에 실패할 수 있다.
+    """
+
+    class gTTS:
+        def __init__(self, text: str, lang: str = "ko", slow: bool = False):
+            self.text = text
+
+        def stream(self):
+            parts = [self.text[i:i + part_length] for i in range(0, len(self.text), part_length)] or [""]
+            for index, part in enumerate(parts):
+                time.sleep(upstream.next_latency())
+                if index == 0 and upstream.should_fail():
+                    raise RuntimeError("fake gTTS failure")
+                yield b"\xff" * _audio_bytes(part)
+
+        def write_to_fp(self, fp) -> None:
+            for chunk in self.stream():
+                fp.write(chunk)
+
+    return SimpleNamespace(gTTS=gTTS)
+
+
+@contextmanager
+def patched_engines(edge: FakeUpstream, gtts: FakeUpstream):
+    """TTSEngine이 지연 import하는 edge_tts/gtts를 가짜 모듈로 바꾼다."""
+    with mock.patch.dict(sys.modules, {
+        "edge_tts": fake_edge_tts_module(edge),
+        "gtts": fake_gtts_module(gtts),
+    }):
+        yield
+
+
+class SoVITSStandIn:
+    """로컬 GPT-SoVITS HTTP 서버 대역 (127.0.0.1 임의 포트, 같은 이벤트 루프에서 실행).
+
+    가짜 음성 클라이언트가 바이트 수로 재생 시간을 계산하므로, 16비트 모노 WAV의
+    초당 바이트 수가 EDGE_BYTES_PER_SECOND와 같도록 샘플레이트를 맞춘다.
+    """
+
+    def __init__(self, upstream: FakeUpstream, sample_rate: int = EDGE_BYTES_PER_SECOND // 2):
+        self.upstream = upstream
+        self.sample_rate = sample_rate
+        self.url = ""
+        self._runner = None
+
+    def _wav(self, text: str) -> bytes:
+        frames = int(max(len(text) / 7, 0.5) * self.sample_rate)
+        data_size = frames * 2
+        header = (
+            b"RIFF" + (36 + data_size).to_bytes(4, "little") + b"WAVE"
+            + b"fmt " + (16).to_bytes(4, "little") + (1).to_bytes(2, "little")
+            + (1).to_bytes(2, "little") + self.sample_rate.to_bytes(4, "little")
+            + (self.sample_rate * 2).to_bytes(4, "little") + (2).to_bytes(2, "little")
+            + (16).to_bytes(2, "little")
+            + b"data" + data_size.to_bytes(4, "little")
+        )
+        return header + bytes(data_size)
+
+    async def _handle(self, request):
+        from aiohttp import web
+
+        await asyncio.sleep(self.upstream.next_latency())
+        if self.upstream.should_fail():
+            return web.Response(status=500, text="fake GPT-SoVITS failure")
+        return web.Response(body=self._wav(request.query.get("text", "")), content_type="audio/wav")
+
+    async def start(self) -> str:
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_get("/", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self.url
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
@@ -1,12 +1,19 @@
 import asyncio
 import logging
+import signal
+import time
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from config import DISCORD_BOT_TOKEN
-from services import TTSEngine, AudioManager, UserSettings
+from config import DISCORD_BOT_TOKEN, METRICS_ENABLED, PROFILE_ON_START_SECONDS
+from services import event_loop
+from services import (
+    TTSEngine, AudioManager, UserSettings, SynthesisRateLimiter, DuplicateSuppressor,
+    LoopLagMonitor, MetricsServer, render_metrics, CommandSyncer, SamplingProfiler,
+    SynthesisScheduler,
+)
 
 # 로깅 설정
 logging.basicConfig(
@@ -15,6 +22,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger("tts-bot")
 
+# 모듈 import가 끝난 시각 (준비 완료까지 걸린 시간 기록용, import 시간은 bench_startup으로 따로 측정)
+_STARTED = time.perf_counter()
+
 
 class TTSBot(commands.Bot):
     """판구리 — 디스코드 TTS 봇."""
@@ -32,8 +42,18 @@ class TTSBot(commands.Bot):
         # 서비스 초기화
         self.user_settings = UserSettings()
         self.tts_engine = TTSEngine()
+        self.synthesis_scheduler = SynthesisScheduler(self.tts_engine)
         self.audio_manager = AudioManager()
-        self._synced = False
+        self.rate_limiter = SynthesisRateLimiter()
+        self.dedup = DuplicateSuppressor()
+        self.loop_monitor = LoopLagMonitor()
+        self.metrics_server: MetricsServer | None = None
+        self.command_syncer = CommandSyncer(self.tree)
+        self.profiler = SamplingProfiler()
+        self._profile_task: asyncio.Task | None = None
+        self._sync_task: asyncio.Task | None = None
+        self._preload_task: asyncio.Task | None = None
+        self._shutting_down = False
 
     async def setup_hook(self) -> None:
         """Cog 로드 및 오류 핸들러 설정."""
@@ -41,6 +61,7 @@ class TTSBot(commands.Bot):
             "cogs.voice_cog",
             "cogs.tts_cog",
             "cogs.auto_read_cog",
+            "cogs.admin_cog",
         ]
 
         for cog in cogs:
@@ -50,6 +71,25 @@ class TTSBot(commands.Bot):
             except Exception as e:
                 logger.error(f"Cog 로드 실패 {cog}: {e}")
 
+        # 이전 실행의 오디오 캐시 복원
+        await self.tts_engine.load_cache_snapshot()
+
+        # 이벤트 루프 지연/멈춤 감시
+        self.loop_monitor.start()
+
+        # 메트릭 엔드포인트 (선택사항)
+        if METRICS_ENABLED:
+            self.metrics_server = MetricsServer(lambda: render_metrics(self))
+            try:
+                await self.metrics_server.start()
+            except OSError as e:
+                logger.error(f"메트릭 엔드포인트 시작 실패: {e}")
+                self.metrics_server = None
+
+        # 시작 직후 프로파일링 (선택사항)
+        if PROFILE_ON_START_SECONDS > 0:
+            self._profile_task = asyncio.create_task(self.profiler.run(PROFILE_ON_START_SECONDS))
+
         # 오래된 캐시 명령어를 안전하게 처리
         @self.tree.error
         async def on_app_command_error(
@@ -69,34 +109,21 @@ class TTSBot(commands.Bot):
             else:
                 logger.error(f"앱 명령어 오류: {error}")
 
-    async def _sync_guild(self, guild: discord.Guild) -> None:
-        """특정 서버에 슬래시 명령어를 동기화하여 즉시 사용 가능하게 한다."""
-        try:
-            self.tree.copy_global_to(guild=guild)
-            synced = await self.tree.sync(guild=guild)
-            logger.info(f"명령어 {len(synced)}개 동기화 완료: {guild.name} ({guild.id})")
-        except Exception as e:
-            logger.error(f"명령어 동기화 실패 ({guild.name}): {e}")
-
     async def on_ready(self) -> None:
         """봇 준비 완료 시 호출."""
         logger.info(f"로그인 완료: {self.user} (ID: {self.user.id})")
         logger.info(f"연결된 서버: {len(self.guilds)}개")
 
-        if not self._synced:
-            # 각 서버에 명령어 동기화 (즉시 사용 가능)
-            for guild in self.guilds:
-                await self._sync_guild(guild)
-
-            # 오래된 전역 명령어 제거
-            # (트리 상태 저장 → 초기화 → 빈 상태 동기화 → 복원)
-            global_cmds = self.tree.get_commands()
-            self.tree.clear_commands(guild=None)
-            await self.tree.sync()
-            for cmd in global_cmds:
-                self.tree.add_command(cmd)
+        if self._preload_task is None:
+            logger.info(f"준비 완료까지 {time.perf_counter() - _STARTED:.2f}초")
+            # 엔진 모듈은 준비 후 백그라운드에서 로드
+            self._preload_task = asyncio.create_task(self.tts_engine.preload_engines())
 
-            self._synced = True
+        if self._sync_task is None:
+            # 명령어 동기화는 백그라운드에서 진행 (바뀐 서버만, 동시 처리)
+            self._sync_task = asyncio.create_task(
+                self.command_syncer.sync_all(list(self.guilds))
+            )
 
         # GPT-SoVITS 서버 연결 확인
         sovits = self.tts_engine.sovits_client
@@ -116,16 +143,40 @@ class TTSBot(commands.Bot):
 
     async def on_guild_join(self, guild: discord.Guild) -> None:
         """새 서버 참가 시 명령어 동기화."""
-        await self._sync_guild(guild)
+        await self.command_syncer.sync_guild(guild)
+
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        """서버에서 나가면 동기화 기록 삭제."""
+        await self.command_syncer.forget_guild(guild)
 
     async def close(self) -> None:
-        """종료 시 정리."""
+        """종료 시 정리.
+
+        main()의 finally와 discord.py 내부 종료 양쪽에서 불릴 수 있으므로 한 번만 정리한다
+        (두 번째 호출이 비워진 캐시로 스냅샷을 덮어쓰지 않도록).
+        """
+        if self._shutting_down:
+            return
+        self._shutting_down = True
         logger.info("종료 중...")
 
+        for task in (self._sync_task, self._profile_task):
+            if task and not task.done():
+                task.cancel()
+
         for vc in self.voice_clients:
-            await vc.disconnect()
+            try:
+                await vc.disconnect()
+            except Exception as e:
+                # 연결 해제 실패가 캐시 스냅샷·설정 저장을 막지 않게 한다
+                logger.warning(f"음성 연결 해제 실패: {e}")
+
+        if self.metrics_server:
+            await self.metrics_server.close()
+        await self.loop_monitor.stop()
 
         await self.tts_engine.cleanup_all_async()
+        await asyncio.to_thread(self.user_settings.close)
         await super().close()
 
 
@@ -137,14 +188,25 @@ async def main() -> None:
 
     bot = TTSBot()
 
+    # SIGTERM(배포, systemd 종료)도 Ctrl+C처럼 main()을 취소해 아래 finally의 정리 경로를 타게 한다
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    except NotImplementedError:
+        pass  # Windows
+
     try:
         await bot.start(DISCORD_BOT_TOKEN)
-    except KeyboardInterrupt:
-        await bot.close()
+    except asyncio.CancelledError:
+        logger.info("종료 신호 수신")
     except Exception as e:
         logger.error(f"봇 오류: {e}")
+    finally:
+        # Ctrl+C는 KeyboardInterrupt가 아니라 main() 취소로 전달되므로 여기서 정리해야 한다
         await bot.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        event_loop.run(main())
+    except KeyboardInterrupt:
+        pass
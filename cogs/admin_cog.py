@@ -0,0 +1,51 @@
+import logging
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from config import PROFILE_MAX_SECONDS
+
+logger = logging.getLogger("tts-bot.admin")
+
+
+class AdminCog(commands.Cog):
+    """봇 운영용 관리자 명령어."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @app_commands.command(name="프로파일", description="(관리자) 메시지 처리 경로를 일정 시간 샘플링해 프로파일을 저장합니다")
+    @app_commands.describe(초="프로파일링 시간 (초)")
+    @app_commands.default_permissions(administrator=True)
+    async def profile(
+        self,
+        interaction: discord.Interaction,
+        초: app_commands.Range[int, 1, PROFILE_MAX_SECONDS] = 30,
+    ) -> None:
+        """이벤트 루프 샘플링 프로파일러를 실행하고 결과 파일 경로를 알려준다."""
+        profiler = self.bot.profiler
+        if profiler.running:
+            await interaction.response.send_message(
+                "이미 프로파일링 중입니다.",
+                ephemeral=True,
+            )
+            return
+
+        await interaction.response.send_message(
+            f"{초}초 동안 프로파일링합니다.",
+            ephemeral=True,
+        )
+        logger.info(f"프로파일링 요청: {interaction.user} ({초}초)")
+        result = await profiler.run(초)
+        if result is None:
+            return
+        path, samples = result
+        await interaction.followup.send(
+            f"프로파일링 완료: 샘플 {samples}개\n`{path.name}` (data/profiles)",
+            ephemeral=True,
+        )
+
+
+async def setup(bot: commands.Bot) -> None:
+    await bot.add_cog(AdminCog(bot))
@@ -1,30 +1,17 @@
 import asyncio
-import io
 import logging
-import re
 
 import discord
 from discord.ext import commands
 
-logger = logging.getLogger("tts-bot.autoread")
-
-_USER_MENTION_RE = re.compile(r"<@!?(\d+)>")
-_CUSTOM_EMOJI_RE = re.compile(r"<a?:\w+:\d+>")
-_UNICODE_EMOJI_RE = re.compile(
-    "["
-    "\U0001F600-\U0001F64F"  # 이모티콘
-    "\U0001F300-\U0001F5FF"  # 기호
-    "\U0001F680-\U0001F6FF"  # 교통
-    "\U0001F1E0-\U0001F1FF"  # 국기
-    "\U0001F900-\U0001F9FF"  # 보충 기호
-    "\U0001FA00-\U0001FAFF"  # 확장 기호
-    "\U00002600-\U000027BF"  # 기타 기호
-    "\U0000FE00-\U0000FE0F"  # 변형 선택자
-    "\U0000200D"             # ZWJ
-    "\U000020E3"             # 결합 기호
-    "]+",
-    flags=re.UNICODE,
+from config import (
+    QUEUE_LANE_SYSTEM, QUEUE_LANE_PRIORITY, QUEUE_LANE_NORMAL,
+    PRIORITY_ROLE_IDS, PRIORITY_SHORT_TEXT_LENGTH, SYSTEM_NOTICE_AUTHOR_IDS,
 )
+from services.text_scanner import ScannedMessage, scan_message
+from services.user_settings import ROUTE_DESIGNATED
+
+logger = logging.getLogger("tts-bot.autoread")
 
 
 class AutoReadCog(commands.Cog):
@@ -32,62 +19,115 @@ class AutoReadCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # 합성 중인 메시지 ID → 처리 태스크 (삭제/수정 시 취소용)
+        self._pending: dict[int, asyncio.Task] = {}
+        # 서버 ID → 진행 중인 자동 참가 태스크
+        self._joining: dict[int, asyncio.Task] = {}
 
-    def _preprocess_message(self, message: discord.Message) -> str | None:
+    def _preprocess_message(self, message: discord.Message) -> ScannedMessage | None:
         """메시지 내용을 TTS용으로 전처리한다.
 
         멘션 → 닉네임 치환, 이모지 제거, 이미지/이모지만 전송 시 안내 문구 반환.
-        읽을 내용이 없으면 None을 반환한다.
+        읽을 내용이 없거나 '/'로 시작하는 명령어면 None을 반환한다.
         """
-        text = message.content.strip()
-
-        # 멘션 → 닉네임 치환
-        def _replace_mention(m: re.Match) -> str:
-            user_id = int(m.group(1))
+        def _resolve_mention(user_id: int) -> str:
             member = message.guild.get_member(user_id)
             return member.display_name if member else "알 수 없는 사용자"
 
-        text = _USER_MENTION_RE.sub(_replace_mention, text)
-
-        # 이모지 존재 여부 기록
-        had_emoji = bool(_CUSTOM_EMOJI_RE.search(text) or _UNICODE_EMOJI_RE.search(text))
-
-        # 이모지 제거
-        text = _CUSTOM_EMOJI_RE.sub("", text)
-        text = _UNICODE_EMOJI_RE.sub("", text)
-        text = text.strip()
+        scanned = scan_message(message.content, _resolve_mention)
+        if scanned.is_command:
+            return None
 
         # 빈 텍스트 처리
-        if not text:
+        if not scanned.text:
             has_image = any(
                 a.content_type and a.content_type.startswith("image/")
                 for a in message.attachments
             )
             if has_image:
-                return "이미지를 보냈어요"
-            if had_emoji:
-                return "이모지를 보냈어요"
+                return scanned._replace(text="이미지를 보냈어요", has_jamo=False)
+            if scanned.had_emoji:
+                return scanned._replace(text="이모지를 보냈어요", has_jamo=False)
             return None
 
-        return text
+        return scanned
 
-    async def _try_auto_join(self, message: discord.Message) -> discord.VoiceClient | None:
-        """지정채널 메시지의 작성자 음성 채널에 자동 참가한다.
+    @staticmethod
+    def _message_priority(message: discord.Message, text: str) -> int:
+        """메시지의 큐 레인을 결정한다.
 
-        성공 시 VoiceClient를 반환하고, 참가 불가 시 None을 반환한다.
+        안내 봇/웹훅(SYSTEM_NOTICE_AUTHOR_IDS) 메시지는 최우선 레인,
+        우선 역할(PRIORITY_ROLE_IDS) 보유자나 짧은 메시지는 우선 레인으로 보낸다.
         """
+        if message.author.id in SYSTEM_NOTICE_AUTHOR_IDS:
+            return QUEUE_LANE_SYSTEM
+        if PRIORITY_ROLE_IDS:
+            roles = getattr(message.author, "roles", ())
+            if any(role.id in PRIORITY_ROLE_IDS for role in roles):
+                return QUEUE_LANE_PRIORITY
+        if len(text) <= PRIORITY_SHORT_TEXT_LENGTH:
+            return QUEUE_LANE_PRIORITY
+        return QUEUE_LANE_NORMAL
+
+    @staticmethod
+    def _author_voice_channel(message: discord.Message) -> discord.abc.Connectable | None:
+        """메시지 작성자가 접속 중인 음성 채널을 반환한다."""
         member = message.guild.get_member(message.author.id)
         if not member or not member.voice or not member.voice.channel:
             return None
+        return member.voice.channel
 
-        voice_channel = member.voice.channel
-        try:
-            voice_client = await voice_channel.connect()
-        except discord.ClientException:
-            # 레이스 컨디션: 이미 연결됨
-            voice_client = message.guild.voice_client
-            if not voice_client or not voice_client.is_connected():
-                return None
+    def _is_lingering(self, guild_id: int) -> bool:
+        voice_cog = self.bot.get_cog("VoiceCog")
+        return voice_cog is not None and voice_cog.is_lingering(guild_id)
+
+    def _start_auto_join(
+        self, message: discord.Message, voice_channel: discord.abc.Connectable,
+    ) -> asyncio.Task:
+        """자동 참가를 백그라운드 태스크로 시작한다.
+
+        같은 서버에서 이미 진행 중인 참가가 있으면 그 태스크를 공유한다.
+        메시지 처리가 취소되어도 연결은 끝까지 진행된다.
+        """
+        guild_id = message.guild.id
+        task = self._joining.get(guild_id)
+        if task is None or task.done():
+            task = asyncio.create_task(self._try_auto_join(message, voice_channel))
+            self._joining[guild_id] = task
+
+            def _done(t: asyncio.Task) -> None:
+                if self._joining.get(guild_id) is t:
+                    del self._joining[guild_id]
+                if not t.cancelled() and t.exception() is not None:
+                    logger.error(f"지정채널 자동참가 실패: {t.exception()}")
+
+            task.add_done_callback(_done)
+        return task
+
+    async def _try_auto_join(
+        self, message: discord.Message, voice_channel: discord.abc.Connectable,
+    ) -> discord.VoiceClient | None:
+        """지정채널 메시지의 작성자 음성 채널에 자동 참가한다.
+
+        퇴장 대기 중인 빈 채널에 남아 있으면 작성자 채널로 옮긴다.
+        성공 시 VoiceClient를 반환하고, 참가 불가 시 None을 반환한다.
+        """
+        voice_client = message.guild.voice_client
+        if voice_client and voice_client.is_connected():
+            # 이동 중에 대기 태스크가 퇴장시키지 않도록 먼저 취소한다
+            voice_cog = self.bot.get_cog("VoiceCog")
+            if voice_cog is not None:
+                voice_cog.cancel_linger(message.guild.id)
+            if voice_client.channel != voice_channel:
+                await voice_client.move_to(voice_channel)
+        else:
+            try:
+                voice_client = await voice_channel.connect()
+            except discord.ClientException:
+                # 레이스 컨디션: 이미 연결됨
+                voice_client = message.guild.voice_client
+                if not voice_client or not voice_client.is_connected():
+                    return None
 
         # 세션 중 빠른 처리를 위해 자동읽기에도 등록
         user_settings = self.bot.user_settings
@@ -100,89 +140,176 @@ class AutoReadCog(commands.Cog):
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
         """설정된 채널의 메시지를 자동으로 읽는다."""
-        if message.author.bot:
+        await self._handle_message(message)
+
+    async def _handle_message(self, message: discord.Message, charge: bool = True) -> None:
+        """읽을 채널의 메시지인지 확인하고 읽기 작업을 등록한다.
+
+        charge가 False이면 속도 제한 토큰을 쓰지 않는다 (수정된 메시지 다시 읽기).
+        """
+        is_notice = message.author.id in SYSTEM_NOTICE_AUTHOR_IDS
+        if message.author.bot and not is_notice:
             return
 
         if not message.guild:
             return
 
+        # 대부분의 메시지는 관련 없는 채널이므로 해시 조회 1번으로 거른다
         user_settings = self.bot.user_settings
-        is_auto_read = user_settings.is_auto_read_channel(message.guild.id, message.channel.id)
-        is_designated = user_settings.is_designated_channel(message.guild.id, message.channel.id)
-
-        if not is_auto_read and not is_designated:
+        route = user_settings.get_channel_route(message.channel.id)
+        if not route:
             return
+        is_designated = bool(route & ROUTE_DESIGNATED)
 
+        task = asyncio.current_task()
+        self._pending[message.id] = task
+        try:
+            # 안내 메시지는 속도 제한을 받지 않는다
+            await self._read_message(message, is_designated, charge and not is_notice)
+        finally:
+            if self._pending.get(message.id) is task:
+                del self._pending[message.id]
+
+    async def _read_message(self, message: discord.Message, is_designated: bool, charge: bool) -> None:
+        """메시지를 합성해 큐에 넣고 재생한다. charge가 True이면 속도 제한 토큰을 쓴다."""
+        user_settings = self.bot.user_settings
         voice_client = message.guild.voice_client
+        voice_channel = None
         if not voice_client or not voice_client.is_connected():
-            if is_designated:
-                voice_client = await self._try_auto_join(message)
-                if not voice_client:
-                    return
-            else:
+            if not is_designated:
                 logger.debug("음성 클라이언트 미연결, 건너뜀")
                 return
+            voice_channel = self._author_voice_channel(message)
+            if voice_channel is None:
+                return
+        elif self._is_lingering(message.guild.id):
+            # 사람 없는 채널에서 퇴장 대기 중 → 들을 사람이 없으므로 합성하지 않는다
+            if not is_designated:
+                logger.debug("퇴장 대기 중인 빈 채널, 건너뜀")
+                return
+            # 지정채널 메시지는 작성자 음성 채널로 옮겨 읽는다
+            voice_channel = self._author_voice_channel(message)
+            if voice_channel is None:
+                return
 
-        text = self._preprocess_message(message)
-        if text is None:
+        # 실제로 읽을 메시지만 사용자·서버별 속도 제한 토큰을 쓴다 (음성 미연결 채널의 대화는 세지 않음)
+        if charge and not self.bot.rate_limiter.allow(message.guild.id, message.author.id):
+            logger.info(f"속도 제한 초과, 메시지 무시 (작성자: {message.author})")
             return
 
-        if text.startswith("/"):
+        join_task = None
+        if voice_channel is not None:
+            # 음성 연결 핸드셰이크와 합성을 동시에 진행한다
+            join_task = self._start_auto_join(message, voice_channel)
+
+        scanned = self._preprocess_message(message)
+        if scanned is None:
             return
 
+        text = scanned.text
         if len(text) > 200:
             text = text[:200] + "..."
 
         logger.info(f"자동읽기: '{text[:30]}' (작성자: {message.author})")
 
-        # 사용자 설정 가져오기
-        lang = user_settings.get_user_language(message.author.id)
-        slow = user_settings.get_user_slow(message.author.id)
-        voice = user_settings.get_user_voice(message.author.id)
-        rate = user_settings.get_user_rate(message.author.id)
-        pitch = user_settings.get_user_pitch(message.author.id)
-        effect = user_settings.get_user_effect(message.author.id)
+        # 사용자 설정 가져오기 (캐시된 프로필 1회 조회)
+        profile = user_settings.get_user_profile(message.author.id)
+
+        # 도배 시 같은 문장이 반복되면 한 번만 읽는다
+        if not self.bot.dedup.check(message.guild.id, text, profile.voice):
+            logger.debug(f"중복 메시지 생략 (작성자: {message.author})")
+            return
 
-        # TTS 생성
-        tts_engine = self.bot.tts_engine
+        # TTS 생성 (엔진별 동시 합성 수 제한, 서버 간 공정하게 순서 결정)
         try:
-            source, cleanup_callback = await tts_engine.synthesize(
+            source, cleanup_callback = await self.bot.synthesis_scheduler.synthesize(
+                message.guild.id,
                 text,
-                lang=lang,
-                slow=slow,
-                voice=voice,
-                rate=rate,
-                pitch=pitch,
+                lang=profile.language,
+                slow=profile.slow,
+                voice=profile.voice,
+                rate=profile.rate,
+                pitch=profile.pitch,
+                has_jamo=scanned.has_jamo,
             )
             logger.info("TTS 소스 준비 완료")
         except Exception as e:
             logger.error(f"TTS 합성 실패: {e}")
             return
 
-        # 큐가 사용 중이면 미리 버퍼링 (재생 간 텀 단축)
-        audio_manager = self.bot.audio_manager
-        guild_queue = audio_manager.get_queue(message.guild.id)
-        if guild_queue.is_playing or len(guild_queue) > 0:
-            try:
-                loop = asyncio.get_running_loop()
-                data = await loop.run_in_executor(None, source.read)
-                cleanup_callback()
-                source = io.BytesIO(data)
-                cleanup_callback = lambda: None
-            except Exception as e:
-                logger.warning(f"프리버퍼링 실패, 스트리밍으로 폴백: {e}")
-
         # 큐에 추가 및 재생
-        await audio_manager.add_to_queue(
-            guild_id=message.guild.id,
-            source=source,
-            cleanup_callback=cleanup_callback,
-            text=text,
-            user_id=message.author.id,
-            effect=effect,
-        )
+        # (스트리밍 소스는 대기 중에도 스풀 버퍼에 계속 채워지므로 별도 프리버퍼링이 필요 없다)
+        audio_manager = self.bot.audio_manager
+        try:
+            if join_task is not None:
+                # 합성하는 동안 진행된 음성 연결을 기다린다 (취소돼도 연결은 계속)
+                try:
+                    voice_client = await asyncio.shield(join_task)
+                except Exception:
+                    voice_client = None  # 오류는 _start_auto_join 콜백에서 기록
+                if not voice_client:
+                    cleanup_callback()
+                    return
+            await audio_manager.add_to_queue(
+                guild_id=message.guild.id,
+                source=source,
+                cleanup_callback=cleanup_callback,
+                text=text,
+                user_id=message.author.id,
+                effect=profile.effect,
+                priority=self._message_priority(message, text),
+                ffmpeg_options=profile.ffmpeg_options,
+                message_id=message.id,
+            )
+        except asyncio.CancelledError:
+            # 합성 직후 메시지가 삭제/수정됨 → 큐에 넣지 못한 소스 정리
+            cleanup_callback()
+            raise
         await audio_manager.play_next(voice_client, message.guild.id)
 
+    async def _cancel_message(self, guild_id: int, message_id: int) -> bool:
+        """합성 중이거나 대기 중인 메시지 읽기를 취소한다. 취소한 것이 있으면 True."""
+        cancelled = False
+        task = self._pending.pop(message_id, None)
+        if task is not None and not task.done():
+            task.cancel()
+            cancelled = True
+        if await self.bot.audio_manager.cancel_message(guild_id, message_id):
+            cancelled = True
+        return cancelled
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        """삭제된 메시지의 합성/대기 항목을 취소한다 (캐시에 없는 메시지 포함)."""
+        if payload.guild_id is None:
+            return
+        if await self._cancel_message(payload.guild_id, payload.message_id):
+            logger.info(f"삭제된 메시지 읽기 취소 (메시지 {payload.message_id})")
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent) -> None:
+        """한꺼번에 삭제된 메시지(관리 봇의 도배 정리 등)의 합성/대기 항목을 취소한다."""
+        if payload.guild_id is None:
+            return
+        cancelled = 0
+        for message_id in payload.message_ids:
+            if await self._cancel_message(payload.guild_id, message_id):
+                cancelled += 1
+        if cancelled:
+            logger.info(f"일괄 삭제된 메시지 읽기 취소 ({cancelled}/{len(payload.message_ids)}개)")
+
+    @commands.Cog.listener()
+    async def on_message_edit(self, before: discord.Message, after: discord.Message) -> None:
+        """아직 읽지 않은 메시지가 수정되면 수정된 내용으로 다시 읽는다."""
+        if after.author.bot and after.author.id not in SYSTEM_NOTICE_AUTHOR_IDS:
+            return
+        if not after.guild or before.content == after.content:
+            return
+        if await self._cancel_message(after.guild.id, after.id):
+            logger.info(f"수정된 메시지 다시 읽기 (메시지 {after.id})")
+            # 원래 메시지에서 이미 토큰을 썼으므로 다시 차감하지 않는다
+            await self._handle_message(after, charge=False)
+
 
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(AutoReadCog(bot))
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Optional
 
@@ -5,6 +6,8 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from config import VOICE_LINGER_SECONDS
+
 logger = logging.getLogger("tts-bot.voice")
 
 
@@ -13,6 +16,25 @@ class VoiceCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # 음성 채널 ID → 사람(봇 제외) 수. 처음 필요할 때 한 번 세고 이후 이벤트로 증감한다
+        self._humans: dict[int, int] = {}
+        # 서버 ID → 퇴장 대기 태스크
+        self._linger: dict[int, asyncio.Task] = {}
+
+    def _human_count(self, channel: discord.abc.GuildChannel) -> int:
+        count = self._humans.get(channel.id)
+        if count is None:
+            count = self._humans[channel.id] = sum(1 for m in channel.members if not m.bot)
+        return count
+
+    def is_lingering(self, guild_id: int) -> bool:
+        """봇이 사람 없는 음성 채널에서 퇴장을 기다리는 중인지 확인한다."""
+        return guild_id in self._linger
+
+    def cancel_linger(self, guild_id: int) -> None:
+        task = self._linger.pop(guild_id, None)
+        if task is not None:
+            task.cancel()
 
     @app_commands.command(name="입장", description="판구리를 음성 채널에 참가시키고 현재 채널을 자동읽기로 설정합니다")
     async def join(self, interaction: discord.Interaction) -> None:
@@ -89,6 +111,7 @@ class VoiceCog(commands.Cog):
         for cid in list(user_settings.get_auto_read_channels(interaction.guild.id)):
             user_settings.remove_auto_read_channel(interaction.guild.id, cid)
 
+        self.cancel_linger(interaction.guild.id)
         await voice_client.disconnect()
         await interaction.response.send_message("음성 채널에서 퇴장했습니다.")
 
@@ -125,6 +148,15 @@ class VoiceCog(commands.Cog):
                 "이 채널의 **지정채널** 설정이 해제되었습니다."
             )
 
+    @commands.Cog.listener()
+    async def on_ready(self) -> None:
+        """재연결 시 놓친 이벤트가 있을 수 있으므로 인원 수를 다시 센다."""
+        self._humans.clear()
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        self._humans.pop(channel.id, None)
+
     @commands.Cog.listener()
     async def on_voice_state_update(
         self,
@@ -132,22 +164,57 @@ class VoiceCog(commands.Cog):
         before: discord.VoiceState,
         after: discord.VoiceState,
     ) -> None:
-        """음성 상태 변경 감지 — 사람이 모두 나가면 즉시 퇴장."""
-        # 봇 자신의 상태 변경은 무시
+        """음성 상태 변경 감지 — 사람이 모두 나가면 대기 후 퇴장."""
+        if before.channel == after.channel:
+            # 음소거 등 채널 이동이 아닌 변경
+            return
+
+        guild_id = member.guild.id
         if member.id == self.bot.user.id:
+            # 봇이 퇴장했으면 대기 취소, 이동했으면 새 채널 기준으로 다시 판단
+            if after.channel is None:
+                self.cancel_linger(guild_id)
+            else:
+                self._update_linger(member.guild)
             return
 
-        voice_client = member.guild.voice_client
-        if not voice_client:
+        if not member.bot:
+            # 이미 세고 있는 채널만 증감 (나머지는 필요할 때 센다)
+            if before.channel is not None and before.channel.id in self._humans:
+                self._humans[before.channel.id] -= 1
+            if after.channel is not None and after.channel.id in self._humans:
+                self._humans[after.channel.id] += 1
+
+        self._update_linger(member.guild)
+
+    def _update_linger(self, guild: discord.Guild) -> None:
+        """봇이 있는 채널의 인원 수에 따라 퇴장 대기를 시작하거나 취소한다."""
+        voice_client = guild.voice_client
+        if not voice_client or not voice_client.channel:
+            return
+
+        if self._human_count(voice_client.channel) > 0:
+            self.cancel_linger(guild.id)
             return
 
-        # 봇이 혼자 남았는지 확인
-        bot_channel = voice_client.channel
-        members_in_channel = [m for m in bot_channel.members if not m.bot]
+        if guild.id not in self._linger:
+            self._linger[guild.id] = asyncio.create_task(
+                self._linger_then_leave(guild.id, voice_client)
+            )
 
-        if len(members_in_channel) == 0:
-            # 즉시 정리 및 퇴장
-            await self._auto_leave_now(member.guild.id, voice_client)
+    async def _linger_then_leave(
+        self,
+        guild_id: int,
+        voice_client: discord.VoiceClient,
+    ) -> None:
+        """VOICE_LINGER_SECONDS 동안 기다린 뒤에도 사람이 없으면 퇴장한다."""
+        try:
+            await asyncio.sleep(max(VOICE_LINGER_SECONDS, 0))
+        finally:
+            if self._linger.get(guild_id) is asyncio.current_task():
+                del self._linger[guild_id]
+        if voice_client.channel and self._human_count(voice_client.channel) == 0:
+            await self._auto_leave_now(guild_id, voice_client)
 
     async def _auto_leave_now(
         self,
@@ -168,7 +235,7 @@ class VoiceCog(commands.Cog):
             user_settings.remove_auto_read_channel(guild_id, cid)
 
         await voice_client.disconnect()
-        logger.info(f"사람이 없어 즉시 퇴장 (서버 {guild_id})")
+        logger.info(f"사람이 없어 퇴장 (서버 {guild_id})")
 
 
 async def setup(bot: commands.Bot) -> None:
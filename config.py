@@ -1,3 +1,5 @@
+import json
+import logging
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -7,18 +9,47 @@ load_dotenv()
 # 봇 설정
 DISCORD_BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN")
 
+# 이벤트 루프 ("asyncio" | "uvloop", uvloop이 설치되어 있지 않으면 asyncio로 대체)
+EVENT_LOOP = os.getenv("EVENT_LOOP", "asyncio").lower()
+
 # GPT-SoVITS 설정
 SOVITS_API_URL = os.getenv("SOVITS_API_URL", "http://localhost:9880")
 SOVITS_REQUEST_TIMEOUT = float(os.getenv("SOVITS_REQUEST_TIMEOUT", "30"))
 
+# 메트릭 엔드포인트 (선택사항 - 로컬 루프백에만 바인딩)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9108"))
+LOOP_LAG_INTERVAL = 0.5                     # 이벤트 루프 지연 측정 주기 (초)
+
+# 이벤트 루프 멈춤 감시 (루프가 이 시간 이상 응답하지 않으면 블로킹 중인 스택을 기록, 0이면 끔)
+LOOP_STALL_THRESHOLD = float(os.getenv("LOOP_STALL_THRESHOLD", "0.1"))
+LOOP_STALL_CHECK_INTERVAL = 0.1             # 감시 스레드가 루프에 응답을 요청하는 주기 (초)
+LOOP_STALL_REPORT_INTERVAL = 600            # 블로킹 호출 위치 상위 목록을 로그로 남기는 주기 (초)
+LOOP_STALL_REPORT_TOP = 5
+
+# 샘플링 프로파일러 (선택사항 - 켜져 있을 때만 샘플링 스레드가 동작)
+PROFILE_ON_START_SECONDS = float(os.getenv("PROFILE_ON_START_SECONDS", "0"))  # 시작 직후 프로파일링 시간 (0이면 끔)
+PROFILE_SAMPLE_INTERVAL = 0.005             # 샘플링 주기 (초)
+PROFILE_MAX_SECONDS = 300                   # 한 번에 프로파일링할 수 있는 최대 시간 (초)
+
 # 경로
 BASE_DIR = Path(__file__).parent
-TEMP_DIR = BASE_DIR / "temp"
-DATA_DIR = BASE_DIR / "data"
+DATA_DIR = Path(os.getenv("DATA_DIR", BASE_DIR / "data"))
 
 # 디렉토리 생성
-TEMP_DIR.mkdir(exist_ok=True)
-DATA_DIR.mkdir(exist_ok=True)
+DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+# 프로파일러 결과 (collapsed stack, 플레임 그래프용)
+PROFILE_DIR = DATA_DIR / "profiles"
+
+# 설정 저장소 (SQLite, 최초 실행 시 data/*.json에서 마이그레이션)
+SETTINGS_DB_PATH = DATA_DIR / "settings.db"
+SETTINGS_FLUSH_DELAY = 2.0                  # 변경 후 디스크 기록까지 모으는 시간 (초)
+
+# 슬래시 명령어 동기화 (명령어 트리 해시를 저장해 바뀐 서버만 동기화)
+COMMAND_SYNC_STATE_PATH = DATA_DIR / "command_sync.json"
+COMMAND_SYNC_CONCURRENCY = 4                # 동시에 동기화하는 서버 수
 
 # TTS 설정
 DEFAULT_LANGUAGE = "ko"
@@ -58,10 +89,89 @@ SUPPORTED_LANGUAGES = {
     "ko": "한국어",
 }
 
+# 오디오 큐 우선순위 레인 (숫자가 작을수록 먼저 재생)
+QUEUE_LANE_SYSTEM = 0                       # 안내 봇/웹훅 메시지 (SYSTEM_NOTICE_AUTHOR_IDS)
+QUEUE_LANE_PRIORITY = 1                     # 우선 역할 사용자, 짧은 메시지
+QUEUE_LANE_NORMAL = 2                       # 일반 메시지
+
+
+def _parse_lane_weights(raw: str, default: tuple[int, ...] = (4, 2, 1)) -> tuple[int, ...]:
+    """'4,2,1' 형식의 레인 가중치를 읽는다. 레인 수가 다르거나 1 미만이면 기본값을 쓴다."""
+    try:
+        weights = tuple(int(w) for w in raw.split(","))
+    except ValueError:
+        weights = ()
+    if len(weights) != len(default) or min(weights) < 1:
+        logging.getLogger("tts-bot.config").warning(f"QUEUE_LANE_WEIGHTS 값 '{raw}'이 올바르지 않아 기본값을 사용합니다")
+        return default
+    return weights
+
+
+def _parse_id_set(name: str) -> frozenset[int]:
+    """쉼표로 구분한 디스코드 ID 목록 환경 변수를 읽는다. 숫자가 아닌 항목은 경고 후 건너뛴다."""
+    ids = set()
+    for item in os.getenv(name, "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            ids.add(int(item))
+        except ValueError:
+            logging.getLogger("tts-bot.config").warning(f"{name}의 '{item}'은 올바른 ID가 아니어서 무시합니다")
+    return frozenset(ids)
+
+
+QUEUE_LANE_WEIGHTS = _parse_lane_weights(os.getenv("QUEUE_LANE_WEIGHTS", "4,2,1"))  # weighted 모드에서 한 라운드당 레인별 재생 수
+QUEUE_SCHEDULING = os.getenv("QUEUE_SCHEDULING", "weighted")  # "weighted" | "strict"
+PRIORITY_ROLE_IDS = _parse_id_set("PRIORITY_ROLE_IDS")
+PRIORITY_SHORT_TEXT_LENGTH = int(os.getenv("PRIORITY_SHORT_TEXT_LENGTH", "10"))
+# 읽어 줄 안내 봇/웹훅 ID (다른 봇 메시지는 읽지 않지만, 여기 있는 작성자의 메시지는 최우선 레인으로 읽음)
+SYSTEM_NOTICE_AUTHOR_IDS = _parse_id_set("SYSTEM_NOTICE_AUTHOR_IDS")
+
+# 음성 채널에 사람이 없을 때 퇴장 전 대기 시간 (초, 그 사이 누가 들어오면 취소, 0이면 즉시 퇴장)
+VOICE_LINGER_SECONDS = float(os.getenv("VOICE_LINGER_SECONDS", "60"))
+
+# 합성 요청 속도 제한 (토큰 버킷: 초당 충전량 / 최대 누적량, 충전량 0이면 제한 없음 — 기본값은 끔)
+RATE_LIMIT_USER_RATE = float(os.getenv("RATE_LIMIT_USER_RATE", "0"))
+RATE_LIMIT_USER_BURST = float(os.getenv("RATE_LIMIT_USER_BURST", "5"))
+RATE_LIMIT_GUILD_RATE = float(os.getenv("RATE_LIMIT_GUILD_RATE", "0"))
+RATE_LIMIT_GUILD_BURST = float(os.getenv("RATE_LIMIT_GUILD_BURST", "15"))
+
+# 중복 메시지 억제 (같은 서버에서 같은 문장·목소리가 이 시간 안에 반복되면 한 번만 읽음, 0이면 끔)
+DEDUP_WINDOW_SECONDS = float(os.getenv("DEDUP_WINDOW_SECONDS", "5"))
+DEDUP_MAX_ENTRIES = 64  # 서버당 기억하는 최근 문장 수
+
 # 오디오 캐시 설정
 AUDIO_CACHE_MAX_SIZE = 100                  # 최대 캐시 항목 수
 AUDIO_CACHE_MAX_BYTES = 10 * 1024 * 1024    # 최대 캐시 크기 (10 MB)
 
+# 오디오 캐시 스냅샷 (종료 시 저장, 시작 시 mmap으로 복원해 재시작 후에도 캐시 유지)
+AUDIO_CACHE_SNAPSHOT_ENABLED = os.getenv("AUDIO_CACHE_SNAPSHOT_ENABLED", "true").lower() == "true"
+AUDIO_CACHE_SNAPSHOT_DIR = Path(os.getenv("AUDIO_CACHE_SNAPSHOT_DIR", DATA_DIR / "audio_cache"))
+
+# 캐시 저장 시 오디오 후처리 (무음 제거 + 음량 정규화, FFmpeg 필요)
+AUDIO_POSTPROCESS_ENABLED = os.getenv("AUDIO_POSTPROCESS_ENABLED", "true").lower() == "true"
+AUDIO_POSTPROCESS_SILENCE_DB = -50          # 이 레벨 이하를 무음으로 간주
+AUDIO_POSTPROCESS_LOUDNESS_LUFS = -16       # 목표 통합 음량
+AUDIO_POSTPROCESS_TIMEOUT = 10              # 클립당 FFmpeg 처리 제한 시간 (초)
+
+# 작업 종류별 전용 executor (스레드 수 / 대기열 한도, 대기열이 차면 새 작업은 거절되고 폴백)
+GTTS_EXECUTOR_WORKERS = int(os.getenv("GTTS_EXECUTOR_WORKERS", "4"))     # gTTS 요청 (네트워크 블로킹)
+GTTS_EXECUTOR_QUEUE = int(os.getenv("GTTS_EXECUTOR_QUEUE", "8"))
+IO_EXECUTOR_WORKERS = int(os.getenv("IO_EXECUTOR_WORKERS", "2"))         # 디스크 I/O, 모듈 로드 (거절하지 않음)
+
+# 합성 스케줄러 (엔진별 동시 합성 수, 슬롯이 모자라면 서버 간 deficit round robin으로 순서 결정)
+SYNTH_CONCURRENCY = {
+    "edge": int(os.getenv("SYNTH_EDGE_CONCURRENCY", "8")),
+    "gtts": GTTS_EXECUTOR_WORKERS,
+    "sovits": int(os.getenv("SYNTH_SOVITS_CONCURRENCY", "2")),
+}
+SYNTH_DRR_QUANTUM = 50                      # 서버 차례마다 주는 크레딧 (글자 수, 요청 비용 = 텍스트 길이)
+SYNTH_WAIT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # 슬롯 대기시간 히스토그램 구간 (초)
+
+# 스트리밍 스풀 버퍼 (대기 중인 항목당 메모리 상한, 초과분은 임시 파일로 넘기고 캐시하지 않음)
+SPOOL_MEMORY_LIMIT = 256 * 1024
+
 # 단독 특수문자 → 읽기 형태 매핑 (단독 전송 시만 적용)
 STANDALONE_PUNCTUATION = {
     "?": "물음표",
@@ -152,20 +262,29 @@ KOREAN_ABBREVIATIONS: dict[str, str] = {
 }
 
 
+_characters: dict[str, dict] | None = None
+
+
+def get_characters() -> dict[str, dict]:
+    """data/characters.json의 캐릭터 설정을 반환한다 (처음 한 번만 파싱해 공유)."""
+    global _characters
+    if _characters is None:
+        _characters = {}
+        characters_file = DATA_DIR / "characters.json"
+        if characters_file.exists():
+            try:
+                with open(characters_file, "r", encoding="utf-8") as f:
+                    _characters = dict(json.load(f))
+            except Exception as e:
+                logging.getLogger("tts-bot.config").warning(f"characters.json 로드 실패: {e}")
+    return _characters
+
+
 def _load_sovits_presets() -> None:
     """data/characters.json에서 캐릭터 음성을 VOICE_PRESETS에 추가."""
-    characters_file = DATA_DIR / "characters.json"
-    if not characters_file.exists():
-        return
-    try:
-        import json as _json
-        with open(characters_file, "r", encoding="utf-8") as f:
-            characters = _json.load(f)
-        for char_id, char_data in characters.items():
-            display_name = char_data.get("display_name", char_id)
-            VOICE_PRESETS[display_name] = f"sovits:{char_id}"
-    except Exception:
-        pass
+    for char_id, char_data in get_characters().items():
+        display_name = char_data.get("display_name", char_id)
+        VOICE_PRESETS[display_name] = f"sovits:{char_id}"
 
 
 _load_sovits_presets()
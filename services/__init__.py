@@ -1,6 +1,20 @@
 from .tts_engine import TTSEngine
 from .audio_manager import AudioManager
-from .user_settings import UserSettings
+from .user_settings import UserSettings, VoiceProfile
 from .sovits_client import SoVITSClient
+from .loop_monitor import LoopLagMonitor
+from .metrics import MetricsServer, render_metrics
+from .spool import SpoolingSource
+from .rate_limiter import SynthesisRateLimiter
+from .dedup import DuplicateSuppressor
+from .command_sync import CommandSyncer
+from .profiler import SamplingProfiler
+from .executors import InstrumentedExecutor, ExecutorSaturated
+from .synthesis_scheduler import SynthesisScheduler
 
-__all__ = ["TTSEngine", "AudioManager", "UserSettings", "SoVITSClient"]
+__all__ = [
+    "TTSEngine", "AudioManager", "UserSettings", "VoiceProfile", "SoVITSClient",
+    "LoopLagMonitor", "MetricsServer", "render_metrics", "SpoolingSource",
+    "SynthesisRateLimiter", "DuplicateSuppressor", "CommandSyncer", "SamplingProfiler",
+    "InstrumentedExecutor", "ExecutorSaturated", "SynthesisScheduler",
+]
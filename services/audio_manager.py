@@ -1,12 +1,15 @@
 import asyncio
 import io
 import logging
+import time
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Callable, Optional
 
 import discord
 
+from config import QUEUE_LANE_NORMAL, QUEUE_LANE_WEIGHTS, QUEUE_SCHEDULING
+
 logger = logging.getLogger("tts-bot.audio")
 
 
@@ -20,31 +23,94 @@ class AudioItem:
     user_id: int
     guild_id: int
     effect: str = "none"
+    priority: int = QUEUE_LANE_NORMAL
+    ffmpeg_options: Optional[str] = None
+    message_id: Optional[int] = None
+    cancelled: bool = False
+    enqueued_at: float = field(default_factory=time.perf_counter)
 
 
 class GuildAudioQueue:
-    """서버별 오디오 큐."""
+    """서버별 우선순위 레인 오디오 큐.
+
+    레인마다 FIFO deque를 두고, strict 모드는 항상 가장 높은 레인부터,
+    weighted 모드는 라운드마다 레인 가중치만큼씩 번갈아 꺼낸다.
+    레인 수가 고정이므로 추가/꺼내기 모두 O(1)이다.
+    메시지 ID로 취소된 항목은 표시만 해두고 꺼낼 때 건너뛴다 (취소도 O(1)).
+    """
 
-    def __init__(self, guild_id: int):
+    def __init__(
+        self,
+        guild_id: int,
+        weights: tuple[int, ...] = QUEUE_LANE_WEIGHTS,
+        scheduling: str = QUEUE_SCHEDULING,
+    ):
         self.guild_id = guild_id
-        self.queue: deque[AudioItem] = deque()
+        self.lanes: list[deque[AudioItem]] = [deque() for _ in weights]
         self.current: Optional[AudioItem] = None
         self.is_playing = False
+        self._weights = weights
+        self._credits = list(weights)
+        self._strict = scheduling == "strict"
+        self._size = 0
+        self._by_message: dict[int, AudioItem] = {}
         self._lock = asyncio.Lock()
 
     async def add(self, item: AudioItem) -> int:
         async with self._lock:
-            self.queue.append(item)
-            return len(self.queue)
+            lane = min(max(item.priority, 0), len(self.lanes) - 1)
+            self.lanes[lane].append(item)
+            if item.message_id is not None:
+                self._by_message[item.message_id] = item
+            self._size += 1
+            return self._size
+
+    def _pop_next(self) -> AudioItem:
+        # 취소된 항목을 레인 앞에서 걷어낸다
+        for items in self.lanes:
+            while items and items[0].cancelled:
+                items.popleft()
+        if not self._strict:
+            for _ in range(2):
+                for lane, items in enumerate(self.lanes):
+                    if items and self._credits[lane] > 0:
+                        self._credits[lane] -= 1
+                        return items.popleft()
+                # 대기 항목이 있는 레인의 크레딧이 모두 소진됨 → 새 라운드
+                self._credits = list(self._weights)
+        for items in self.lanes:
+            if items:
+                return items.popleft()
+        raise IndexError("empty queue")
 
     async def next(self) -> Optional[AudioItem]:
         async with self._lock:
-            if self.queue:
-                self.current = self.queue.popleft()
-                return self.current
+            while self._size:
+                item = self._pop_next()
+                if item.cancelled:
+                    continue
+                self._size -= 1
+                if item.message_id is not None:
+                    self._by_message.pop(item.message_id, None)
+                self.current = item
+                return item
             self.current = None
             return None
 
+    async def cancel(self, message_id: int) -> Optional[AudioItem]:
+        """대기 중인 항목을 메시지 ID로 취소한다. 이미 재생 중이거나 없으면 None."""
+        async with self._lock:
+            item = self._by_message.pop(message_id, None)
+            if item is None or item.cancelled:
+                return None
+            item.cancelled = True
+            self._size -= 1
+            if not self._size:
+                # 남은 항목이 모두 취소됨 → 레인을 비워 메모리 회수
+                for lane in self.lanes:
+                    lane.clear()
+            return item
+
     async def skip(self) -> bool:
         async with self._lock:
             if self.current:
@@ -54,15 +120,19 @@ class GuildAudioQueue:
 
     async def clear(self) -> list[AudioItem]:
         async with self._lock:
-            items = list(self.queue)
+            items = [item for lane in self.lanes for item in lane if not item.cancelled]
             if self.current:
                 items.append(self.current)
-            self.queue.clear()
+            for lane in self.lanes:
+                lane.clear()
+            self._by_message.clear()
+            self._size = 0
+            self._credits = list(self._weights)
             self.current = None
             return items
 
     def __len__(self) -> int:
-        return len(self.queue)
+        return self._size
 
 
 class AudioManager:
@@ -71,6 +141,9 @@ class AudioManager:
     def __init__(self):
         self.queues: dict[int, GuildAudioQueue] = {}
         self._playback_tasks: dict[int, asyncio.Task] = {}
+        # 큐 대기시간 (추가 → 재생 시작) 누적
+        self.started = 0
+        self.queue_wait_sum = 0.0
 
     def get_queue(self, guild_id: int) -> GuildAudioQueue:
         if guild_id not in self.queues:
@@ -85,6 +158,9 @@ class AudioManager:
         text: str,
         user_id: int,
         effect: str = "none",
+        priority: int = QUEUE_LANE_NORMAL,
+        ffmpeg_options: Optional[str] = None,
+        message_id: Optional[int] = None,
     ) -> int:
         queue = self.get_queue(guild_id)
         item = AudioItem(
@@ -94,6 +170,9 @@ class AudioManager:
             user_id=user_id,
             guild_id=guild_id,
             effect=effect,
+            priority=priority,
+            ffmpeg_options=ffmpeg_options,
+            message_id=message_id,
         )
         return await queue.add(item)
 
@@ -137,8 +216,8 @@ class AudioManager:
                 )
 
         try:
-            ffmpeg_options = None
-            if item.effect != "none":
+            ffmpeg_options = item.ffmpeg_options
+            if ffmpeg_options is None and item.effect != "none":
                 ffmpeg_options = f"-af {item.effect}"
             audio_source = discord.FFmpegOpusAudio(
                 item.source,
@@ -146,6 +225,8 @@ class AudioManager:
                 options=ffmpeg_options,
             )
             voice_client.play(audio_source, after=after_playing)
+            self.started += 1
+            self.queue_wait_sum += time.perf_counter() - item.enqueued_at
         except Exception as e:
             logger.error(f"재생 시작 실패: {type(e).__name__}: {e}")
             item.cleanup_callback()
@@ -159,6 +240,17 @@ class AudioManager:
             return True
         return False
 
+    async def cancel_message(self, guild_id: int, message_id: int) -> bool:
+        """메시지 ID에 해당하는 대기 항목을 취소하고 즉시 정리한다."""
+        queue = self.queues.get(guild_id)
+        if queue is None:
+            return False
+        item = await queue.cancel(message_id)
+        if item is None:
+            return False
+        item.cleanup_callback()
+        return True
+
     async def clear_queue(self, guild_id: int) -> None:
         if guild_id in self.queues:
             queue = self.queues[guild_id]
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+from typing import Optional
+
+from config import (
+    AUDIO_POSTPROCESS_SILENCE_DB, AUDIO_POSTPROCESS_LOUDNESS_LUFS,
+    AUDIO_POSTPROCESS_TIMEOUT,
+)
+
+logger = logging.getLogger("tts-bot.postprocess")
+
+# MPEG 버전 비트 → 샘플레이트 표 (인덱스 0~2)
+_MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),  # MPEG-1
+    2: (22050, 24000, 16000),  # MPEG-2
+    0: (11025, 12000, 8000),   # MPEG-2.5
+}
+
+
+def probe_sample_rate(data: bytes) -> Optional[int]:
+    """WAV 헤더 또는 첫 MP3 프레임 헤더에서 샘플레이트를 읽는다."""
+    if data[:4] == b"RIFF" and data[8:12] == b"WAVE":
+        pos = 12
+        while pos + 8 <= len(data):
+            chunk_id = data[pos:pos + 4]
+            chunk_size = int.from_bytes(data[pos + 4:pos + 8], "little")
+            if chunk_id == b"fmt " and pos + 16 <= len(data):
+                return int.from_bytes(data[pos + 12:pos + 16], "little")
+            pos += 8 + chunk_size + (chunk_size & 1)
+        return None
+
+    pos = 0
+    if data[:3] == b"ID3" and len(data) >= 10:
+        size = 0
+        for b in data[6:10]:
+            size = (size << 7) | (b & 0x7F)
+        pos = 10 + size
+    end = min(len(data) - 3, pos + 4096)
+    while pos < end:
+        if data[pos] == 0xFF and data[pos + 1] & 0xE0 == 0xE0:
+            version = (data[pos + 1] >> 3) & 0x03
+            index = (data[pos + 2] >> 2) & 0x03
+            if version in _MP3_SAMPLE_RATES and index < 3:
+                return _MP3_SAMPLE_RATES[version][index]
+        pos += 1
+    return None
+
+
+class AudioPostProcessor:
+    """캐시 저장 시 1회만 무음 구간을 잘라내고 음량을 정규화한다.
+
+    FFmpeg silenceremove(앞/뒤) + loudnorm을 적용하며, 재생 시 적용되는
+    음성 효과가 달라지지 않도록 원본 샘플레이트와 컨테이너(MP3/WAV)를 유지한다.
+    FFmpeg를 실행할 수 없으면 이후 요청은 원본을 그대로 반환한다.
+    """
+
+    def __init__(self, max_concurrency: int = 2):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._available = True
+
+    @staticmethod
+    def _filter_chain(sample_rate: int) -> str:
+        threshold = f"{AUDIO_POSTPROCESS_SILENCE_DB}dB"
+        trim = f"silenceremove=start_periods=1:start_threshold={threshold}:start_silence=0.05"
+        return (
+            f"{trim},areverse,{trim},areverse,"
+            f"loudnorm=I={AUDIO_POSTPROCESS_LOUDNESS_LUFS}:TP=-1.5:LRA=11,"
+            f"aresample={sample_rate}"
+        )
+
+    async def process(self, data: bytes) -> bytes:
+        """처리된 오디오를 반환한다. 실패 시 원본을 그대로 반환한다."""
+        if not self._available:
+            return data
+        sample_rate = probe_sample_rate(data)
+        if sample_rate is None:
+            return data
+
+        if data[:4] == b"RIFF":
+            output_args = ["-c:a", "pcm_s16le", "-f", "wav"]
+        else:
+            output_args = ["-c:a", "libmp3lame", "-q:a", "4", "-f", "mp3"]
+
+        args = [
+            "ffmpeg", "-hide_banner", "-loglevel", "error",
+            "-i", "pipe:0",
+            "-af", self._filter_chain(sample_rate),
+            *output_args, "pipe:1",
+        ]
+
+        async with self._semaphore:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *args,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+            except (FileNotFoundError, PermissionError) as e:
+                logger.warning(f"FFmpeg 실행 불가, 오디오 후처리 비활성화: {e}")
+                self._available = False
+                return data
+
+            try:
+                out, err = await asyncio.wait_for(
+                    proc.communicate(data), timeout=AUDIO_POSTPROCESS_TIMEOUT,
+                )
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                proc.kill()
+                await proc.wait()
+                raise
+
+        if proc.returncode != 0 or not out:
+            logger.warning(f"오디오 후처리 실패 (code {proc.returncode}): {err[:200]!r}")
+            return data
+        return out
@@ -0,0 +1,122 @@
+import json
+import logging
+import mmap
+import os
+import time
+import zlib
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+logger = logging.getLogger("tts-bot.snapshot")
+
+# 형식이 바뀌면 올린다 (버전이 다른 스냅샷은 무시)
+SNAPSHOT_VERSION = 1
+
+INDEX_FILE = "index.json"
+# 인덱스에 data_file이 없는 이전 스냅샷의 데이터 파일 이름
+LEGACY_DATA_FILE = "data.bin"
+DATA_FILE_PATTERN = "data-*.bin"
+
+
+class SnapshotEntry(NamedTuple):
+    """스냅샷 항목. data는 mmap 위의 memoryview이며 crc32는 처음 읽을 때 검증한다."""
+
+    key: str
+    data: memoryview
+    crc32: int
+
+
+def write_snapshot(directory: Path, entries: Iterable[tuple[str, bytes]]) -> int:
+    """캐시 항목을 데이터 파일 하나와 인덱스로 저장하고 저장한 항목 수를 반환한다.
+
+    entries는 LRU 순서(오래된 것부터)로 전달한다. 데이터는 매번 새 이름의 파일에 쓰고
+    인덱스 교체로 확정하므로, 복원한 항목이 아직 mmap으로 잡고 있는 이전 데이터 파일을
+    덮어쓰지 않는다 (Windows에서는 매핑된 파일을 교체할 수 없음). 중간에 실패하면 이전 스냅샷이 남는다.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    index = []
+    offset = 0
+    data_name = f"data-{time.time_ns():x}.bin"
+    with open(directory / data_name, "wb") as f:
+        for key, data in entries:
+            f.write(data)
+            index.append([key, offset, len(data), zlib.crc32(data)])
+            offset += len(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+    payload = {
+        "version": SNAPSHOT_VERSION,
+        "created": time.time(),
+        "data_file": data_name,
+        "data_size": offset,
+        "entries": index,
+    }
+    index_tmp = directory / (INDEX_FILE + ".tmp")
+    with open(index_tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+        f.flush()
+        os.fsync(f.fileno())
+
+    index_tmp.replace(directory / INDEX_FILE)
+    _remove_stale_data_files(directory, keep=data_name)
+    return len(index)
+
+
+def _remove_stale_data_files(directory: Path, keep: str) -> None:
+    """현재 인덱스가 가리키지 않는 데이터 파일을 지운다.
+
+    아직 매핑된 파일은 (Windows에서) 지울 수 없으므로 건너뛰고 다음 저장 때 다시 시도한다.
+    """
+    stale = [*directory.glob(DATA_FILE_PATTERN), directory / LEGACY_DATA_FILE]
+    for path in stale:
+        if path.name == keep or not path.exists():
+            continue
+        try:
+            path.unlink()
+        except OSError as e:
+            logger.debug(f"이전 스냅샷 데이터 파일 삭제 보류 ({path.name}): {e}")
+
+
+def read_snapshot(directory: Path) -> list[SnapshotEntry]:
+    """스냅샷을 mmap으로 연다. 오디오 데이터는 실제로 접근할 때 페이지 단위로 읽힌다.
+
+    mmap은 항목의 memoryview가 모두 사라지면 함께 해제된다.
+    스냅샷이 없거나 버전/크기가 맞지 않으면 빈 목록을 반환한다.
+    """
+    index_path = directory / INDEX_FILE
+    if not index_path.exists():
+        return []
+
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"캐시 스냅샷 인덱스 읽기 실패, 무시: {e}")
+        return []
+
+    if index.get("version") != SNAPSHOT_VERSION:
+        logger.info(f"캐시 스냅샷 버전 불일치 ({index.get('version')}), 무시")
+        return []
+
+    # 인덱스에 적힌 파일 이름만 쓴다 (경로 구성요소는 무시)
+    data_path = directory / Path(index.get("data_file", LEGACY_DATA_FILE)).name
+    if not data_path.exists():
+        return []
+
+    data_size = index.get("data_size", -1)
+    if data_path.stat().st_size != data_size:
+        logger.warning("캐시 스냅샷 데이터 크기 불일치, 무시")
+        return []
+    if data_size == 0:
+        return []
+
+    with open(data_path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    entries = [
+        SnapshotEntry(key, view[offset:offset + length], crc)
+        for key, offset, length, crc in index["entries"]
+        if offset + length <= data_size
+    ]
+    return entries
@@ -0,0 +1,137 @@
+import asyncio
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+import discord
+from discord import app_commands
+
+from config import COMMAND_SYNC_STATE_PATH, COMMAND_SYNC_CONCURRENCY
+
+logger = logging.getLogger("tts-bot.sync")
+
+
+class CommandSyncer:
+    """슬래시 명령어를 서버별로 동기화하되, 바뀐 서버만 동시에 처리한다.
+
+    전역 명령어 트리의 해시를 서버별로 data/command_sync.json에 저장해 두고,
+    재시작 시 해시가 같은 서버는 건너뛴다. 동시 요청 수는 세마포어로 제한하며
+    429 응답은 discord.py HTTP 클라이언트가 대기 후 재시도한다.
+    """
+
+    # 전역 명령어를 비워둔 상태를 나타내는 키
+    _GLOBAL_CLEARED = "global_cleared"
+
+    def __init__(
+        self,
+        tree: app_commands.CommandTree,
+        state_path: Path = COMMAND_SYNC_STATE_PATH,
+        concurrency: int = COMMAND_SYNC_CONCURRENCY,
+    ):
+        self.tree = tree
+        self.state_path = state_path
+        self._semaphore = asyncio.Semaphore(concurrency)
+        # copy_global_to와 전역 트리 초기화/복원이 겹치지 않도록 보호
+        self._tree_lock = asyncio.Lock()
+        self._save_lock = asyncio.Lock()
+        self._state = self._load_state()
+        self._tree_hash: str | None = None
+
+    def _load_state(self) -> dict:
+        if not self.state_path.exists():
+            return {"guilds": {}}
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"명령어 동기화 상태 파일 읽기 실패, 전체 동기화: {e}")
+            return {"guilds": {}}
+        state.setdefault("guilds", {})
+        return state
+
+    def _write_state(self, payload: str) -> None:
+        tmp = self.state_path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(payload)
+        tmp.replace(self.state_path)
+
+    async def _save_state(self) -> None:
+        async with self._save_lock:
+            payload = json.dumps(self._state, ensure_ascii=False, indent=2)
+            try:
+                await asyncio.to_thread(self._write_state, payload)
+            except OSError as e:
+                logger.error(f"명령어 동기화 상태 저장 실패: {e}")
+
+    def tree_hash(self) -> str:
+        """현재 전역 명령어 트리의 해시 (명령어 정의가 바뀌면 달라진다)."""
+        if self._tree_hash is None:
+            payload = sorted(
+                (cmd.to_dict(self.tree) for cmd in self.tree.get_commands()),
+                key=lambda c: c["name"],
+            )
+            self._tree_hash = hashlib.sha256(
+                json.dumps(payload, sort_keys=True, ensure_ascii=False).encode()
+            ).hexdigest()
+        return self._tree_hash
+
+    async def _sync_guild(self, guild: discord.Guild, digest: str) -> bool:
+        async with self._semaphore:
+            try:
+                async with self._tree_lock:
+                    self.tree.copy_global_to(guild=guild)
+                synced = await self.tree.sync(guild=guild)
+            except Exception as e:
+                logger.error(f"명령어 동기화 실패 ({guild.name}): {e}")
+                return False
+        self._state["guilds"][str(guild.id)] = digest
+        logger.info(f"명령어 {len(synced)}개 동기화 완료: {guild.name} ({guild.id})")
+        return True
+
+    async def _clear_global(self, digest: str) -> None:
+        """오래된 전역 명령어를 제거한다 (트리 상태 저장 → 초기화 → 빈 상태 동기화 → 복원)."""
+        if self._state.get(self._GLOBAL_CLEARED) == digest:
+            return
+        async with self._tree_lock:
+            global_cmds = self.tree.get_commands()
+            self.tree.clear_commands(guild=None)
+            try:
+                await self.tree.sync()
+            except Exception as e:
+                logger.error(f"전역 명령어 정리 실패: {e}")
+                return
+            finally:
+                for cmd in global_cmds:
+                    self.tree.add_command(cmd)
+        self._state[self._GLOBAL_CLEARED] = digest
+
+    async def sync_all(self, guilds: list[discord.Guild]) -> None:
+        """해시가 달라진 서버만 동시에 동기화하고 결과를 저장한다."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        digest = self.tree_hash()
+        known = self._state["guilds"]
+        stale = [g for g in guilds if known.get(str(g.id)) != digest]
+
+        results = await asyncio.gather(*(self._sync_guild(g, digest) for g in stale))
+        await self._clear_global(digest)
+        await self._save_state()
+
+        logger.info(
+            f"명령어 동기화: {sum(results)}/{len(stale)}개 서버 갱신, "
+            f"{len(guilds) - len(stale)}개 변경 없음 ({loop.time() - started:.1f}초)"
+        )
+
+    async def sync_guild(self, guild: discord.Guild) -> None:
+        """새로 참가한 서버 하나를 동기화한다 (이미 최신이면 건너뜀)."""
+        digest = self.tree_hash()
+        if self._state["guilds"].get(str(guild.id)) == digest:
+            return
+        if await self._sync_guild(guild, digest):
+            await self._save_state()
+
+    async def forget_guild(self, guild: discord.Guild) -> None:
+        """서버에서 나가면 저장된 해시를 지워 다시 참가할 때 동기화되게 한다."""
+        if self._state["guilds"].pop(str(guild.id), None) is not None:
+            await self._save_state()
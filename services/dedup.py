@@ -0,0 +1,64 @@
+import time
+from collections import OrderedDict
+
+from config import DEDUP_WINDOW_SECONDS, DEDUP_MAX_ENTRIES
+
+
+class DuplicateSuppressor:
+    """서버별 슬라이딩 윈도우로 같은 문장·목소리의 반복 읽기를 억제한다.
+
+    서버마다 (정규화 문장, 목소리) → 마지막으로 읽은 시각을 최대 max_entries개까지
+    LRU로 기억하므로 도배가 길어져도 메모리가 일정하다.
+    반복이 window초 안에 계속 들어오면 윈도우가 연장되어 한 번만 읽힌다.
+    """
+
+    # 이 시간 이상 메시지가 없는 서버의 기록은 정리한다
+    _IDLE_PRUNE_SECONDS = 300
+
+    def __init__(
+        self,
+        window: float = DEDUP_WINDOW_SECONDS,
+        max_entries: int = DEDUP_MAX_ENTRIES,
+    ):
+        self.window = window
+        self.max_entries = max_entries
+        self._guilds: dict[int, OrderedDict[tuple[str, str], float]] = {}
+        self._last_seen: dict[int, float] = {}
+        self._last_prune = time.monotonic()
+        self.suppressed = 0
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return " ".join(text.split()).casefold()
+
+    def check(self, guild_id: int, text: str, voice: str) -> bool:
+        """읽어야 하면 True, 윈도우 안의 반복이면 False를 반환하고 기록을 갱신한다."""
+        if self.window <= 0:
+            return True
+        now = time.monotonic()
+        if now - self._last_prune > self._IDLE_PRUNE_SECONDS:
+            self._prune(now)
+
+        recent = self._guilds.get(guild_id)
+        if recent is None:
+            recent = self._guilds[guild_id] = OrderedDict()
+        self._last_seen[guild_id] = now
+
+        key = (self._normalize(text), voice)
+        last = recent.get(key)
+        recent[key] = now
+        recent.move_to_end(key)
+        if last is not None and now - last < self.window:
+            self.suppressed += 1
+            return False
+
+        if len(recent) > self.max_entries:
+            recent.popitem(last=False)
+        return True
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self._IDLE_PRUNE_SECONDS
+        for guild_id in [g for g, t in self._last_seen.items() if t < cutoff]:
+            del self._last_seen[guild_id]
+            self._guilds.pop(guild_id, None)
+        self._last_prune = now
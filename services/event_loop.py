@@ -0,0 +1,44 @@
+import asyncio
+import logging
+import sys
+from typing import Any, Coroutine
+
+from config import EVENT_LOOP
+
+logger = logging.getLogger("tts-bot.loop")
+
+
+def _import_uvloop():
+    try:
+        import uvloop
+    except ImportError:
+        logger.warning("uvloop이 설치되어 있지 않아 기본 asyncio 루프를 사용합니다")
+        return None
+    return uvloop
+
+
+def resolve_loop(name: str = EVENT_LOOP) -> str:
+    """실제로 사용할 이벤트 루프 이름을 반환한다 (uvloop이 없으면 "asyncio")."""
+    if name == "uvloop":
+        return "uvloop" if _import_uvloop() is not None else "asyncio"
+    if name != "asyncio":
+        logger.warning(f"알 수 없는 EVENT_LOOP 값 '{name}', 기본 asyncio 루프를 사용합니다")
+    return "asyncio"
+
+
+def run(main: Coroutine[Any, Any, Any], loop: str = EVENT_LOOP) -> Any:
+    """설정된 이벤트 루프에서 코루틴을 실행한다 (asyncio.run 대체)."""
+    uvloop = _import_uvloop() if resolve_loop(loop) == "uvloop" else None
+    if uvloop is None:
+        return asyncio.run(main)
+
+    logger.info("uvloop 이벤트 루프 사용")
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(main)
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    try:
+        return asyncio.run(main)
+    finally:
+        asyncio.set_event_loop_policy(None)
@@ -0,0 +1,83 @@
+import asyncio
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class ExecutorSaturated(RuntimeError):
+    """executor의 작업 슬롯과 대기열이 모두 찼을 때 발생한다."""
+
+
+class InstrumentedExecutor:
+    """작업 종류별 전용 스레드 풀. 대기/실행 시간을 집계하고, 포화되면 작업을 거절한다.
+
+    기본 executor 하나를 모두가 나눠 쓰면 느린 블로킹 작업(gTTS 요청 등)이
+    짧아야 하는 작업(파일 저장 등)을 굶길 수 있으므로 용도별로 나눈다.
+    카운터는 모두 이벤트 루프 스레드에서만 갱신한다.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int | None = None):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{name}-executor")
+        self.pending = 0          # 제출되어 아직 끝나지 않은 작업 (실행 중 + 대기 중)
+        self.completed = 0
+        self.rejected = 0
+        self.queue_wait_sum = 0.0
+        self.run_time_sum = 0.0
+
+    @property
+    def queued(self) -> int:
+        """스레드를 기다리는 작업 수 (근사치)."""
+        return max(0, self.pending - self.max_workers)
+
+    @property
+    def saturated(self) -> bool:
+        return self.max_queue is not None and self.queued >= self.max_queue
+
+    def _observe(self, submitted: float, timings: list[tuple[float, float]]) -> None:
+        self.pending -= 1
+        if timings:
+            started, finished = timings[0]
+            self.completed += 1
+            self.queue_wait_sum += started - submitted
+            self.run_time_sum += finished - started
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """fn(*args)를 이 풀에서 실행하고 결과를 기다린다.
+
+        대기열이 가득 차 있으면 제출하지 않고 ExecutorSaturated를 던진다.
+        기다리던 쪽이 취소되어도 이미 시작된 작업은 끝까지 실행되며, 끝난 뒤에 집계된다.
+        """
+        if self.saturated:
+            self.rejected += 1
+            raise ExecutorSaturated(f"{self.name} executor 포화 (대기 {self.queued}개)")
+
+        loop = asyncio.get_running_loop()
+        submitted = time.perf_counter()
+        timings: list[tuple[float, float]] = []
+
+        def _call() -> T:
+            started = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                timings.append((started, time.perf_counter()))
+
+        def _done(_: Future) -> None:
+            try:
+                loop.call_soon_threadsafe(self._observe, submitted, timings)
+            except RuntimeError:
+                pass  # 루프가 이미 닫힘
+
+        future = self._executor.submit(_call)
+        self.pending += 1
+        future.add_done_callback(_done)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        """대기 중인 작업은 취소하고, 실행 중인 작업은 기다리지 않고 풀을 닫는다."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
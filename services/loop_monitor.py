@@ -0,0 +1,181 @@
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+
+from config import (
+    BASE_DIR, LOOP_LAG_INTERVAL, LOOP_STALL_THRESHOLD, LOOP_STALL_CHECK_INTERVAL,
+    LOOP_STALL_REPORT_INTERVAL, LOOP_STALL_REPORT_TOP,
+)
+
+logger = logging.getLogger("tts-bot.loop")
+
+_PROJECT_ROOT = str(BASE_DIR) + os.sep
+
+
+class StallSite:
+    """블로킹 호출 위치별 멈춤 횟수, 누적/최대 시간, 마지막으로 잡힌 스택."""
+
+    __slots__ = ("count", "total", "max", "stack")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.stack: list[str] = []
+
+
+def _is_project_file(filename: str) -> bool:
+    return filename.startswith(_PROJECT_ROOT) and "site-packages" not in filename
+
+
+def _call_site(stack: traceback.StackSummary) -> str:
+    """스택에서 멈춤의 원인으로 볼 위치를 고른다.
+
+    가장 안쪽의 프로젝트 코드 줄을 기준으로 하고, 실제로 블로킹 중인 함수가
+    표준 라이브러리/외부 패키지에 있으면 "→ 모듈.함수"를 덧붙인다.
+    """
+    leaf = stack[-1]
+    leaf_name = f"{os.path.splitext(os.path.basename(leaf.filename))[0]}.{leaf.name}"
+    for frame in reversed(stack):
+        if _is_project_file(frame.filename):
+            site = f"{os.path.relpath(frame.filename, BASE_DIR)}:{frame.lineno} ({frame.name})"
+            return site if frame is leaf else f"{site} → {leaf_name}"
+    return f"{leaf_name} ({os.path.basename(leaf.filename)}:{leaf.lineno})"
+
+
+class LoopLagMonitor:
+    """주기적으로 sleep하며 이벤트 루프 지연(예정 시각 대비 깨어난 시각)을 측정한다.
+
+    stall_threshold가 0보다 크면 감시 스레드가 루프에 주기적으로 콜백을 보내고,
+    그 시간 안에 실행되지 않으면 루프 스레드의 스택을 잡아 블로킹 호출 위치별로 집계한다.
+    """
+
+    def __init__(
+        self,
+        interval: float = LOOP_LAG_INTERVAL,
+        stall_threshold: float = LOOP_STALL_THRESHOLD,
+        check_interval: float = LOOP_STALL_CHECK_INTERVAL,
+        report_interval: float = LOOP_STALL_REPORT_INTERVAL,
+    ):
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self.check_interval = check_interval
+        self.report_interval = report_interval
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.stalls = 0
+        self.stall_seconds = 0.0
+        self.sites: dict[str, StallSite] = {}
+        self._sites_lock = threading.Lock()
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._watchdog_stop = threading.Event()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        if self.stall_threshold > 0 and self._watchdog is None:
+            self._watchdog_stop.clear()
+            self._watchdog = threading.Thread(
+                target=self._watch,
+                args=(asyncio.get_running_loop(), threading.get_ident()),
+                name="loop-watchdog",
+                daemon=True,
+            )
+            self._watchdog.start()
+
+    async def _run(self) -> None:
+        next_report = time.perf_counter() + self.report_interval
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.perf_counter()
+            self.lag = max(0.0, now - expected)
+            if self.lag > self.max_lag:
+                self.max_lag = self.lag
+            if now >= next_report:
+                next_report = now + self.report_interval
+                self.log_report()
+
+    # --- 멈춤 감시 (감시 스레드에서 실행) ---
+
+    def _watch(self, loop: asyncio.AbstractEventLoop, loop_thread_id: int) -> None:
+        stop = self._watchdog_stop
+        while not stop.wait(self.check_interval):
+            pong = threading.Event()
+            sent = time.perf_counter()
+            try:
+                loop.call_soon_threadsafe(pong.set)
+            except RuntimeError:
+                return  # 루프가 닫힘
+            if pong.wait(self.stall_threshold):
+                continue
+
+            # 임계값 안에 콜백이 실행되지 않음 → 지금 루프 스레드가 실행 중인 스택이 원인
+            frame = sys._current_frames().get(loop_thread_id)
+            if frame is None:
+                continue
+            try:
+                stack = traceback.extract_stack(frame)
+            except Exception:
+                continue
+            finally:
+                del frame
+            if not stack:
+                continue
+
+            while not pong.wait(self.check_interval):
+                if stop.is_set():
+                    return
+            self._record(stack, time.perf_counter() - sent)
+
+    def _record(self, stack: traceback.StackSummary, duration: float) -> None:
+        site = _call_site(stack)
+        with self._sites_lock:
+            entry = self.sites.get(site)
+            if entry is None:
+                entry = self.sites[site] = StallSite()
+            entry.count += 1
+            entry.total += duration
+            entry.max = max(entry.max, duration)
+            entry.stack = stack.format()[-8:]
+            self.stalls += 1
+            self.stall_seconds += duration
+        logger.warning(f"이벤트 루프 {duration * 1000:.0f}ms 멈춤: {site}")
+        logger.debug("멈춤 시점 스택:\n" + "".join(entry.stack))
+
+    def top_sites(self, limit: int = LOOP_STALL_REPORT_TOP) -> list[tuple[str, StallSite]]:
+        """누적 멈춤 시간이 긴 순서로 블로킹 호출 위치를 반환한다."""
+        with self._sites_lock:
+            items = list(self.sites.items())
+        items.sort(key=lambda item: item[1].total, reverse=True)
+        return items[:limit]
+
+    def log_report(self) -> None:
+        top = self.top_sites()
+        if not top:
+            return
+        lines = [f"이벤트 루프 멈춤 상위 {len(top)}곳 (총 {self.stalls}회, {self.stall_seconds:.2f}초):"]
+        for site, entry in top:
+            lines.append(
+                f"  {entry.total:7.2f}s  {entry.count:5d}회  최대 {entry.max * 1000:6.0f}ms  {site}"
+            )
+        logger.warning("\n".join(lines))
+
+    async def stop(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        if self._watchdog is not None:
+            self._watchdog_stop.set()
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+            self.log_report()
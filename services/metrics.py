@@ -0,0 +1,187 @@
+import asyncio
+import logging
+from typing import Callable
+
+from config import METRICS_HOST, METRICS_PORT, SYNTH_WAIT_BUCKETS
+
+logger = logging.getLogger("tts-bot.metrics")
+
+
+class _MetricWriter:
+    """Prometheus 텍스트 포맷(0.0.4) 출력을 메트릭 패밀리별로 모아 누적한다."""
+
+    def __init__(self) -> None:
+        self._families: dict[str, tuple[str, str, list[str]]] = {}
+
+    def sample(
+        self,
+        name: str,
+        kind: str,
+        help_text: str,
+        value: float,
+        labels: dict[str, str] | None = None,
+        suffix: str = "",
+    ) -> None:
+        if name not in self._families:
+            self._families[name] = (kind, help_text, [])
+        lines = self._families[name][2]
+        if labels:
+            label_str = ",".join(f'{k}="{v}"' for k, v in labels.items())
+            lines.append(f"{name}{suffix}{{{label_str}}} {value}")
+        else:
+            lines.append(f"{name}{suffix} {value}")
+
+    def render(self) -> str:
+        out: list[str] = []
+        for name, (kind, help_text, lines) in self._families.items():
+            out.append(f"# HELP {name} {help_text}")
+            out.append(f"# TYPE {name} {kind}")
+            out.extend(lines)
+        return "\n".join(out) + "\n"
+
+
+def _executor_queue_depth(loop: asyncio.AbstractEventLoop) -> int:
+    """기본 executor에 대기 중인 작업 수를 반환한다."""
+    executor = getattr(loop, "_default_executor", None)
+    work_queue = getattr(executor, "_work_queue", None)
+    return work_queue.qsize() if work_queue is not None else 0
+
+
+def render_metrics(bot) -> str:
+    """봇의 서비스 상태를 스크레이프 시점에 읽어 Prometheus 텍스트로 변환한다.
+
+    핫패스에서는 정수 카운터만 증가시키고, 집계는 모두 여기서 수행한다.
+    """
+    w = _MetricWriter()
+
+    for guild_id, queue in list(bot.audio_manager.queues.items()):
+        labels = {"guild": str(guild_id)}
+        w.sample("panguri_queue_depth", "gauge", "서버별 대기 중인 오디오 항목 수", len(queue), labels)
+        w.sample("panguri_queue_playing", "gauge", "서버별 재생 중 여부 (1/0)", int(queue.is_playing), labels)
+
+    audio_manager = bot.audio_manager
+    w.sample("panguri_queue_wait_seconds", "summary", "큐 추가부터 재생 시작까지 대기시간 (초)", round(audio_manager.queue_wait_sum, 6), suffix="_sum")
+    w.sample("panguri_queue_wait_seconds", "summary", "큐 추가부터 재생 시작까지 대기시간 (초)", audio_manager.started, suffix="_count")
+
+    tts_engine = bot.tts_engine
+    cache = tts_engine._cache
+    w.sample("panguri_audio_cache_entries", "gauge", "오디오 캐시 항목 수", len(cache))
+    w.sample("panguri_audio_cache_bytes", "gauge", "오디오 캐시 총 바이트", cache.total_bytes)
+    w.sample("panguri_audio_cache_hits_total", "counter", "오디오 캐시 히트 수", cache.hits)
+    w.sample("panguri_audio_cache_misses_total", "counter", "오디오 캐시 미스 수", cache.misses)
+    w.sample("panguri_audio_cache_evictions_total", "counter", "오디오 캐시 축출 수", cache.evictions)
+
+    for engine, stats in tts_engine.stats.items():
+        labels = {"engine": engine}
+        w.sample("panguri_tts_requests_total", "counter", "엔진별 업스트림 합성 요청 수", stats.requests, labels)
+        w.sample("panguri_tts_errors_total", "counter", "엔진별 업스트림 합성 실패 수", stats.errors, labels)
+        w.sample("panguri_tts_latency_seconds", "summary", "엔진별 합성 지연시간 (초)", round(stats.latency_sum, 6), labels, suffix="_sum")
+        w.sample("panguri_tts_latency_seconds", "summary", "엔진별 합성 지연시간 (초)", stats.requests, labels, suffix="_count")
+
+    scheduler = bot.synthesis_scheduler
+    for name, slots in scheduler.engines.items():
+        labels = {"engine": name}
+        w.sample("panguri_synthesis_active", "gauge", "엔진별 진행 중인 합성 수", slots.active, labels)
+        w.sample("panguri_synthesis_waiting", "gauge", "엔진별 슬롯을 기다리는 합성 수", slots.waiting, labels)
+        cumulative = 0
+        for bound, count in zip(SYNTH_WAIT_BUCKETS, slots.wait_buckets):
+            cumulative += count
+            w.sample("panguri_synthesis_wait_seconds", "histogram", "합성 슬롯 대기시간 (초)", cumulative, {**labels, "le": str(bound)}, suffix="_bucket")
+        w.sample("panguri_synthesis_wait_seconds", "histogram", "합성 슬롯 대기시간 (초)", slots.granted, {**labels, "le": "+Inf"}, suffix="_bucket")
+        w.sample("panguri_synthesis_wait_seconds", "histogram", "합성 슬롯 대기시간 (초)", round(slots.wait_sum, 6), labels, suffix="_sum")
+        w.sample("panguri_synthesis_wait_seconds", "histogram", "합성 슬롯 대기시간 (초)", slots.granted, labels, suffix="_count")
+    w.sample("panguri_synthesis_cache_bypass_total", "counter", "캐시에 있어 슬롯 없이 바로 처리한 합성 수", scheduler.cache_bypassed)
+
+    w.sample("panguri_sovits_in_flight", "gauge", "진행 중인 GPT-SoVITS 요청 수", tts_engine.sovits_client.in_flight)
+
+    w.sample(
+        "panguri_executor_queue_depth", "gauge", "executor 대기 작업 수",
+        _executor_queue_depth(bot.loop), {"executor": "default"},
+    )
+    for name, executor in tts_engine.executors.items():
+        labels = {"executor": name}
+        w.sample("panguri_executor_queue_depth", "gauge", "executor 대기 작업 수", executor.queued, labels)
+        w.sample("panguri_executor_pending", "gauge", "executor에 제출되어 끝나지 않은 작업 수", executor.pending, labels)
+        w.sample("panguri_executor_rejected_total", "counter", "executor 포화로 거절한 작업 수", executor.rejected, labels)
+        w.sample("panguri_executor_queue_wait_seconds", "summary", "executor 제출부터 실행 시작까지 대기시간 (초)", round(executor.queue_wait_sum, 6), labels, suffix="_sum")
+        w.sample("panguri_executor_queue_wait_seconds", "summary", "executor 제출부터 실행 시작까지 대기시간 (초)", executor.completed, labels, suffix="_count")
+        w.sample("panguri_executor_run_seconds", "summary", "executor 작업 실행 시간 (초)", round(executor.run_time_sum, 6), labels, suffix="_sum")
+        w.sample("panguri_executor_run_seconds", "summary", "executor 작업 실행 시간 (초)", executor.completed, labels, suffix="_count")
+
+    limiter = bot.rate_limiter
+    w.sample("panguri_rate_limit_allowed_total", "counter", "속도 제한을 통과한 메시지 수", limiter.allowed)
+    w.sample("panguri_rate_limit_dropped_total", "counter", "속도 제한으로 버린 메시지 수", limiter.dropped_user, {"scope": "user"})
+    w.sample("panguri_rate_limit_dropped_total", "counter", "속도 제한으로 버린 메시지 수", limiter.dropped_guild, {"scope": "guild"})
+
+    dedup = bot.dedup
+    w.sample("panguri_duplicates_suppressed_total", "counter", "중복으로 생략한 메시지 수", dedup.suppressed)
+
+    monitor = getattr(bot, "loop_monitor", None)
+    if monitor is not None:
+        w.sample("panguri_event_loop_lag_seconds", "gauge", "최근 이벤트 루프 지연 (초)", round(monitor.lag, 6))
+        w.sample("panguri_event_loop_lag_max_seconds", "gauge", "최대 이벤트 루프 지연 (초)", round(monitor.max_lag, 6))
+        w.sample("panguri_event_loop_stalls_total", "counter", "임계값을 넘긴 이벤트 루프 멈춤 횟수", monitor.stalls)
+        w.sample("panguri_event_loop_stall_seconds_total", "counter", "이벤트 루프 멈춤 누적 시간 (초)", round(monitor.stall_seconds, 6))
+
+    return w.render()
+
+
+class MetricsServer:
+    """로컬 루프백에만 바인딩되는 최소 HTTP 서버 (GET /metrics)."""
+
+    def __init__(
+        self,
+        render: Callable[[], str],
+        host: str = METRICS_HOST,
+        port: int = METRICS_PORT,
+    ):
+        self._render = render
+        self.host = host
+        self.port = port
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        sock = self._server.sockets[0]
+        self.port = sock.getsockname()[1]
+        logger.info(f"메트릭 엔드포인트 시작: http://{self.host}:{self.port}/metrics")
+
+    async def _handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            # 나머지 헤더는 읽고 버린다
+            while True:
+                line = await asyncio.wait_for(reader.readline(), timeout=5)
+                if not line or line in (b"\r\n", b"\n"):
+                    break
+
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":
+                status = "200 OK"
+                body = self._render().encode("utf-8")
+            else:
+                status = "404 Not Found"
+                body = b"not found\n"
+
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: close\r\n\r\n".encode("latin-1")
+                + body
+            )
+            await writer.drain()
+        except Exception as e:
+            logger.debug(f"메트릭 요청 처리 실패: {e}")
+        finally:
+            writer.close()
+
+    async def close(self) -> None:
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import CodeType, FrameType
+
+from config import PROFILE_DIR, PROFILE_SAMPLE_INTERVAL, PROFILE_MAX_SECONDS
+
+logger = logging.getLogger("tts-bot.profiler")
+
+# 기본 프로파일 대상: (파일 이름, 함수 이름). 스택에 이 중 하나가 있을 때만 샘플을 기록한다
+# _handle_message는 새 메시지와 수정 후 다시 읽기를 모두 지나고, edge-tts 스트리밍은
+# 별도 태스크(_writer)에서 진행되므로 따로 넣는다
+DEFAULT_TARGETS = frozenset({
+    ("auto_read_cog.py", "_handle_message"),
+    ("tts_engine.py", "synthesize_prepared"),
+    ("tts_engine.py", "_writer"),
+    ("audio_manager.py", "play_next"),
+})
+
+
+def _frame_label(code: CodeType) -> str:
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class SamplingProfiler:
+    """이벤트 루프 스레드의 스택을 주기적으로 샘플링해 collapsed stack 파일로 저장한다.
+
+    run()이 호출된 동안에만 샘플링 스레드가 존재하므로, 꺼져 있을 때는 비용이 없다.
+    결과는 flamegraph.pl / speedscope 등에서 바로 읽을 수 있는 "a;b;c 개수" 형식이다.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path = PROFILE_DIR,
+        interval: float = PROFILE_SAMPLE_INTERVAL,
+        targets: frozenset[tuple[str, str]] = DEFAULT_TARGETS,
+    ):
+        self.output_dir = output_dir
+        self.interval = interval
+        self.targets = targets
+        self._lock = asyncio.Lock()
+        self._is_target: dict[CodeType, bool] = {}
+
+    @property
+    def running(self) -> bool:
+        return self._lock.locked()
+
+    def _matches(self, code: CodeType) -> bool:
+        matched = self._is_target.get(code)
+        if matched is None:
+            matched = (os.path.basename(code.co_filename), code.co_name) in self.targets
+            self._is_target[code] = matched
+        return matched
+
+    def _sample(self, thread_id: int, stop: threading.Event, stacks: Counter) -> None:
+        """stop이 설정될 때까지 대상 스레드의 스택을 샘플링한다 (샘플링 스레드에서 실행)."""
+        while not stop.wait(self.interval):
+            frame: FrameType | None = sys._current_frames().get(thread_id)
+            codes = []
+            hit = False
+            while frame is not None:
+                code = frame.f_code
+                codes.append(code)
+                if not hit and self._matches(code):
+                    hit = True
+                frame = frame.f_back
+            if hit:
+                stacks[tuple(reversed(codes))] += 1
+
+    def _write(self, stacks: Counter) -> Path:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / f"profile-{time.strftime('%Y%m%d-%H%M%S')}.collapsed"
+        lines = Counter()
+        for codes, count in stacks.items():
+            lines[";".join(_frame_label(code) for code in codes)] += count
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in lines.most_common():
+                f.write(f"{stack} {count}\n")
+        return path
+
+    async def run(self, duration: float) -> tuple[Path, int] | None:
+        """duration초 동안 이벤트 루프를 샘플링하고 (결과 파일, 샘플 수)를 반환한다.
+
+        이미 실행 중이면 None을 반환한다.
+        """
+        if self.running:
+            return None
+        async with self._lock:
+            duration = min(max(duration, 0.0), PROFILE_MAX_SECONDS)
+            stacks: Counter = Counter()
+            stop = threading.Event()
+            sampler = threading.Thread(
+                target=self._sample,
+                args=(threading.get_ident(), stop, stacks),
+                name="profiler",
+                daemon=True,
+            )
+            logger.info(f"프로파일링 시작 ({duration:.0f}초, {self.interval * 1000:.0f}ms 간격)")
+            sampler.start()
+            try:
+                await asyncio.sleep(duration)
+            finally:
+                stop.set()
+                await asyncio.to_thread(sampler.join)
+
+            path = await asyncio.to_thread(self._write, stacks)
+            samples = sum(stacks.values())
+            logger.info(f"프로파일링 완료: 샘플 {samples}개 → {path}")
+            return path, samples
@@ -0,0 +1,86 @@
+import time
+
+from config import (
+    RATE_LIMIT_USER_RATE, RATE_LIMIT_USER_BURST,
+    RATE_LIMIT_GUILD_RATE, RATE_LIMIT_GUILD_BURST,
+)
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷."""
+
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, burst: float, now: float):
+        self.tokens = burst
+        self.updated = now
+
+    def take(self, rate: float, burst: float, now: float) -> bool:
+        self.tokens = min(burst, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class SynthesisRateLimiter:
+    """사용자별·서버별 토큰 버킷으로 합성 요청 수를 제한한다.
+
+    두 버킷을 모두 통과해야 허용되며, 사용자 버킷에서 거절되면 서버 토큰은 소모하지 않는다.
+    rate가 0 이하인 범위는 제한하지 않는다.
+    """
+
+    # 이 시간 이상 사용되지 않은 버킷은 다시 가득 찼다고 보고 정리한다
+    _IDLE_PRUNE_SECONDS = 300
+
+    def __init__(
+        self,
+        user_rate: float = RATE_LIMIT_USER_RATE,
+        user_burst: float = RATE_LIMIT_USER_BURST,
+        guild_rate: float = RATE_LIMIT_GUILD_RATE,
+        guild_burst: float = RATE_LIMIT_GUILD_BURST,
+    ):
+        self.user_rate = user_rate
+        self.user_burst = user_burst
+        self.guild_rate = guild_rate
+        self.guild_burst = guild_burst
+        self._users: dict[int, TokenBucket] = {}
+        self._guilds: dict[int, TokenBucket] = {}
+        self._last_prune = time.monotonic()
+        self.allowed = 0
+        self.dropped_user = 0
+        self.dropped_guild = 0
+
+    def allow(self, guild_id: int, user_id: int) -> bool:
+        """메시지 1개를 합성해도 되는지 확인하고 토큰을 소모한다."""
+        now = time.monotonic()
+        if now - self._last_prune > self._IDLE_PRUNE_SECONDS:
+            self._prune(now)
+
+        if self.user_rate > 0:
+            bucket = self._users.get(user_id)
+            if bucket is None:
+                bucket = self._users[user_id] = TokenBucket(self.user_burst, now)
+            if not bucket.take(self.user_rate, self.user_burst, now):
+                self.dropped_user += 1
+                return False
+
+        if self.guild_rate > 0:
+            bucket = self._guilds.get(guild_id)
+            if bucket is None:
+                bucket = self._guilds[guild_id] = TokenBucket(self.guild_burst, now)
+            if not bucket.take(self.guild_rate, self.guild_burst, now):
+                self.dropped_guild += 1
+                return False
+
+        self.allowed += 1
+        return True
+
+    def _prune(self, now: float) -> None:
+        """오래 사용되지 않은 버킷을 제거해 메모리를 일정하게 유지한다."""
+        cutoff = now - self._IDLE_PRUNE_SECONDS
+        for buckets in (self._users, self._guilds):
+            for key in [k for k, b in buckets.items() if b.updated < cutoff]:
+                del buckets[key]
+        self._last_prune = now
@@ -0,0 +1,257 @@
+import atexit
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+
+from config import SETTINGS_DB_PATH, SETTINGS_FLUSH_DELAY
+
+logger = logging.getLogger("tts-bot.settings")
+
+# 사용자 설정 컬럼 (user_settings.json의 키와 동일)
+USER_FIELDS = ("language", "slow", "voice", "rate", "pitch", "effect")
+
+# 채널 종류
+CHANNEL_AUTO_READ = "auto_read"
+CHANNEL_DESIGNATED = "designated"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS user_settings (
+    user_id  TEXT PRIMARY KEY,
+    language TEXT,
+    slow     INTEGER,
+    voice    TEXT,
+    rate     TEXT,
+    pitch    TEXT,
+    effect   TEXT
+);
+CREATE TABLE IF NOT EXISTS channels (
+    kind       TEXT    NOT NULL,
+    guild_id   TEXT    NOT NULL,
+    channel_id INTEGER NOT NULL,
+    PRIMARY KEY (kind, guild_id, channel_id)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class SettingsStore:
+    """SQLite(WAL) 기반 설정 저장소.
+
+    변경 시 전체 파일을 다시 쓰는 대신 해당 행만 upsert/delete한다.
+    최초 실행 시 기존 data/*.json 설정을 한 번 가져온다.
+    """
+
+    def __init__(self, path: Path = SETTINGS_DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    # --- 불러오기 ---
+
+    def load_user_settings(self) -> dict[str, dict]:
+        """모든 사용자 설정을 {user_id: {필드: 값}} 형태로 반환한다."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT user_id, {', '.join(USER_FIELDS)} FROM user_settings"
+            ).fetchall()
+        settings: dict[str, dict] = {}
+        for user_id, *values in rows:
+            entry = {k: v for k, v in zip(USER_FIELDS, values) if v is not None}
+            if "slow" in entry:
+                entry["slow"] = bool(entry["slow"])
+            settings[user_id] = entry
+        return settings
+
+    def load_channels(self, kind: str) -> dict[str, list[int]]:
+        """채널 목록을 {guild_id: [channel_id, ...]} 형태로 반환한다."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT guild_id, channel_id FROM channels WHERE kind = ? ORDER BY rowid",
+                (kind,),
+            ).fetchall()
+        channels: dict[str, list[int]] = {}
+        for guild_id, channel_id in rows:
+            channels.setdefault(guild_id, []).append(channel_id)
+        return channels
+
+    # --- 행 단위 저장 ---
+
+    def upsert_user(self, user_id: str, settings: dict) -> None:
+        """사용자 설정 1행을 저장한다."""
+        values = [settings.get(k) for k in USER_FIELDS]
+        with self._lock:
+            self._conn.execute(
+                f"INSERT INTO user_settings (user_id, {', '.join(USER_FIELDS)}) "
+                f"VALUES (?, {', '.join('?' for _ in USER_FIELDS)}) "
+                f"ON CONFLICT(user_id) DO UPDATE SET "
+                + ", ".join(f"{k} = excluded.{k}" for k in USER_FIELDS),
+                (user_id, *values),
+            )
+            self._conn.commit()
+
+    def apply_batch(
+        self,
+        users: dict[str, dict],
+        channels: dict[tuple[str, str, int], bool],
+    ) -> None:
+        """모인 변경사항을 하나의 트랜잭션으로 기록한다.
+
+        channels 값이 True면 추가, False면 삭제한다.
+        """
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    f"INSERT INTO user_settings (user_id, {', '.join(USER_FIELDS)}) "
+                    f"VALUES (?, {', '.join('?' for _ in USER_FIELDS)}) "
+                    f"ON CONFLICT(user_id) DO UPDATE SET "
+                    + ", ".join(f"{k} = excluded.{k}" for k in USER_FIELDS),
+                    [
+                        (user_id, *(entry.get(k) for k in USER_FIELDS))
+                        for user_id, entry in users.items()
+                    ],
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO channels (kind, guild_id, channel_id) VALUES (?, ?, ?)",
+                    [key for key, present in channels.items() if present],
+                )
+                self._conn.executemany(
+                    "DELETE FROM channels WHERE kind = ? AND guild_id = ? AND channel_id = ?",
+                    [key for key, present in channels.items() if not present],
+                )
+
+    # --- JSON 마이그레이션 ---
+
+    def migrate_from_json(
+        self,
+        settings_file: Path,
+        auto_read_file: Path,
+        designated_file: Path,
+    ) -> None:
+        """기존 JSON 설정 파일을 한 번만 가져온다. JSON 파일은 백업으로 남겨둔다."""
+        with self._lock:
+            done = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'json_migrated'"
+            ).fetchone()
+        if done:
+            return
+
+        def _read(path: Path) -> dict:
+            if not path.exists():
+                return {}
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except json.JSONDecodeError:
+                logger.warning(f"{path.name} 파싱 실패, 마이그레이션에서 제외")
+                return {}
+
+        users = _read(settings_file)
+        auto_read = _read(auto_read_file)
+        designated = _read(designated_file)
+
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO user_settings (user_id, {', '.join(USER_FIELDS)}) "
+                    f"VALUES (?, {', '.join('?' for _ in USER_FIELDS)})",
+                    [
+                        (user_id, *(entry.get(k) for k in USER_FIELDS))
+                        for user_id, entry in users.items()
+                    ],
+                )
+                for kind, data in ((CHANNEL_AUTO_READ, auto_read), (CHANNEL_DESIGNATED, designated)):
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO channels (kind, guild_id, channel_id) VALUES (?, ?, ?)",
+                        [
+                            (kind, guild_id, channel_id)
+                            for guild_id, channel_ids in data.items()
+                            for channel_id in channel_ids
+                        ],
+                    )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('json_migrated', '1')"
+                )
+
+        logger.info(
+            f"JSON 설정 마이그레이션 완료: 사용자 {len(users)}명, "
+            f"자동읽기 서버 {len(auto_read)}개, 지정채널 서버 {len(designated)}개"
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class WriteBehindWriter:
+    """설정 변경을 모아 워커 스레드에서 지연 기록한다 (write-behind).
+
+    mark_*()는 메모리 dict만 갱신하므로 이벤트 루프를 막지 않는다.
+    첫 변경 후 delay초 동안 들어온 변경을 합쳐 한 트랜잭션으로 기록하고,
+    close() 시 남은 변경을 모두 기록한다. close()가 호출되지 않고 프로세스가
+    끝나더라도 atexit에서 남은 변경을 기록한다.
+    """
+
+    def __init__(self, store: SettingsStore, delay: float = SETTINGS_FLUSH_DELAY):
+        self._store = store
+        self._delay = delay
+        self._lock = threading.Lock()
+        self._dirty_users: dict[str, dict] = {}
+        self._dirty_channels: dict[tuple[str, str, int], bool] = {}
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="settings-writer", daemon=True,
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def mark_user(self, user_id: str, settings: dict) -> None:
+        with self._lock:
+            self._dirty_users[user_id] = dict(settings)
+        self._wake.set()
+
+    def mark_channel(self, kind: str, guild_id: str, channel_id: int, present: bool) -> None:
+        with self._lock:
+            self._dirty_channels[(kind, guild_id, channel_id)] = present
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait()
+            # 디바운스: 종료 요청이 없으면 delay초 동안 변경을 더 모은다
+            self._stopping.wait(self._delay)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        """모인 변경사항을 즉시 기록한다."""
+        with self._lock:
+            users, self._dirty_users = self._dirty_users, {}
+            channels, self._dirty_channels = self._dirty_channels, {}
+        if not users and not channels:
+            return
+        try:
+            self._store.apply_batch(users, channels)
+        except Exception as e:
+            logger.error(f"설정 저장 실패, 다음 기록 때 재시도: {e}")
+            with self._lock:
+                # 실패한 변경보다 새로 들어온 변경을 우선한다
+                self._dirty_users = {**users, **self._dirty_users}
+                self._dirty_channels = {**channels, **self._dirty_channels}
+
+    def close(self) -> None:
+        """워커 스레드를 멈추고 남은 변경을 기록한다 (여러 번 호출해도 안전)."""
+        atexit.unregister(self.close)
+        self._stopping.set()
+        self._wake.set()
+        self._thread.join()
+        self.flush()
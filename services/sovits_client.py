@@ -1,10 +1,8 @@
-import json
 import logging
-from pathlib import Path
 
 import aiohttp
 
-from config import DATA_DIR, SOVITS_API_URL, SOVITS_REQUEST_TIMEOUT
+from config import SOVITS_API_URL, SOVITS_REQUEST_TIMEOUT, get_characters
 
 logger = logging.getLogger("tts-bot.sovits")
 
@@ -15,19 +13,14 @@ class SoVITSClient:
     def __init__(self) -> None:
         self._session: aiohttp.ClientSession | None = None
         self._characters: dict[str, dict] = {}
+        self.in_flight = 0
         self._load_characters()
 
     def _load_characters(self) -> None:
-        """data/characters.json에서 캐릭터 설정을 로드한다."""
-        characters_file = DATA_DIR / "characters.json"
-        if not characters_file.exists():
-            return
-        try:
-            with open(characters_file, "r", encoding="utf-8") as f:
-                self._characters = json.load(f)
+        """config에서 파싱해 둔 캐릭터 설정을 가져온다."""
+        self._characters = get_characters()
+        if self._characters:
             logger.info(f"캐릭터 {len(self._characters)}개 로드됨")
-        except Exception as e:
-            logger.warning(f"characters.json 로드 실패: {e}")
 
     def _get_session(self) -> aiohttp.ClientSession:
         """aiohttp 세션을 lazy 생성한다."""
@@ -70,6 +63,7 @@ class SoVITSClient:
             "text_language": char.get("text_language", "ko"),
         }
 
+        self.in_flight += 1
         try:
             session = self._get_session()
             async with session.get(SOVITS_API_URL, params=params) as resp:
@@ -85,6 +79,8 @@ class SoVITSClient:
                 return data
         except aiohttp.ClientError as e:
             raise RuntimeError(f"GPT-SoVITS 연결 실패: {e}") from e
+        finally:
+            self.in_flight -= 1
 
     async def close(self) -> None:
         """aiohttp 세션을 정리한다."""
@@ -0,0 +1,131 @@
+import io
+import tempfile
+import threading
+from typing import IO, Optional
+
+from config import SPOOL_MEMORY_LIMIT
+
+
+class SpoolingSource(io.IOBase):
+    """비동기 생산자와 FFmpeg 읽기 스레드 사이의 스풀 버퍼.
+
+    write()는 읽는 쪽을 기다리지 않으며, 메모리에 쓴 데이터가 memory_limit를 넘으면
+    이후 데이터는 임시 파일로 넘긴다(spill). 임시 파일 쓰기/읽기는 스풀 잠금 밖에서 하므로
+    read()가 파일 I/O 때문에 기다리지 않는다.
+    read()는 FFmpeg 파이프 작성 스레드에서 호출되며, 데이터가 도착하거나
+    finish()/close()가 호출될 때까지 대기한다.
+    메모리에 쓴 데이터는 닫힐 때까지 유지하므로, 생산자는 따로 사본을 모으지 않고
+    getvalue()로 캐시에 넣을 오디오를 얻는다 (스풀 하나의 메모리는 memory_limit 이하).
+    """
+
+    def __init__(self, memory_limit: int = SPOOL_MEMORY_LIMIT):
+        super().__init__()
+        self._memory_limit = memory_limit
+        self._cond = threading.Condition()
+        # 임시 파일 접근용 (self._cond와 동시에 잡지 않는다)
+        self._spill_lock = threading.Lock()
+        self._buffer = bytearray()
+        self._spill: Optional[IO[bytes]] = None
+        self._spilled = False
+        self._spill_size = 0        # 읽기 쪽에 공개된 임시 파일 크기
+        self._read_pos = 0          # 메모리 버퍼 + 임시 파일을 이은 스트림에서 읽은 위치
+        self._eof = False
+        self._released = False
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return True
+
+    def _available(self) -> int:
+        return len(self._buffer) + self._spill_size - self._read_pos
+
+    def needs_spill(self, size: int) -> bool:
+        """size바이트를 쓰면 임시 파일에 쓰게 되는지 확인한다 (이벤트 루프 밖에서 쓸지 결정용)."""
+        with self._cond:
+            return self._spilled or len(self._buffer) + size > self._memory_limit
+
+    def write(self, data: bytes) -> int:
+        """데이터를 스풀에 추가한다. 읽는 쪽을 기다리지 않는다 (생산자는 하나)."""
+        with self._cond:
+            if self._released or self._eof:
+                return 0
+            if not self._spilled and len(self._buffer) + len(data) <= self._memory_limit:
+                self._buffer += data
+                self._cond.notify_all()
+                return len(data)
+            self._spilled = True
+
+        with self._spill_lock:
+            if self._released:
+                return 0
+            if self._spill is None:
+                self._spill = tempfile.TemporaryFile()
+            self._spill.seek(0, io.SEEK_END)
+            self._spill.write(data)
+
+        with self._cond:
+            self._spill_size += len(data)
+            self._cond.notify_all()
+        return len(data)
+
+    def finish(self) -> None:
+        """생산자가 더 이상 쓰지 않음을 알린다. 남은 데이터를 읽으면 EOF가 된다."""
+        with self._cond:
+            self._eof = True
+            self._cond.notify_all()
+
+    def getvalue(self) -> Optional[bytes]:
+        """finish() 후 전체 데이터를 반환한다. 임시 파일로 넘어갔거나 닫혔으면 None (캐시하지 않음)."""
+        with self._cond:
+            if not self._eof or self._spilled or self._released:
+                return None
+            return bytes(self._buffer)
+
+    def read(self, size: int = -1) -> bytes:
+        with self._cond:
+            if size is None or size < 0:
+                while not self._eof and not self._released:
+                    self._cond.wait()
+                size = self._available()
+            else:
+                while not self._available() and not self._eof and not self._released:
+                    self._cond.wait()
+            if self._released:
+                return b""
+
+            size = min(size, self._available())
+            buffered = len(self._buffer)
+            out = bytearray()
+            if self._read_pos < buffered:
+                end = min(buffered, self._read_pos + size)
+                out += self._buffer[self._read_pos:end]
+                self._read_pos = end
+            remaining = size - len(out)
+            spill_offset = self._read_pos - buffered
+            # 읽을 범위를 먼저 확보하고 파일은 잠금 밖에서 읽는다 (읽는 스레드는 하나)
+            self._read_pos += remaining
+
+        if remaining > 0:
+            with self._spill_lock:
+                if self._spill is None:
+                    return b""  # 읽는 도중 닫힘
+                self._spill.seek(spill_offset)
+                out += self._spill.read(remaining)
+        return bytes(out)
+
+    def close(self) -> None:
+        """버퍼와 임시 파일을 즉시 해제하고 대기 중인 read()를 깨운다."""
+        with self._cond:
+            self._released = True
+            self._buffer = bytearray()
+            self._cond.notify_all()
+        with self._spill_lock:
+            if self._spill is not None:
+                try:
+                    self._spill.close()
+                except OSError:
+                    pass
+                self._spill = None
+        super().close()
@@ -0,0 +1,166 @@
+import asyncio
+import io
+import time
+from collections import deque
+from typing import Callable, Optional
+
+from config import SYNTH_CONCURRENCY, SYNTH_DRR_QUANTUM, SYNTH_WAIT_BUCKETS
+
+
+class _Waiter:
+    __slots__ = ("cost", "future", "enqueued")
+
+    def __init__(self, cost: int, future: asyncio.Future):
+        self.cost = cost
+        self.future = future
+        self.enqueued = time.perf_counter()
+
+
+class EngineSlots:
+    """엔진 하나의 동시 합성 슬롯을 서버 간 deficit round robin으로 나눠 준다.
+
+    슬롯을 기다리는 서버들을 원형으로 돌며, 차례가 온 서버에 quantum(글자 수)만큼
+    크레딧을 주고 크레딧이 남는 동안 그 서버의 요청을 먼저 보낸다.
+    한 서버가 요청을 쏟아내도 다른 서버는 최대 한 바퀴만 기다린다.
+    """
+
+    def __init__(self, name: str, limit: int, quantum: int = SYNTH_DRR_QUANTUM):
+        self.name = name
+        self.limit = limit
+        self.quantum = quantum
+        self.active = 0
+        self.waiting = 0
+        self.granted = 0
+        self.wait_sum = 0.0
+        self.wait_buckets = [0] * len(SYNTH_WAIT_BUCKETS)
+        self._queues: dict[int, deque[_Waiter]] = {}
+        self._ring: deque[int] = deque()
+        self._deficit: dict[int, int] = {}
+        self._turn_started = False
+
+    def _observe_wait(self, wait: float) -> None:
+        self.granted += 1
+        self.wait_sum += wait
+        for index, bound in enumerate(SYNTH_WAIT_BUCKETS):
+            if wait <= bound:
+                self.wait_buckets[index] += 1
+                break
+
+    def _dispatch(self) -> None:
+        while self.active < self.limit and self._ring:
+            guild_id = self._ring[0]
+            waiters = self._queues[guild_id]
+            # 기다리다 취소된 요청을 걷어낸다
+            while waiters and waiters[0].future.done():
+                waiters.popleft()
+            if not waiters:
+                self._ring.popleft()
+                del self._queues[guild_id]
+                del self._deficit[guild_id]
+                self._turn_started = False
+                continue
+
+            if not self._turn_started:
+                self._deficit[guild_id] += self.quantum
+                self._turn_started = True
+            waiter = waiters[0]
+            if self._deficit[guild_id] < waiter.cost:
+                # 이번 차례의 크레딧을 다 씀 → 다음 서버로
+                self._ring.rotate(-1)
+                self._turn_started = False
+                continue
+
+            self._deficit[guild_id] -= waiter.cost
+            waiters.popleft()
+            self.waiting -= 1
+            self.active += 1
+            self._observe_wait(time.perf_counter() - waiter.enqueued)
+            waiter.future.set_result(None)
+
+    async def acquire(self, guild_id: int, cost: int) -> None:
+        """슬롯을 하나 얻을 때까지 기다린다. 얻은 뒤에는 반드시 release()를 호출해야 한다."""
+        if self.active < self.limit and not self._ring:
+            self.active += 1
+            self._observe_wait(0.0)
+            return
+
+        waiter = _Waiter(max(cost, 1), asyncio.get_running_loop().create_future())
+        queue = self._queues.get(guild_id)
+        if queue is None:
+            queue = self._queues[guild_id] = deque()
+            self._deficit[guild_id] = 0
+            self._ring.append(guild_id)
+        queue.append(waiter)
+        self.waiting += 1
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # 슬롯을 받은 직후 취소됨 → 돌려준다
+                self.release()
+            else:
+                self.waiting -= 1
+            raise
+
+    def release(self) -> None:
+        self.active -= 1
+        self._dispatch()
+
+
+class SynthesisScheduler:
+    """TTSEngine.synthesize 앞단의 서버별 공정 스케줄러.
+
+    엔진(edge / gtts / sovits)마다 동시 합성 수를 제한하고, 슬롯이 모자라면
+    서버 간 deficit round robin으로 순서를 정한다. 캐시에 있는 문장은 기다리지 않는다.
+    슬롯은 첫 오디오 청크로 재생을 시작한 뒤에도 업스트림 스트리밍이 끝날 때까지 잡으므로,
+    동시 합성 수가 곧 열려 있는 edge-tts 연결 수 / 사용 중인 gTTS 작업 스레드 수다.
+    """
+
+    def __init__(
+        self,
+        tts_engine,
+        limits: dict[str, int] = SYNTH_CONCURRENCY,
+        quantum: int = SYNTH_DRR_QUANTUM,
+    ):
+        self.tts_engine = tts_engine
+        self.engines: dict[str, EngineSlots] = {
+            name: EngineSlots(name, limit, quantum) for name, limit in limits.items()
+        }
+        self.cache_bypassed = 0
+
+    async def synthesize(
+        self,
+        guild_id: int,
+        text: str,
+        lang: str,
+        slow: bool,
+        voice: Optional[str] = None,
+        rate: Optional[str] = None,
+        pitch: Optional[str] = None,
+        has_jamo: Optional[bool] = None,
+    ) -> tuple[io.IOBase, Callable]:
+        """슬롯을 얻은 뒤 합성한다 (인자와 반환값은 TTSEngine.synthesize와 같음).
+
+        정규화와 캐시 키 계산은 TTSEngine.prepare()에서 한 번만 하고, 그 결과로 합성한다.
+        """
+        tts_engine = self.tts_engine
+        request = tts_engine.prepare(
+            text, lang=lang, slow=slow, voice=voice, rate=rate, pitch=pitch, has_jamo=has_jamo,
+        )
+        if request.cached:
+            self.cache_bypassed += 1
+            return await tts_engine.synthesize_prepared(request)
+
+        slots = self.engines[request.engine]
+        await slots.acquire(guild_id, len(request.text))
+        released = False
+
+        def _release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                slots.release()
+
+        # 엔진이 스트리밍을 마치면 _release를 호출한다 (소스 반환 시점보다 늦음)
+        return await tts_engine.synthesize_prepared(request, on_done=_release)
@@ -0,0 +1,73 @@
+import re
+from typing import Callable, NamedTuple
+
+# 유니코드 이모지 범위 (문자 클래스 본문)
+_UNICODE_EMOJI_CLASS = (
+    "\U0001F600-\U0001F64F"  # 이모티콘
+    "\U0001F300-\U0001F5FF"  # 기호
+    "\U0001F680-\U0001F6FF"  # 교통
+    "\U0001F1E0-\U0001F1FF"  # 국기
+    "\U0001F900-\U0001F9FF"  # 보충 기호
+    "\U0001FA00-\U0001FAFF"  # 확장 기호
+    "\U00002600-\U000027BF"  # 기타 기호
+    "\U0000FE00-\U0000FE0F"  # 변형 선택자
+    "\U0000200D"             # ZWJ
+    "\U000020E3"             # 결합 기호
+)
+
+# 멘션 / 커스텀 이모지 / 유니코드 이모지를 한 번에 찾는 토크나이저
+_MESSAGE_TOKEN_RE = re.compile(
+    r"<@!?(?P<mention>\d+)>"
+    r"|<a?:\w+:\d+>"
+    f"|[{_UNICODE_EMOJI_CLASS}]+"
+)
+# 토크나이저가 처리할 것이 있는지 미리 확인 (대부분의 일반 메시지는 여기서 끝남)
+_MARKUP_RE = re.compile(f"[<{_UNICODE_EMOJI_CLASS}]")
+# 멘션을 치환한 닉네임 안의 이모지 제거용
+_EMOJI_RE = re.compile(f"<a?:\\w+:\\d+>|[{_UNICODE_EMOJI_CLASS}]+")
+
+# 한글 초성/중성 (TTSEngine 정규화 대상)
+_JAMO_RE = re.compile(r"[ㄱ-ㅎㅏ-ㅣ]")
+
+
+class ScannedMessage(NamedTuple):
+    """scan_message() 결과."""
+
+    text: str
+    had_emoji: bool
+    is_command: bool
+    has_jamo: bool      # 초성/중성 포함 여부 (TTSEngine.normalize_text에 넘겨 재검사를 생략)
+
+
+def scan_message(content: str, resolve_mention: Callable[[int], str]) -> ScannedMessage:
+    """메시지를 한 번 훑어 멘션 치환, 이모지 제거, 이모지 존재 여부, 명령어 여부를 처리하고,
+    정규화 단계에서 다시 쓸 자모 포함 여부를 함께 기록한다.
+
+    resolve_mention은 사용자 ID를 받아 표시 이름을 반환한다.
+    치환된 표시 이름에 들어있는 이모지도 함께 제거한다.
+    """
+    if _MARKUP_RE.search(content) is None:
+        text = content.strip()
+        return ScannedMessage(text, False, text.startswith("/"), _JAMO_RE.search(text) is not None)
+
+    had_emoji = False
+
+    def _replace(m: re.Match) -> str:
+        nonlocal had_emoji
+        mention = m.group("mention")
+        if mention is None:
+            had_emoji = True
+            return ""
+        name = resolve_mention(int(mention))
+        cleaned = _EMOJI_RE.sub("", name)
+        if cleaned != name:
+            had_emoji = True
+        return cleaned
+
+    text = _MESSAGE_TOKEN_RE.sub(_replace, content).strip()
+    return ScannedMessage(text, had_emoji, text.startswith("/"), _JAMO_RE.search(text) is not None)
+
+
+def contains_jamo(text: str) -> bool:
+    """한글 초성/중성이 포함되어 있는지 확인한다 (정규화 생략 판단용)."""
+    return _JAMO_RE.search(text) is not None
@@ -1,25 +1,29 @@
 import asyncio
 import hashlib
+import importlib
 import io
 import logging
-import os
 import re
-import uuid
+import time
+import zlib
 from collections import OrderedDict
-from pathlib import Path
-from typing import Callable, Optional
-
-import edge_tts
-from gtts import gTTS
+from typing import Callable, NamedTuple, Optional
 
 from config import (
-    TEMP_DIR, DEFAULT_LANGUAGE, DEFAULT_SLOW,
+    DEFAULT_LANGUAGE, DEFAULT_SLOW,
     DEFAULT_VOICE, DEFAULT_RATE, DEFAULT_PITCH,
     KOREAN_ABBREVIATIONS, KOREAN_REPEATED_JAMO,
     KOREAN_JAMO_READINGS, AUDIO_CACHE_MAX_SIZE, AUDIO_CACHE_MAX_BYTES,
-    STANDALONE_PUNCTUATION,
+    STANDALONE_PUNCTUATION, AUDIO_POSTPROCESS_ENABLED,
+    AUDIO_CACHE_SNAPSHOT_ENABLED, AUDIO_CACHE_SNAPSHOT_DIR,
+    GTTS_EXECUTOR_WORKERS, GTTS_EXECUTOR_QUEUE, IO_EXECUTOR_WORKERS,
 )
+from services.audio_postprocess import AudioPostProcessor
+from services.cache_snapshot import SnapshotEntry, read_snapshot, write_snapshot
+from services.executors import ExecutorSaturated, InstrumentedExecutor
 from services.sovits_client import SoVITSClient
+from services.spool import SpoolingSource
+from services.text_scanner import contains_jamo
 
 logger = logging.getLogger("tts-bot.engine")
 
@@ -29,64 +33,208 @@ _REPEATED_JAMO_RE = re.compile(r"([ㄱ-ㅎ])\1+")
 _JAMO_SEQUENCE_RE = re.compile(r"[ㄱ-ㅎㅏ-ㅣ]+")
 
 
+def _noop() -> None:
+    pass
+
+
 class AudioCache:
-    """항목 수 및 바이트 크기 제한이 있는 LRU 오디오 캐시."""
+    """항목 수 및 바이트 크기 제한이 있는 LRU 오디오 캐시.
+
+    스냅샷에서 복원한 항목은 mmap 위의 memoryview로 들고 있다가,
+    처음 조회될 때 crc32를 검증하고 bytes로 바꾼다.
+    """
 
     def __init__(
         self,
         max_size: int = AUDIO_CACHE_MAX_SIZE,
         max_bytes: int = AUDIO_CACHE_MAX_BYTES,
     ):
-        self._cache: OrderedDict[str, bytes] = OrderedDict()
+        self._cache: OrderedDict[str, bytes | memoryview] = OrderedDict()
+        # 아직 검증하지 않은 복원 항목의 crc32
+        self._unverified: dict[str, int] = {}
         self._total_bytes = 0
         self._max_size = max_size
         self._max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
 
     @staticmethod
-    def _key(text: str, voice: str, rate: str, pitch: str) -> str:
+    def make_key(text: str, voice: str, rate: str, pitch: str) -> str:
         raw = f"{text}|{voice}|{rate}|{pitch}"
         return hashlib.sha256(raw.encode()).hexdigest()
 
     def get(self, text: str, voice: str, rate: str, pitch: str) -> Optional[bytes]:
-        key = self._key(text, voice, rate, pitch)
-        if key in self._cache:
-            self._cache.move_to_end(key)
-            return self._cache[key]
-        return None
+        return self.get_by_key(self.make_key(text, voice, rate, pitch))
+
+    def get_by_key(self, key: str) -> Optional[bytes]:
+        """make_key()로 미리 계산한 키로 조회한다."""
+        data = self._cache.get(key)
+        if data is not None and key in self._unverified:
+            data = self._verify(key, data)
+        if data is None:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return data
+
+    def _verify(self, key: str, view: memoryview) -> Optional[bytes]:
+        """복원 항목의 체크섬을 확인하고 bytes로 바꾼다. 손상되었으면 제거한다."""
+        crc = self._unverified.pop(key)
+        if zlib.crc32(view) != crc:
+            logger.warning("캐시 스냅샷 항목 체크섬 불일치, 제거")
+            del self._cache[key]
+            self._total_bytes -= len(view)
+            return None
+        data = bytes(view)
+        self._cache[key] = data
+        return data
 
     def put(self, text: str, voice: str, rate: str, pitch: str, data: bytes) -> None:
-        key = self._key(text, voice, rate, pitch)
+        key = self.make_key(text, voice, rate, pitch)
         if key in self._cache:
             self._total_bytes -= len(self._cache[key])
             del self._cache[key]
+            self._unverified.pop(key, None)
 
         self._cache[key] = data
         self._total_bytes += len(data)
         self._cache.move_to_end(key)
         self._evict()
 
+    def contains_key(self, key: str) -> bool:
+        """히트/미스 통계와 LRU 순서를 바꾸지 않고 항목이 있는지 확인한다."""
+        return key in self._cache
+
+    def replace(self, text: str, voice: str, rate: str, pitch: str, data: bytes) -> bool:
+        """LRU 순서를 바꾸지 않고 기존 항목의 데이터만 교체한다. 항목이 없으면 False."""
+        key = self.make_key(text, voice, rate, pitch)
+        old = self._cache.get(key)
+        if old is None:
+            return False
+        self._cache[key] = data
+        self._unverified.pop(key, None)
+        self._total_bytes += len(data) - len(old)
+        self._evict()
+        return True
+
     def _evict(self) -> None:
         while len(self._cache) > self._max_size or self._total_bytes > self._max_bytes:
             if not self._cache:
                 break
-            _, evicted = self._cache.popitem(last=False)
+            key, evicted = self._cache.popitem(last=False)
+            self._unverified.pop(key, None)
             self._total_bytes -= len(evicted)
+            self.evictions += 1
 
     def clear(self) -> None:
         self._cache.clear()
+        self._unverified.clear()
         self._total_bytes = 0
 
+    def items(self) -> list[tuple[str, bytes | memoryview]]:
+        """(키, 데이터) 목록을 LRU 순서(오래된 것부터)로 반환한다 (스냅샷 저장용)."""
+        return list(self._cache.items())
+
+    def restore(self, entries: list[SnapshotEntry]) -> int:
+        """스냅샷 항목을 오래된 것부터 넣는다. 이미 있는 키는 건너뛰고 넣은 수를 반환한다."""
+        restored = 0
+        # 최신 항목부터 앞쪽에 끼워 넣어 스냅샷 순서를 유지하고, 지금 있는 항목보다 오래된 것으로 둔다
+        for entry in reversed(entries):
+            if entry.key in self._cache:
+                continue
+            self._cache[entry.key] = entry.data
+            self._cache.move_to_end(entry.key, last=False)
+            self._unverified[entry.key] = entry.crc32
+            self._total_bytes += len(entry.data)
+            restored += 1
+        self._evict()
+        return restored
+
+
+class SynthesisRequest(NamedTuple):
+    """TTSEngine.prepare() 결과. 정규화, 엔진 선택, 캐시 키 계산을 한 번만 한다."""
+
+    text: str           # 정규화된 텍스트
+    lang: str
+    slow: bool
+    voice: str
+    rate: str
+    pitch: str
+    engine: str         # "edge" | "gtts" | "sovits"
+    cache_key: str
+    cached: bool        # prepare() 시점에 캐시에 있었는지
+
+
+class EngineStats:
+    """엔진별 업스트림 요청 수, 오류 수, 누적 지연시간."""
+
+    __slots__ = ("requests", "errors", "latency_sum")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.latency_sum = 0.0
+
+    def observe(self, started: float, ok: bool) -> None:
+        """time.perf_counter() 기준 시작 시각으로 요청 1건을 기록한다."""
+        self.requests += 1
+        self.latency_sum += time.perf_counter() - started
+        if not ok:
+            self.errors += 1
+
 
 class TTSEngine:
     """멀티 TTS 엔진 (edge-tts, gTTS, GPT-SoVITS) + LRU 캐시."""
 
     def __init__(self):
-        self.temp_dir = TEMP_DIR
         self._cache = AudioCache()
+        self.stats: dict[str, EngineStats] = {
+            "edge": EngineStats(),
+            "gtts": EngineStats(),
+            "sovits": EngineStats(),
+        }
         self._abbreviations = sorted(
             KOREAN_ABBREVIATIONS.items(), key=lambda kv: len(kv[0]), reverse=True
         )
+        # 약어가 하나라도 있는지 한 번에 확인하는 정규식 (없으면 약어 사전 순회를 생략)
+        self._abbreviation_re = re.compile("|".join(re.escape(abbr) for abbr, _ in self._abbreviations))
         self.sovits_client = SoVITSClient()
+        self._postprocessor = AudioPostProcessor() if AUDIO_POSTPROCESS_ENABLED else None
+        self._postprocess_tasks: set[asyncio.Task] = set()
+        # gTTS 요청이 파일 저장/모듈 로드를 굶기지 않도록 스레드 풀을 나눈다
+        self.executors: dict[str, InstrumentedExecutor] = {
+            "gtts": InstrumentedExecutor("gtts", GTTS_EXECUTOR_WORKERS, GTTS_EXECUTOR_QUEUE),
+            "io": InstrumentedExecutor("io", IO_EXECUTOR_WORKERS),
+        }
+
+    def _cache_store(self, text: str, voice: str, rate: str, pitch: str, data: bytes) -> None:
+        """원본을 즉시 캐시에 넣고, 후처리(무음 제거·음량 정규화) 결과로 나중에 교체한다."""
+        self._cache.put(text, voice, rate, pitch, data)
+        if self._postprocessor is None:
+            return
+        task = asyncio.create_task(self._postprocess_entry(text, voice, rate, pitch, data))
+        self._postprocess_tasks.add(task)
+        task.add_done_callback(self._postprocess_tasks.discard)
+
+    async def _postprocess_entry(
+        self, text: str, voice: str, rate: str, pitch: str, data: bytes,
+    ) -> None:
+        try:
+            processed = await self._postprocessor.process(data)
+        except Exception as e:
+            logger.warning(f"오디오 후처리 실패, 원본 유지: {e}")
+            return
+        if processed is not data:
+            self._cache.replace(text, voice, rate, pitch, processed)
 
     @staticmethod
     def _convert_standalone_punctuation(text: str) -> str:
@@ -134,6 +282,61 @@ class TTSEngine:
 
         return _JAMO_SEQUENCE_RE.sub(_replace, text)
 
+    def normalize_text(self, text: str, has_jamo: Optional[bool] = None) -> str:
+        """TTS 입력 정규화.
+
+        단독 특수문자 → 반복 자음 정규화 (정규식) → 약어 치환 (사전) → 남은 자모 읽기 순서로 처리한다.
+        자모 관련 단계는 자모가 없으면 결과가 같으므로 대부분의 메시지에서 생략한다.
+        has_jamo는 scan_message()가 이미 확인한 자모 포함 여부로, 주어지면 다시 검사하지 않는다.
+        약어 사전 순회는 약어가 하나라도 있을 때만 한다 (치환 순서는 그대로).
+        """
+        text = self._convert_standalone_punctuation(text)
+        if has_jamo is None:
+            has_jamo = contains_jamo(text)
+        if not has_jamo:
+            return text
+        text = self._normalize_repeated_jamo(text)
+        if self._abbreviation_re.search(text):
+            text = self._apply_korean_abbreviations(text)
+        return self._convert_jamo_sequences(text)
+
+    @staticmethod
+    def engine_for(voice: Optional[str]) -> str:
+        """voice ID 접두사로 합성 엔진("edge" | "gtts" | "sovits")을 정한다."""
+        if voice and voice.startswith("sovits:"):
+            return "sovits"
+        if voice and voice.startswith("gtts:"):
+            return "gtts"
+        return "edge"
+
+    def prepare(
+        self,
+        text: str,
+        lang: str = DEFAULT_LANGUAGE,
+        slow: bool = DEFAULT_SLOW,
+        voice: Optional[str] = None,
+        rate: Optional[str] = None,
+        pitch: Optional[str] = None,
+        has_jamo: Optional[bool] = None,
+    ) -> SynthesisRequest:
+        """텍스트 정규화, 엔진 선택, 캐시 키 계산과 캐시 확인을 한 번에 한다.
+
+        결과는 synthesize_prepared()에 그대로 넘긴다 (스케줄러가 캐시 여부를 보고 슬롯 대기를 건너뜀).
+        """
+        text = self.normalize_text(text, has_jamo)
+        voice = voice or DEFAULT_VOICE
+        rate = rate or DEFAULT_RATE
+        pitch = pitch or DEFAULT_PITCH
+        engine = self.engine_for(voice)
+        if engine == "edge":
+            cache_key = AudioCache.make_key(text, voice, rate, pitch)
+        else:
+            # gTTS / GPT-SoVITS 캐시는 voice ID 자체를 키로 쓴다 (gtts:<lang>, sovits:<id>)
+            cache_key = AudioCache.make_key(text, voice, "", "")
+        return SynthesisRequest(
+            text, lang, slow, voice, rate, pitch, engine, cache_key, self._cache.contains_key(cache_key),
+        )
+
     async def synthesize(
         self,
         text: str,
@@ -142,6 +345,7 @@ class TTSEngine:
         voice: Optional[str] = None,
         rate: Optional[str] = None,
         pitch: Optional[str] = None,
+        has_jamo: Optional[bool] = None,
     ) -> tuple[io.IOBase, Callable]:
         """텍스트를 음성으로 변환한다.
 
@@ -152,43 +356,50 @@ class TTSEngine:
         반환값:
             (source, cleanup_callback) — source는 FFmpegOpusAudio(pipe=True)로
             읽을 수 있는 파일류 객체이고, cleanup_callback은 리소스를 정리하는 함수.
+        has_jamo: scan_message()의 자모 포함 여부 (normalize_text 참고).
         """
-        # 단독 특수문자 → 반복 자음 정규화 (정규식) → 약어 치환 (사전) 순서로 처리
-        text = self._convert_standalone_punctuation(text)
-        text = self._normalize_repeated_jamo(text)
-        text = self._apply_korean_abbreviations(text)
-        text = self._convert_jamo_sequences(text)
-        voice = voice or DEFAULT_VOICE
-        rate = rate or DEFAULT_RATE
-        pitch = pitch or DEFAULT_PITCH
+        return await self.synthesize_prepared(
+            self.prepare(text, lang, slow, voice, rate, pitch, has_jamo)
+        )
+
+    async def synthesize_prepared(
+        self, request: SynthesisRequest, on_done: Callable[[], None] = _noop,
+    ) -> tuple[io.IOBase, Callable]:
+        """prepare()로 만든 요청을 합성한다 (반환값은 synthesize()와 같음).
+
+        on_done은 request.engine에 대한 업스트림 작업(스트리밍 포함)이 끝나면 성공/실패와 관계없이
+        한 번 호출된다. 반환 시점(첫 청크)보다 늦을 수 있으며, 다른 엔진으로의 폴백은 포함하지 않는다.
+        """
+        text = request.text
+        voice, rate, pitch = request.voice, request.rate, request.pitch
 
         # 접두사 기반 엔진 디스패치
-        if voice.startswith("sovits:"):
-            character_id = voice[7:]
-            return await self._synthesize_sovits(text, character_id)
+        if request.engine == "sovits":
+            return await self._synthesize_sovits(text, voice[7:], request.cache_key, on_done)
 
-        if voice.startswith("gtts:"):
-            return await self._synthesize_gtts_primary(text, lang=voice[5:])
+        if request.engine == "gtts":
+            return await self._synthesize_gtts_primary(text, voice[5:], request.cache_key, on_done)
 
         # edge-tts (기본)
         # 1) 캐시 히트 — 즉시 반환
-        cached = self._cache.get(text, voice, rate, pitch)
+        cached = self._cache.get_by_key(request.cache_key)
         if cached is not None:
+            on_done()
             logger.info("캐시 히트, BytesIO 반환")
             buf = io.BytesIO(cached)
             return buf, lambda: None
 
-        # 2) edge-tts 스트리밍 (os.pipe 사용)
+        # 2) edge-tts 스트리밍 (스풀 버퍼 사용)
         try:
             source, cleanup = await self._synthesize_edge_streaming(
-                text, voice, rate, pitch,
+                text, voice, rate, pitch, on_done,
             )
             return source, cleanup
         except Exception as e:
             logger.warning(f"edge-tts 스트리밍 실패, gTTS로 폴백: {e}")
 
-        # 3) gTTS 파일 기반 폴백
-        return await self._gtts_file_fallback(text, lang, slow)
+        # 3) gTTS 폴백
+        return await self._synthesize_gtts_streaming(text, request.lang, request.slow)
 
     async def _synthesize_edge_streaming(
         self,
@@ -196,13 +407,17 @@ class TTSEngine:
         voice: str,
         rate: str,
         pitch: str,
+        on_done: Callable[[], None] = _noop,
     ) -> tuple[io.IOBase, Callable]:
-        """edge-tts 오디오를 OS 파이프를 통해 스트리밍한다.
+        """edge-tts 오디오를 스풀 버퍼를 통해 스트리밍한다.
 
-        백그라운드 태스크가 파이프의 쓰기 끝에 오디오 청크를 쓰고,
-        읽기 끝은 FFmpeg가 소비할 수 있도록 즉시 반환된다.
+        백그라운드 태스크가 스풀에 오디오 청크를 쓰고(executor 불필요),
+        스풀은 FFmpeg가 언제든 읽을 수 있도록 즉시 반환된다.
+        큐에서 대기하는 동안에도 계속 채워지며, 메모리 상한을 넘으면 임시 파일로 넘긴다.
+        on_done은 작성 태스크가 끝나면(edge-tts 연결 종료) 호출된다.
         """
-        read_fd, write_fd = os.pipe()
+        started = time.perf_counter()
+        spool = SpoolingSource()
 
         writer_task: asyncio.Task | None = None
         has_audio = asyncio.Event()
@@ -211,109 +426,191 @@ class TTSEngine:
 
         async def _writer():
             nonlocal writer_error
-            collected = bytearray()
-            loop = asyncio.get_event_loop()
             success = False
             try:
+                import edge_tts  # 첫 사용 시 로드 (preload_engines로 미리 로드됨)
                 communicate = edge_tts.Communicate(text, voice, rate=rate, pitch=pitch)
                 async for chunk in communicate.stream():
                     if chunk["type"] == "audio":
                         data = chunk["data"]
-                        if data and not has_audio.is_set():
+                        if not data:
+                            continue
+                        if spool.needs_spill(len(data)):
+                            # 메모리 상한을 넘은 분량은 임시 파일 쓰기이므로 루프 밖에서
+                            await self.executors["io"].run(spool.write, data)
+                        else:
+                            spool.write(data)
+                        if not has_audio.is_set():
                             has_audio.set()
-                        collected.extend(data)
-                        await loop.run_in_executor(None, os.write, write_fd, data)
                 success = True
             except Exception as e:
                 writer_error = e
                 logger.error(f"edge-tts 스트리밍 작성 오류: {e}")
             finally:
-                try:
-                    os.close(write_fd)
-                except OSError:
-                    pass
-                if success and collected:
-                    self._cache.put(text, voice, rate, pitch, bytes(collected))
+                spool.finish()
+                # 스풀이 메모리에 다 담은 오디오만 캐시한다 (임시 파일로 넘어간 긴 오디오는 제외)
+                audio = spool.getvalue() if success else None
+                if audio:
+                    self._cache_store(text, voice, rate, pitch, audio)
                 writer_done.set()
 
         writer_task = asyncio.create_task(_writer())
-        read_file = os.fdopen(read_fd, "rb")
+        # 시작 전에 취소돼도 호출되도록 태스크 완료 콜백으로 건다
+        writer_task.add_done_callback(lambda _: on_done())
+
+        def _cleanup():
+            spool.close()
+            if writer_task and not writer_task.done():
+                writer_task.cancel()
 
         # 재생 시작 전에 최소 1개 오디오 청크 수신 여부를 확인한다.
         wait_audio_task = asyncio.create_task(has_audio.wait())
         wait_done_task = asyncio.create_task(writer_done.wait())
-        done, pending = await asyncio.wait(
-            {wait_audio_task, wait_done_task},
-            return_when=asyncio.FIRST_COMPLETED,
-            timeout=5,
-        )
+        try:
+            done, pending = await asyncio.wait(
+                {wait_audio_task, wait_done_task},
+                return_when=asyncio.FIRST_COMPLETED,
+                timeout=5,
+            )
+        except asyncio.CancelledError:
+            wait_audio_task.cancel()
+            wait_done_task.cancel()
+            _cleanup()
+            raise
         for task in pending:
             task.cancel()
 
         if wait_audio_task not in done:
-            try:
-                read_file.close()
-            except OSError:
-                pass
-            if writer_task and not writer_task.done():
-                writer_task.cancel()
+            _cleanup()
+            self.stats["edge"].observe(started, ok=False)
             if wait_done_task in done and writer_error is not None:
                 raise RuntimeError(str(writer_error)) from writer_error
             raise RuntimeError("No audio was received from edge-tts.")
 
-        def _cleanup():
-            try:
-                read_file.close()
-            except OSError:
-                pass
-            if writer_task and not writer_task.done():
-                writer_task.cancel()
-
-        return read_file, _cleanup
+        self.stats["edge"].observe(started, ok=True)
+        return spool, _cleanup
 
-    async def _gtts_file_fallback(
-        self, text: str, lang: str, slow: bool,
+    async def _synthesize_gtts_streaming(
+        self,
+        text: str,
+        lang: str,
+        slow: bool,
+        cache_key: Optional[str] = None,
+        on_done: Callable[[], None] = _noop,
     ) -> tuple[io.IOBase, Callable]:
-        """gTTS 파일 기반 폴백."""
-        filepath = self.temp_dir / f"{uuid.uuid4()}.mp3"
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None, self._synthesize_gtts, text, lang, slow, filepath,
-        )
-        fh = open(filepath, "rb")
+        """gTTS 오디오를 문장 조각 단위로 스풀 버퍼에 스트리밍한다.
+
+        gTTS는 긴 텍스트를 약 100자 조각으로 나눠 요청하므로, 첫 조각이 도착하는 즉시
+        스풀을 반환해 나머지를 받는 동안 재생을 시작한다. 임시 파일은 만들지 않으며,
+        전체 오디오가 모이면 캐시에 저장한다. cache_key는 prepare()에서 계산한 키.
+        on_done은 executor 작업이 끝나면(마지막 조각 수신 또는 실패) 호출된다.
+        """
+        cache_voice = f"gtts:{lang}:slow" if slow else f"gtts:{lang}"
+        if cache_key is None:
+            cache_key = AudioCache.make_key(text, cache_voice, "", "")
+        cached = self._cache.get_by_key(cache_key)
+        if cached is not None:
+            on_done()
+            logger.info("gTTS 캐시 히트")
+            return io.BytesIO(cached), lambda: None
+
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        spool = SpoolingSource()
+        first_audio = loop.create_future()
+
+        def _on_first_chunk() -> None:
+            if not first_audio.done():
+                first_audio.set_result(None)
+
+        job = asyncio.ensure_future(self.executors["gtts"].run(
+            self._stream_gtts, text, lang, slow, spool,
+            lambda: loop.call_soon_threadsafe(_on_first_chunk),
+        ))
+
+        def _on_job_done(task: asyncio.Task) -> None:
+            on_done()
+            if task.cancelled():
+                return
+            error = task.exception()
+            if error is not None:
+                if first_audio.done() and not first_audio.cancelled():
+                    logger.error(f"gTTS 스트리밍 작성 오류: {error}")
+                return
+            data = task.result()
+            if data:
+                self._cache_store(text, cache_voice, "", "", data)
+
+        job.add_done_callback(_on_job_done)
 
         def _cleanup():
-            try:
-                fh.close()
-            except OSError:
-                pass
-            try:
-                filepath.unlink(missing_ok=True)
-            except OSError:
-                pass
+            # 작업 스레드는 다음 조각을 쓰려다 스풀이 닫힌 것을 보고 멈춘다
+            spool.close()
 
-        return fh, _cleanup
+        try:
+            await asyncio.wait({first_audio, job}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            first_audio.cancel()
+            _cleanup()
+            raise
+
+        if not first_audio.done():
+            # 첫 조각 전에 작업이 끝남 → 실패
+            _cleanup()
+            error = job.exception()
+            if isinstance(error, ExecutorSaturated):
+                raise error  # 업스트림 실패가 아니므로 통계에 넣지 않는다
+            self.stats["gtts"].observe(started, ok=False)
+            if error is not None:
+                raise error
+            raise RuntimeError("No audio was received from gTTS.")
+
+        self.stats["gtts"].observe(started, ok=True)
+        return spool, _cleanup
+
+    def _stream_gtts(
+        self,
+        text: str,
+        lang: str,
+        slow: bool,
+        spool: SpoolingSource,
+        on_first_chunk: Callable[[], None],
+    ) -> Optional[bytes]:
+        """gTTS 조각을 받는 대로 스풀에 쓴다 (executor 스레드에서 실행).
+
+        끝까지 받으면 캐시할 전체 오디오를, 도중에 스풀이 닫히거나(재생 취소)
+        오디오가 임시 파일로 넘어갔으면 None을 반환한다.
+        """
+        from gtts import gTTS  # 첫 사용 시 로드 (preload_engines로 미리 로드됨)
+        first = True
+        try:
+            for chunk in gTTS(text=text, lang=lang, slow=slow).stream():
+                if not chunk:
+                    continue
+                if not spool.write(chunk):
+                    return None
+                if first:
+                    first = False
+                    on_first_chunk()
+        finally:
+            spool.finish()
+        return spool.getvalue()
 
     async def _synthesize_gtts_primary(
-        self, text: str, lang: str,
+        self,
+        text: str,
+        lang: str,
+        cache_key: Optional[str] = None,
+        on_done: Callable[[], None] = _noop,
     ) -> tuple[io.IOBase, Callable]:
         """gTTS를 기본 엔진으로 사용 (구글 번역기 음성)."""
-        cache_voice = f"gtts:{lang}"
-        cached = self._cache.get(text, cache_voice, "", "")
-        if cached is not None:
-            logger.info("gTTS 캐시 히트")
-            return io.BytesIO(cached), lambda: None
-
         try:
-            filepath = self.temp_dir / f"{uuid.uuid4()}.mp3"
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None, self._synthesize_gtts, text, lang, False, filepath,
+            return await self._synthesize_gtts_streaming(
+                text, lang, slow=False, cache_key=cache_key, on_done=on_done,
             )
-            data = filepath.read_bytes()
-            filepath.unlink(missing_ok=True)
-            self._cache.put(text, cache_voice, "", "", data)
-            return io.BytesIO(data), lambda: None
+        except ExecutorSaturated as e:
+            logger.warning(f"{e}, edge-tts 기본 음성으로 폴백")
+            return await self._edge_fallback(text)
         except Exception as e:
             logger.warning(f"gTTS 실패, edge-tts 기본 음성으로 폴백: {e}")
             return await self._edge_fallback(text)
@@ -334,46 +631,88 @@ class TTSEngine:
             return await self._synthesize_edge_streaming(text, voice, rate, pitch)
         except Exception as e:
             logger.warning(f"edge-tts 폴백도 실패, gTTS 최종 폴백: {e}")
-            return await self._gtts_file_fallback(text, DEFAULT_LANGUAGE, False)
+            return await self._synthesize_gtts_streaming(text, DEFAULT_LANGUAGE, False)
 
-    def _synthesize_gtts(
+    async def _synthesize_sovits(
         self,
         text: str,
-        lang: str,
-        slow: bool,
-        filepath: Path,
-    ) -> None:
-        tts = gTTS(text=text, lang=lang, slow=slow)
-        tts.save(str(filepath))
-
-    async def _synthesize_sovits(
-        self, text: str, character_id: str,
+        character_id: str,
+        cache_key: Optional[str] = None,
+        on_done: Callable[[], None] = _noop,
     ) -> tuple[io.IOBase, Callable]:
-        """GPT-SoVITS 캐릭터 음성으로 합성한다."""
+        """GPT-SoVITS 캐릭터 음성으로 합성한다. on_done은 SoVITS 요청이 끝나면 호출된다."""
         cache_voice = f"sovits:{character_id}"
-        cached = self._cache.get(text, cache_voice, "", "")
+        if cache_key is None:
+            cache_key = AudioCache.make_key(text, cache_voice, "", "")
+        cached = self._cache.get_by_key(cache_key)
         if cached is not None:
+            on_done()
             logger.info("SoVITS 캐시 히트")
             return io.BytesIO(cached), lambda: None
 
+        started = time.perf_counter()
+        data = None
         try:
             data = await self.sovits_client.synthesize(text, character_id)
-            self._cache.put(text, cache_voice, "", "", data)
-            return io.BytesIO(data), lambda: None
         except Exception as e:
+            self.stats["sovits"].observe(started, ok=False)
             logger.warning(f"SoVITS 합성 실패, edge-tts로 폴백: {e}")
+        finally:
+            on_done()  # 폴백은 SoVITS 슬롯 밖에서 진행
+
+        if data is None:
             return await self._edge_fallback(text)
+        self.stats["sovits"].observe(started, ok=True)
+        self._cache_store(text, cache_voice, "", "", data)
+        return io.BytesIO(data), lambda: None
+
+    async def load_cache_snapshot(self) -> None:
+        """종료 시 저장한 캐시 스냅샷을 mmap으로 복원한다 (데이터는 조회 시 읽힘)."""
+        if not AUDIO_CACHE_SNAPSHOT_ENABLED:
+            return
+        try:
+            entries = await self.executors["io"].run(read_snapshot, AUDIO_CACHE_SNAPSHOT_DIR)
+        except OSError as e:
+            logger.warning(f"캐시 스냅샷 복원 실패: {e}")
+            return
+        if entries:
+            restored = self._cache.restore(entries)
+            logger.info(f"캐시 스냅샷 복원: {restored}개 항목")
+
+    async def save_cache_snapshot(self) -> None:
+        """현재 캐시 항목을 스냅샷으로 저장한다."""
+        if not AUDIO_CACHE_SNAPSHOT_ENABLED:
+            return
+        items = self._cache.items()
+        try:
+            saved = await self.executors["io"].run(write_snapshot, AUDIO_CACHE_SNAPSHOT_DIR, items)
+        except OSError as e:
+            logger.error(f"캐시 스냅샷 저장 실패: {e}")
+            return
+        logger.info(f"캐시 스냅샷 저장: {saved}개 항목")
 
-    def cleanup_all(self) -> None:
-        """모든 임시 오디오 파일을 삭제하고 캐시를 초기화한다."""
-        for file in self.temp_dir.glob("*.mp3"):
+    async def preload_engines(self) -> None:
+        """무거운 엔진 모듈을 백그라운드 스레드에서 미리 로드한다.
+
+        시작 시에는 import하지 않아 준비 시간을 줄이고, 준비 후 이 메서드로
+        첫 메시지가 import 비용을 이벤트 루프에서 치르지 않게 한다.
+        """
+        for module in ("edge_tts", "gtts"):
             try:
-                file.unlink()
-            except OSError:
-                pass
+                await self.executors["io"].run(importlib.import_module, module)
+            except ImportError as e:
+                logger.error(f"{module} 로드 실패: {e}")
+
+    def cleanup_all(self) -> None:
+        """캐시를 초기화한다."""
         self._cache.clear()
 
     async def cleanup_all_async(self) -> None:
         """모든 리소스를 비동기적으로 정리한다."""
+        for task in list(self._postprocess_tasks):
+            task.cancel()
+        await self.save_cache_snapshot()
         self.cleanup_all()
         await self.sovits_client.close()
+        for executor in self.executors.values():
+            executor.shutdown()
@@ -1,58 +1,125 @@
-import json
 from pathlib import Path
 from typing import Optional
 
 from config import (
-    DATA_DIR, DEFAULT_LANGUAGE, DEFAULT_SLOW,
+    DATA_DIR, SETTINGS_DB_PATH, DEFAULT_LANGUAGE, DEFAULT_SLOW,
     DEFAULT_VOICE, DEFAULT_RATE, DEFAULT_PITCH, DEFAULT_EFFECT,
     VOICE_PRESETS, AUDIO_EFFECT_PRESETS,
 )
+from services.settings_store import (
+    SettingsStore, WriteBehindWriter, CHANNEL_AUTO_READ, CHANNEL_DESIGNATED,
+)
+
+# 채널 라우팅 플래그 (channel_id → 비트 OR)
+ROUTE_AUTO_READ = 1
+ROUTE_DESIGNATED = 2
+
+_VALID_VOICES = frozenset(VOICE_PRESETS.values())
+_VALID_EFFECTS = frozenset(AUDIO_EFFECT_PRESETS.values())
+
+
+class VoiceProfile:
+    """사용자별로 한 번 해석해 두는 불변 음성 설정.
+
+    정규화가 끝난 값과 재생 시 쓸 FFmpeg 옵션을 함께 담는다.
+    """
+
+    __slots__ = ("language", "slow", "voice", "rate", "pitch", "effect", "ffmpeg_options")
+
+    def __init__(
+        self,
+        language: str,
+        slow: bool,
+        voice: str,
+        rate: str,
+        pitch: str,
+        effect: str,
+    ):
+        _set = object.__setattr__
+        _set(self, "language", language)
+        _set(self, "slow", slow)
+        _set(self, "voice", voice)
+        _set(self, "rate", rate)
+        _set(self, "pitch", pitch)
+        _set(self, "effect", effect)
+        _set(self, "ffmpeg_options", None if effect == "none" else f"-af {effect}")
+
+    def __setattr__(self, name, value):
+        raise AttributeError("VoiceProfile은 변경할 수 없습니다")
 
 
 class UserSettings:
-    """사용자 및 서버 TTS 설정을 관리한다."""
+    """사용자 및 서버 TTS 설정을 관리한다.
 
-    def __init__(self):
-        self.settings_file = DATA_DIR / "user_settings.json"
-        self.auto_read_file = DATA_DIR / "auto_read.json"
-        self.designated_file = DATA_DIR / "designated_channels.json"
+    설정은 메모리에 보관하고, 변경된 행만 워커 스레드가 SQLite 저장소에 지연 기록한다.
+    """
+
+    def __init__(self, data_dir: Path = DATA_DIR):
+        self.settings_file = data_dir / "user_settings.json"
+        self.auto_read_file = data_dir / "auto_read.json"
+        self.designated_file = data_dir / "designated_channels.json"
+        self._store = SettingsStore(data_dir / SETTINGS_DB_PATH.name)
         self._user_settings: dict = {}
         self._auto_read_channels: dict = {}
         self._designated_channels: dict = {}
+        # 설정을 저장한 사용자만 캐시한다 (나머지는 공용 기본 프로필을 받으므로 크기가 저장된 사용자 수로 제한됨)
+        self._profiles: dict[int, VoiceProfile] = {}
+        self._default_profile = VoiceProfile(
+            language=DEFAULT_LANGUAGE,
+            slow=DEFAULT_SLOW,
+            voice=self._normalize_voice(DEFAULT_VOICE),
+            rate=DEFAULT_RATE,
+            pitch=DEFAULT_PITCH,
+            effect=self._normalize_effect(DEFAULT_EFFECT),
+        )
+        # channel_id → ROUTE_* 플래그. 관련 없는 채널은 해시 조회 1번으로 거른다
+        self._routes: dict[int, int] = {}
         self._load()
+        self._writer = WriteBehindWriter(self._store)
 
     def _load(self) -> None:
-        """JSON 파일에서 설정을 불러온다."""
-        if self.settings_file.exists():
-            try:
-                with open(self.settings_file, "r", encoding="utf-8") as f:
-                    self._user_settings = json.load(f)
-            except json.JSONDecodeError:
-                self._user_settings = {}
-
-        if self.auto_read_file.exists():
-            try:
-                with open(self.auto_read_file, "r", encoding="utf-8") as f:
-                    self._auto_read_channels = json.load(f)
-            except json.JSONDecodeError:
-                self._auto_read_channels = {}
-
-        if self.designated_file.exists():
-            try:
-                with open(self.designated_file, "r", encoding="utf-8") as f:
-                    self._designated_channels = json.load(f)
-            except json.JSONDecodeError:
-                self._designated_channels = {}
-
-    def _save_user_settings(self) -> None:
-        """사용자 설정을 JSON에 저장한다."""
-        with open(self.settings_file, "w", encoding="utf-8") as f:
-            json.dump(self._user_settings, f, ensure_ascii=False, indent=2)
+        """저장소에서 설정을 불러온다 (최초 1회 JSON 파일 마이그레이션)."""
+        self._store.migrate_from_json(
+            self.settings_file, self.auto_read_file, self.designated_file,
+        )
+        self._user_settings = self._store.load_user_settings()
+        self._auto_read_channels = self._store.load_channels(CHANNEL_AUTO_READ)
+        self._designated_channels = self._store.load_channels(CHANNEL_DESIGNATED)
+        self._routes.clear()
+        for channels, flag in (
+            (self._auto_read_channels, ROUTE_AUTO_READ),
+            (self._designated_channels, ROUTE_DESIGNATED),
+        ):
+            for channel_ids in channels.values():
+                for channel_id in channel_ids:
+                    self._set_route(channel_id, flag, True)
+
+    def _set_route(self, channel_id: int, flag: int, enabled: bool) -> None:
+        """라우팅 인덱스에서 채널 플래그를 켜거나 끈다."""
+        route = self._routes.get(channel_id, 0)
+        route = route | flag if enabled else route & ~flag
+        if route:
+            self._routes[channel_id] = route
+        else:
+            self._routes.pop(channel_id, None)
+
+    def get_channel_route(self, channel_id: int) -> int:
+        """채널의 ROUTE_* 플래그를 반환한다. 설정되지 않은 채널은 0."""
+        return self._routes.get(channel_id, 0)
+
+    def _save_user_settings(self, user_key: str) -> None:
+        """사용자 1명의 설정을 기록 대기열에 올린다 (블로킹 없음)."""
+        self._writer.mark_user(user_key, self._user_settings[user_key])
+
+    def close(self) -> None:
+        """남은 변경을 기록하고 저장소 연결을 닫는다 (블로킹)."""
+        self._writer.close()
+        self._store.close()
 
     @staticmethod
     def _normalize_voice(voice: str) -> str:
         """지원하지 않는 음성 ID를 기본값으로 정규화한다."""
-        if voice in VOICE_PRESETS.values():
+        if voice in _VALID_VOICES:
             return voice
         if voice.startswith("sovits:"):
             return voice
@@ -61,16 +128,10 @@ class UserSettings:
     @staticmethod
     def _normalize_effect(effect: str) -> str:
         """지원하지 않는 효과 ID를 기본값으로 정규화한다."""
-        valid_effects = set(AUDIO_EFFECT_PRESETS.values())
-        if effect in valid_effects:
+        if effect in _VALID_EFFECTS:
             return effect
         return DEFAULT_EFFECT
 
-    def _save_auto_read(self) -> None:
-        """자동읽기 설정을 JSON에 저장한다."""
-        with open(self.auto_read_file, "w", encoding="utf-8") as f:
-            json.dump(self._auto_read_channels, f, ensure_ascii=False, indent=2)
-
     # --- 사용자 언어/느린말 설정 ---
 
     def get_user_language(self, user_id: int) -> str:
@@ -97,7 +158,7 @@ class UserSettings:
             normalized = self._normalize_voice(voice)
             if normalized != voice:
                 self._user_settings[user_key]["voice"] = normalized
-                self._save_user_settings()
+                self._save_user_settings(user_key)
             return normalized
         return DEFAULT_VOICE
 
@@ -123,7 +184,7 @@ class UserSettings:
             normalized = self._normalize_effect(effect)
             if normalized != effect:
                 self._user_settings[user_key]["effect"] = normalized
-                self._save_user_settings()
+                self._save_user_settings(user_key)
             return normalized
         return DEFAULT_EFFECT
 
@@ -163,7 +224,8 @@ class UserSettings:
         if effect is not None:
             self._user_settings[user_key]["effect"] = self._normalize_effect(effect)
 
-        self._save_user_settings()
+        self._save_user_settings(user_key)
+        self._profiles.pop(user_id, None)
         return self._user_settings[user_key]
 
     def get_user_settings(self, user_id: int) -> dict:
@@ -194,18 +256,36 @@ class UserSettings:
 
         if user_key in self._user_settings and updated:
             self._user_settings[user_key].update(settings)
-            self._save_user_settings()
+            self._save_user_settings(user_key)
 
         return settings
 
+    def get_user_profile(self, user_id: int) -> VoiceProfile:
+        """메시지 처리용 음성 설정을 한 번에 반환한다 (set_user_voice 전까지 캐시).
+
+        설정을 저장한 적 없는 사용자는 캐시하지 않고 공용 기본 프로필을 반환한다.
+        """
+        profile = self._profiles.get(user_id)
+        if profile is None:
+            if str(user_id) not in self._user_settings:
+                return self._default_profile
+            settings = self.get_user_settings(user_id)
+            profile = VoiceProfile(
+                language=settings.get("language", DEFAULT_LANGUAGE),
+                slow=settings.get("slow", DEFAULT_SLOW),
+                voice=settings["voice"],
+                rate=settings.get("rate", DEFAULT_RATE),
+                pitch=settings.get("pitch", DEFAULT_PITCH),
+                effect=settings["effect"],
+            )
+            self._profiles[user_id] = profile
+        return profile
+
     # --- 자동읽기 채널 관리 ---
 
     def is_auto_read_channel(self, guild_id: int, channel_id: int) -> bool:
         """해당 채널이 자동읽기로 설정되어 있는지 확인한다."""
-        guild_key = str(guild_id)
-        if guild_key in self._auto_read_channels:
-            return channel_id in self._auto_read_channels[guild_key]
-        return False
+        return bool(self._routes.get(channel_id, 0) & ROUTE_AUTO_READ)
 
     def add_auto_read_channel(self, guild_id: int, channel_id: int) -> None:
         """자동읽기 채널을 추가한다."""
@@ -215,7 +295,8 @@ class UserSettings:
 
         if channel_id not in self._auto_read_channels[guild_key]:
             self._auto_read_channels[guild_key].append(channel_id)
-            self._save_auto_read()
+            self._set_route(channel_id, ROUTE_AUTO_READ, True)
+            self._writer.mark_channel(CHANNEL_AUTO_READ, guild_key, channel_id, True)
 
     def remove_auto_read_channel(self, guild_id: int, channel_id: int) -> bool:
         """자동읽기 채널을 제거한다. 제거된 경우 True 반환."""
@@ -223,7 +304,8 @@ class UserSettings:
         if guild_key in self._auto_read_channels:
             if channel_id in self._auto_read_channels[guild_key]:
                 self._auto_read_channels[guild_key].remove(channel_id)
-                self._save_auto_read()
+                self._set_route(channel_id, ROUTE_AUTO_READ, False)
+                self._writer.mark_channel(CHANNEL_AUTO_READ, guild_key, channel_id, False)
                 return True
         return False
 
@@ -243,17 +325,9 @@ class UserSettings:
 
     # --- 지정채널 관리 ---
 
-    def _save_designated(self) -> None:
-        """지정채널 설정을 JSON에 저장한다."""
-        with open(self.designated_file, "w", encoding="utf-8") as f:
-            json.dump(self._designated_channels, f, ensure_ascii=False, indent=2)
-
     def is_designated_channel(self, guild_id: int, channel_id: int) -> bool:
         """해당 채널이 지정채널로 설정되어 있는지 확인한다."""
-        guild_key = str(guild_id)
-        if guild_key in self._designated_channels:
-            return channel_id in self._designated_channels[guild_key]
-        return False
+        return bool(self._routes.get(channel_id, 0) & ROUTE_DESIGNATED)
 
     def add_designated_channel(self, guild_id: int, channel_id: int) -> None:
         """지정채널을 추가한다."""
@@ -263,7 +337,8 @@ class UserSettings:
 
         if channel_id not in self._designated_channels[guild_key]:
             self._designated_channels[guild_key].append(channel_id)
-            self._save_designated()
+            self._set_route(channel_id, ROUTE_DESIGNATED, True)
+            self._writer.mark_channel(CHANNEL_DESIGNATED, guild_key, channel_id, True)
 
     def remove_designated_channel(self, guild_id: int, channel_id: int) -> bool:
         """지정채널을 제거한다. 제거된 경우 True 반환."""
@@ -271,7 +346,8 @@ class UserSettings:
         if guild_key in self._designated_channels:
             if channel_id in self._designated_channels[guild_key]:
                 self._designated_channels[guild_key].remove(channel_id)
-                self._save_designated()
+                self._set_route(channel_id, ROUTE_DESIGNATED, False)
+                self._writer.mark_channel(CHANNEL_DESIGNATED, guild_key, channel_id, False)
                 return True
         return False
 